@@ -324,7 +324,6 @@ install_packages() {
 		tesseract-data-eng
 		ttf-jetbrains-mono-nerd
 		grimblast-git
-		python-ijson
 		glace-git
 		matugen-bin
 	)
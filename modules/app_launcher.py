@@ -1,19 +1,19 @@
-import operator
-from collections.abc import Iterator
 from contextlib import suppress
 
-from fabric.utils import DesktopApp, idle_add, logger, remove_handler
+from fabric.utils import DesktopApp
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
 from fabric.widgets.entry import Entry
-from fabric.widgets.grid import Grid
 from fabric.widgets.image import Image
 from fabric.widgets.label import Label
-from fabric.widgets.scrolledwindow import ScrolledWindow
-from gi.repository import Gdk, GLib, Gtk
+from gi.repository import Gdk, Gtk
 
+from shared.list import VirtualList
 from shared.popup import PopupWindow
 from utils.app import AppUtils
+from utils.app_search import AppSearchIndex
+from utils.icon_cache import IconCache
+from utils.image_loader import ImageLoader
 from utils.widget_settings import BarConfig
 
 
@@ -50,105 +50,61 @@ class LauncherConfig:
         self.show_tooltips = bool(self.raw_config.get("tooltip", False))
 
 
-class AppWidgetFactory:
-    """Factory for creating application widgets in different layouts."""
+class AppRow(Button):
+    """A launcher entry that is rebound to different apps as the list scrolls."""
+
+    def __init__(self, layout_mode: str, icon_size: int, config: LauncherConfig):
+        self.app: DesktopApp | None = None
+        self.icon_size = icon_size
+        self.show_tooltips = config.show_tooltips
 
-    @staticmethod
-    def create_widget(
-        app: DesktopApp, layout_mode: str, icon_size: int, config: LauncherConfig
-    ) -> Button:
-        """Create an application widget based on layout mode."""
         if layout_mode == "grid":
-            child_widget = AppWidgetFactory._create_grid_layout(app, icon_size, config)
+            self.icon_image = Image(h_align="center", name="icon")
+            self.name_label = Label(
+                v_align="center",
+                h_align="center",
+                max_width_chars=10,
+                ellipsization="end",
+            )
+            child = Box(
+                orientation="v",
+                spacing=4,
+                children=[self.icon_image, self.name_label],
+            )
         else:
-            child_widget = AppWidgetFactory._create_list_layout(app, icon_size, config)
-
-        return Button(
-            style_classes=["launcher-button"],
-            child=child_widget,
-            tooltip_text=(app.description if config.show_tooltips else None),
-        )
+            self.icon_image = Image(h_align="start", name="icon")
+            self.name_label = Label(v_align="center", h_align="center")
+            child = Box(
+                orientation="h",
+                spacing=12,
+                style_classes=["launcher-list-item"],
+                children=[self.icon_image, self.name_label],
+            )
 
-    @staticmethod
-    def _create_grid_layout(
-        app: DesktopApp, icon_size: int, config: LauncherConfig
-    ) -> Box:
-        """Create vertical layout for grid mode."""
-        return Box(
-            orientation="v",
-            spacing=4,
-            children=[
-                Image(
-                    pixbuf=app.get_icon_pixbuf(icon_size),
-                    h_align="center",
-                    name="icon",
-                ),
-                Label(
-                    label=app.display_name or "Unknown",
-                    v_align="center",
-                    h_align="center",
-                    max_width_chars=10,
-                    ellipsization="end",
-                ),
-            ],
+        super().__init__(style_classes=["launcher-button"], child=child)
+
+    def bind(self, app: DesktopApp):
+        """Show ``app`` in this row, reusing the existing child widgets."""
+        self.app = app
+        self.icon_image.clear()
+        ImageLoader().load(
+            getattr(app, "icon_name", None),
+            self.icon_size,
+            lambda pixbuf: self._on_icon_loaded(app, pixbuf),
+            owner=self,
         )
-
-    @staticmethod
-    def _create_list_layout(
-        app: DesktopApp, icon_size: int, config: LauncherConfig
-    ) -> Box:
-        """Create horizontal layout for list mode."""
-        return Box(
-            orientation="h",
-            spacing=12,
-            style_classes=["launcher-list-item"],
-            children=[
-                Image(
-                    pixbuf=app.get_icon_pixbuf(icon_size),
-                    h_align="start",
-                    name="icon",
-                ),
-                Label(
-                    label=app.display_name or "Unknown",
-                    v_align="center",
-                    h_align="center",
-                ),
-            ],
+        self.name_label.set_label(app.display_name or "Unknown")
+        self.set_tooltip_text(app.description if self.show_tooltips else None)
+
+    def _on_icon_loaded(self, app: DesktopApp, pixbuf):
+        # The row may have been rebound while the icon was decoding
+        if app is not self.app:
+            return
+        self.icon_image.set_from_pixbuf(
+            pixbuf or IconCache().get_icon("image-missing", self.icon_size)
         )
 
 
-class HandlerManager:
-    """Context manager for handling GTK handlers safely."""
-
-    def __init__(self, launcher):
-        self.launcher = launcher
-        self.old_handler = None
-
-    def __enter__(self):
-        # Remove old handler if exists and is valid
-        if self.launcher._arranger_handler and self.launcher._arranger_handler > 0:
-            # Check if the source still exists before removing
-            main_context = GLib.MainContext.default()
-            handler_id = self.launcher._arranger_handler
-            if main_context.find_source_by_id(handler_id):
-                try:
-                    remove_handler(handler_id)
-                    self.old_handler = handler_id
-                except (GLib.Error, Exception):
-                    # Handler removal failed, just continue silently
-                    pass
-        self.launcher._arranger_handler = 0
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        # Cleanup is automatic, nothing to do
-        pass
-
-    def set_new_handler(self, handler_id):
-        """Set the new handler ID."""
-        self.launcher._arranger_handler = handler_id
-
-
 class AppLauncher(PopupWindow):
     """Launcher widget for launching applications and commands."""
 
@@ -157,18 +113,10 @@ class AppLauncher(PopupWindow):
         self.config = LauncherConfig(config)
 
         # Initialize remaining instance variables
-        self._arranger_handler: int = 0
         self.app_util = AppUtils()
         self._all_apps = self.app_util.all_applications
-        self._grid_position = 0  # Track current position in grid
+        self._search_index = AppSearchIndex(self._all_apps)
 
-        # Create widgets - viewport depends on layout mode
-        if self.config.layout_mode == "grid":
-            self.viewport = Grid(
-                column_homogeneous=True, row_homogeneous=True, row_spacing=20
-            )
-        else:  # list mode
-            self.viewport = Box(spacing=2, orientation="v")
         self.search_entry = Entry(
             name="launcher-prompt",
             placeholder="Search Applications...",
@@ -189,10 +137,16 @@ class AppLauncher(PopupWindow):
         # Connect handler for icon clicks
         self.search_entry.connect("icon-press", self.on_icon_press)
 
-        self.scrolled_window = ScrolledWindow(
+        # Only the visible rows exist; they are rebound as results change
+        self.scrolled_window = VirtualList(
+            row_factory=self._make_row,
+            bind_row=lambda row, app, _: row.bind(app),
+            columns=(
+                self.config.grid_columns if self.config.layout_mode == "grid" else 1
+            ),
+            spacing=20 if self.config.layout_mode == "grid" else 2,
             min_content_size=(self.config.width, self.config.height),
             max_content_size=(self.config.width, self.config.height),
-            child=self.viewport,
         )
 
         # Enable kinetic scrolling
@@ -246,101 +200,19 @@ class AppLauncher(PopupWindow):
         if event.keyval == Gdk.KEY_Escape:
             self.close_launcher()
 
-    def _clear_viewport_safely(self):
-        """Clear viewport widgets with proper error handling."""
-        if self.config.layout_mode == "grid":
-            try:
-                children = [child for child in self.viewport]
-                for child in children:
-                    self.viewport.remove(child)
-            except (AttributeError, TypeError) as e:
-                # Log error and recreate grid as fallback
-                logger.exception(
-                    f"Warning: Grid clear failed ({e}), recreating viewport"
-                )
-                try:
-                    self.viewport = Grid(
-                        column_homogeneous=True,
-                        row_homogeneous=True,
-                    )
-                    self.scrolled_window.set_child(self.viewport)
-                except Exception as fallback_error:
-                    logger.exception(
-                        f"Error: Failed to recreate grid: {fallback_error}"
-                    )
-        else:
-            # For list layout, simple clear
-            self.viewport.children = []
-
-    def arrange_viewport(self, query: str = ""):
-        """Arrange viewport with filtered applications."""
-        with HandlerManager(self) as handler_mgr:
-            # Clear viewport safely
-            self._clear_viewport_safely()
-            self._grid_position = 0
-
-            # Simple and efficient app filtering
-            query_lower = query.casefold()
-            filtered_apps_iter = iter(
-                [
-                    app
-                    for app in self._all_apps
-                    if query_lower
-                    in (
-                        (app.display_name or "")
-                        + " "
-                        + (app.name or "")
-                        + " "
-                        + (app.generic_name or "")
-                    ).casefold()
-                ]
-            )
-            should_resize = operator.length_hint(filtered_apps_iter) == len(
-                self._all_apps
-            )
+    def _make_row(self) -> AppRow:
+        row = AppRow(self.config.layout_mode, self.config.icon_size, self.config)
+        row.connect("clicked", self._on_row_clicked)
+        return row
 
-            # Start lazy loading process
-            handler_id = idle_add(
-                lambda *args: self.add_next_application(*args)
-                or (self.resize_viewport() if should_resize else False),
-                filtered_apps_iter,
-                pin=True,
-            )
-            handler_mgr.set_new_handler(handler_id)
-
-        return False
-
-    def add_next_application(self, apps_iter: Iterator[DesktopApp]):
-        """Add the next application widget to the viewport."""
-        if not (app := next(apps_iter, None)):
-            return False
+    def _on_row_clicked(self, row: AppRow):
+        if row.app is not None:
+            row.app.launch()
+            self.close_launcher()
 
-        app_widget = AppWidgetFactory.create_widget(
-            app, self.config.layout_mode, self.config.icon_size, self.config
-        )
-        app_widget.on_clicked = lambda *_: (app.launch(), self.close_launcher())
-
-        if self.config.layout_mode == "grid":
-            row = self._grid_position // self.config.grid_columns
-            col = self._grid_position % self.config.grid_columns
-            self.viewport.attach(app_widget, col, row, 1, 1)
-            self._grid_position += 1
-        else:  # list mode
-            self.viewport.add(app_widget)
-
-        return True
-
-    def resize_viewport(self):
-        """Resize viewport to fit content."""
-        try:
-            allocation_width = self.viewport.get_allocation().width
-            if allocation_width > 0:
-                # Clear max_content_width constraint to avoid conflicts
-                self.scrolled_window.set_max_content_width(-1)
-                self.scrolled_window.set_min_content_width(allocation_width)
-        except (AttributeError, TypeError):
-            # Ignore resize errors
-            pass
+    def arrange_viewport(self, query: str = ""):
+        """Show the applications matching ``query``."""
+        self.scrolled_window.set_items(self._search_index.search(query))
         return False
 
     def toggle(self):
@@ -348,8 +220,11 @@ class AppLauncher(PopupWindow):
         if self.popup_visible:
             self.close_launcher()
         else:
-            # Refresh apps list
-            self._all_apps = self.app_util.all_applications
+            # Refresh apps list, re-indexing only when it actually changed
+            all_apps = self.app_util.all_applications
+            if all_apps is not self._all_apps:
+                self._all_apps = all_apps
+                self._search_index.rebuild(all_apps)
             self.search_entry.set_text("")
 
             # Focus search entry for filtering
@@ -1,4 +1,5 @@
 import importlib
+from typing import ClassVar
 
 from fabric import Application
 from fabric.utils import exec_shell_command_async, logger
@@ -7,7 +8,7 @@ from fabric.widgets.centerbox import CenterBox
 from fabric.widgets.eventbox import EventBox
 from fabric.widgets.revealer import Revealer
 from fabric.widgets.x11 import X11Window as Window
-from gi.repository import Gdk, GLib
+from gi.repository import GLib
 
 from utils.constants import ASSETS_DIR
 from utils.widget_settings import BarConfig
@@ -125,7 +126,10 @@ LAZY_WIDGETS_LIST = {
 class StatusBar(Window):
     """A widget to display the status bar panel."""
 
-    _monitor_util = None
+    # Bars created in multi-monitor mode, keyed by monitor plug name
+    _bars_by_monitor: ClassVar[dict[str, "StatusBar"]] = {}
+    # Monitor-less bar shown until the first output is reported
+    _fallback_bar: ClassVar["StatusBar | None"] = None
 
     def __init__(self, config: BarConfig, **kwargs):
         # Use lazy widget loading - classes are imported on first use
@@ -280,80 +284,72 @@ class StatusBar(Window):
     @staticmethod
     def create_bars(app: Application, config: BarConfig) -> list:
         multi_monitor = config.get("general", {}).get("multi_monitor", False)
-        bars = (
-            StatusBar._create_multi_monitor_bars(config)
-            if multi_monitor
-            else [StatusBar(config)]
-        )
 
-        for bar in bars:
+        if not multi_monitor:
+            bar = StatusBar(config)
             app.add_window(bar)
+            return [bar]
 
-        if multi_monitor and StatusBar._monitor_util is not None:
-            StatusBar._setup_hotplug(app, config, bars)
+        from services.monitors import MonitorService
 
-        return bars
+        monitor_service = MonitorService()
+        bars = StatusBar._bars_by_monitor
 
-    @staticmethod
-    def _create_multi_monitor_bars(config: BarConfig):
-        try:
-            from fabric.hyprland.service import HyprlandSocketNotFoundError
-        except ImportError:
-            HyprlandSocketNotFoundError = RuntimeError
+        # Wired up first, so a session that starts without outputs still
+        # gets its bars once the compositor reports them
+        monitor_service.connect(
+            "changed",
+            lambda _, diff: StatusBar._apply_monitor_diff(app, config, diff),
+        )
 
-        monitor_ids: list[int] = []
-        StatusBar._monitor_util = None
+        for info in monitor_service.monitors:
+            StatusBar._add_monitor_bar(app, config, info)
 
-        try:
-            from utils.monitors import HyprlandWithMonitors
-
-            monitor_util = HyprlandWithMonitors()
-            StatusBar._monitor_util = monitor_util
-            monitor_names = monitor_util.get_monitor_names()
-
-            for monitor_name in monitor_names:
-                monitor_id = monitor_util.get_gdk_monitor_id_from_name(monitor_name)
-                if monitor_id is not None:
-                    monitor_ids.append(monitor_id)
-        except HyprlandSocketNotFoundError as exc:
-            logger.warning("[Bar] Hyprland unavailable: %s", exc)
-        except Exception as exc:  # pragma: no cover - best-effort multi-monitor support
-            logger.warning("[Bar] Failed to initialize Hyprland monitors: %s", exc)
-
-        if not monitor_ids:
-            display = Gdk.Display.get_default()
-            if display:
-                StatusBar._monitor_util = None
-                monitor_ids = list(range(display.get_n_monitors()))
-
-        bars = [
-            StatusBar(config, monitor=monitor_id) for monitor_id in monitor_ids
-        ]
-        return bars if bars else [StatusBar(config)]
+        if not bars:
+            bar = StatusBar(config)
+            StatusBar._fallback_bar = bar
+            app.add_window(bar)
+            return [bar]
 
-    @staticmethod
-    def _setup_hotplug(app: Application, config: BarConfig, bars: list):
-        from utils.monitors import MonitorWatcher
+        return list(bars.values())
 
-        watcher = MonitorWatcher()
+    @staticmethod
+    def _add_monitor_bar(app: Application, config: BarConfig, info):
+        bar = StatusBar(config, monitor=info.index)
+        StatusBar._bars_by_monitor[info.name] = bar
+        app.add_window(bar)
+        return bar
 
-        watcher.add_callback(lambda: StatusBar._recreate_bars(app, config, bars))
-        watcher.start_watching()
+    @staticmethod
+    def _remove_monitor_bar(app: Application, name: str):
+        bar = StatusBar._bars_by_monitor.pop(name, None)
+        if bar is None:
+            return
+        try:
+            app.remove_window(bar)
+            bar.destroy()
+        except Exception:
+            logger.exception(f"[Bar] Error removing bar for monitor {name}")
 
     @staticmethod
-    def _recreate_bars(app: Application, config: BarConfig, bars: list):
-        # Remove old
-        for bar in bars:
+    def _apply_monitor_diff(app: Application, config: BarConfig, diff):
+        """Create or destroy only the bars whose monitor changed."""
+        for info in diff.removed:
+            StatusBar._remove_monitor_bar(app, info.name)
+
+        # Bars are bound to a monitor index and geometry at creation time
+        for info in diff.changed:
+            StatusBar._remove_monitor_bar(app, info.name)
+            StatusBar._add_monitor_bar(app, config, info)
+
+        for info in diff.added:
+            StatusBar._add_monitor_bar(app, config, info)
+
+        fallback = StatusBar._fallback_bar
+        if fallback is not None and StatusBar._bars_by_monitor:
+            StatusBar._fallback_bar = None
             try:
-                app.remove_window(bar)
-                bar.destroy()
+                app.remove_window(fallback)
+                fallback.destroy()
             except Exception:
-                logger.exception("Error removing old bar during hotplug handling")
-
-        # Create new
-        bars.clear()
-        new_bars = StatusBar._create_multi_monitor_bars(config)
-        bars.extend(new_bars)
-
-        for bar in bars:
-            app.add_window(bar)
+                logger.exception("[Bar] Error removing the fallback bar")
@@ -16,6 +16,7 @@ from utils.app import AppUtils
 from utils.config import widget_config
 from utils.constants import PINNED_APPS_FILE
 from utils.functions import read_json_file, write_json_file
+from utils.icon_cache import IconCache
 from utils.icon_resolver import IconResolver
 from utils.widget_settings import BarConfig
 
@@ -201,7 +202,7 @@ class AppBar(Box):
             name="pinned_app",
             tooltip_markup=app.display_name,
             image=Image(
-                pixbuf=app.get_icon_pixbuf(self.icon_size),
+                pixbuf=IconCache().get_app_icon(app, self.icon_size),
                 size=self.icon_size,
             ),
             on_clicked=lambda *_, app=app: app.launch(),
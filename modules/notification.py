@@ -1,3 +1,5 @@
+from functools import partial
+
 import gi
 from fabric.notifications import (
     Notification,
@@ -29,6 +31,8 @@ from shared.buttons import HoverButton
 from shared.circle_image import CircularImage
 from utils.colors import Colors
 from utils.icons import text_icons
+from utils.image_loader import ImageLoader
+from utils.notification_burst import COALESCE, SHOW, NotificationBurstLimiter
 from utils.widget_settings import BarConfig
 from utils.widget_utils import get_icon, nerd_font_icon
 
@@ -50,6 +54,10 @@ class NotificationPopup(Window):
 
         self.ignored_apps = helpers.unique_list(self.config.get("ignored", []))
 
+        self._server.set_pixbuf_cache_budget(
+            self.config.get("image_cache_mb", 32) * 1024 * 1024
+        )
+
         if self.config.get("play_sound", False):
             self.sound_file = f"{constants.ASSETS_DIR}/sounds/{self.config.get('sound_file', 'notification4')}.mp3"  # noqa: E501
 
@@ -60,6 +68,15 @@ class NotificationPopup(Window):
             orientation="v",
             spacing=5,
         )
+        # Visible popups by notification id, and "N more" cards by app
+        self._popups: dict[int, NotificationRevealer] = {}
+        self._group_cards: dict[str, NotificationGroupCard] = {}
+        self._limiter = NotificationBurstLimiter(
+            burst_limit=self.config.get("burst_limit", 3),
+            burst_interval_ms=self.config.get("burst_interval", 1000),
+            max_visible=self.config.get("max_visible", 5),
+        )
+
         self._server.connect("notification-added", self.on_new_notification)
 
         super().__init__(
@@ -80,7 +97,37 @@ class NotificationPopup(Window):
         if self._server.dont_disturb or notification.app_name in self.ignored_apps:
             return
 
+        # Always listed in the history; "persist" only decides the journal
+        self._server.cache_notification(
+            self.widget_config,
+            notification,
+            self.config.get("max_count", 3),
+            persist=self.config.get("persist", True),
+        )
+
+        # Sent with replaces_id: update the popup that is already shown
+        popup = self._popups.get(id)
+        if popup is not None and not popup.is_closing:
+            popup.replace(notification)
+            return
+
+        app_name = notification.app_name
+        visible = len(self._popups) + len(self._group_cards)
+        decision = self._limiter.admit(
+            app_name, visible, urgent=notification.urgency == 2
+        )
+
+        if decision == SHOW:
+            self._show_popup(id, notification)
+        elif decision == COALESCE:
+            self._coalesce(notification)
+        else:
+            logger.debug(f"[Notification] Dropped popup from {app_name}")
+
+    def _show_popup(self, id: int, notification: Notification):
         new_box = NotificationRevealer(self.config, notification)
+        self._popups[id] = new_box
+        new_box.connect("destroy", lambda *_: self._forget_popup(id, new_box))
         self.notifications.add(new_box)
         new_box.set_reveal_child(True)
         logger.info(
@@ -88,14 +135,39 @@ class NotificationPopup(Window):
             f"{Colors.OKGREEN}{notification.app_name}"
         )
 
-        if self.config.get("persist", True):
-            self._server.cache_notification(
-                self.widget_config, notification, self.config.get("max_count", 3)
-            )
-
         if self.config.get("play_sound", False):
             helpers.play_sound(self.sound_file)
 
+    def _forget_popup(self, id: int, popup: "NotificationRevealer"):
+        if self._popups.get(id) is popup:
+            del self._popups[id]
+
+    def _coalesce(self, notification: Notification):
+        app_name = notification.app_name
+        count = self._limiter.group_count(app_name)
+
+        if card := self._group_cards.get(app_name):
+            card.set_count(count)
+            return
+
+        card = NotificationGroupCard(self.config, notification, count)
+        self._group_cards[app_name] = card
+        card.connect("destroy", lambda *_: self._close_group(app_name, card))
+        self.notifications.add(card)
+        card.set_reveal_child(True)
+
+    def _close_group(self, app_name: str, card: "NotificationGroupCard"):
+        if self._group_cards.get(app_name) is not card:
+            return
+        del self._group_cards[app_name]
+        count = self._limiter.close_group(app_name)
+        stats = self._limiter.stats()
+        logger.info(
+            f"{Colors.INFO}[Notification] Coalesced {count} notifications from "
+            f"{Colors.OKGREEN}{app_name}{Colors.INFO} "
+            f"({stats['coalesced']} coalesced, {stats['dropped']} dropped in total)"
+        )
+
 
 class NotificationWidget(EventBox):
     """A widget to display a notification with swipe-to-dismiss support."""
@@ -235,20 +307,25 @@ class NotificationWidget(EventBox):
             h_align="start",
         )
 
-        # Use provided image if available
+        # Use provided image if available, scaled off the main thread
         try:
             if image_pixbuf := self._notification.image_pixbuf:
-                body_container.add(
-                    CircularImage(
-                        pixbuf=image_pixbuf.scale_simple(
-                            constants.NOTIFICATION_IMAGE_SIZE,
-                            constants.NOTIFICATION_IMAGE_SIZE,
-                            GdkPixbuf.InterpType.BILINEAR,
-                        ),
-                        h_expand=True,
-                        v_expand=True,
-                        size=constants.NOTIFICATION_IMAGE_SIZE,
+                notification_image = CircularImage(
+                    h_expand=True,
+                    v_expand=True,
+                    size=constants.NOTIFICATION_IMAGE_SIZE,
+                )
+                body_container.add(notification_image)
+                ImageLoader().submit(
+                    ("notification", image_pixbuf),
+                    partial(
+                        image_pixbuf.scale_simple,
+                        constants.NOTIFICATION_IMAGE_SIZE,
+                        constants.NOTIFICATION_IMAGE_SIZE,
+                        GdkPixbuf.InterpType.BILINEAR,
                     ),
+                    notification_image.set_image_from_pixbuf,
+                    owner=notification_image,
                 )
                 del image_pixbuf
         except GLib.GError:
@@ -452,17 +529,21 @@ class NotificationRevealer(Revealer):
     """A widget to reveal a notification with open/close animations."""
 
     def __init__(self, config: dict, notification: Notification, **kwargs):
+        self._config = config
         self.notification_box = NotificationWidget(config, notification)
         self.timeout = config.get("timeout", 3000)
         self.notification_box.progress_timeout.max_value = self.timeout
+        self._remaining = self.timeout
         self._notification = notification
         self._is_closing = False
 
+        self._container = Box(
+            style="margin: 12px;",
+            children=[self.notification_box],
+        )
+
         super().__init__(
-            child=Box(
-                style="margin: 12px;",
-                children=[self.notification_box],
-            ),
+            child=self._container,
             transition_duration=config.get("transition_duration", 200),
             transition_type=config.get("transition_type", "slide-up"),
             **kwargs,
@@ -470,20 +551,37 @@ class NotificationRevealer(Revealer):
 
         self.connect("notify::child-revealed", self.on_child_revealed)
 
-        self._notification.connect("closed", self.on_resolved)
+        self._closed_id = self._notification.connect("closed", self.on_resolved)
+
+    @property
+    def is_closing(self) -> bool:
+        return self._is_closing
+
+    def replace(self, notification: Notification):
+        """Show ``notification`` in place of the current one."""
+        self._notification.disconnect(self._closed_id)
+        self.notification_box.stop_timeout()
+        self.notification_box.destroy()
+
+        self.notification_box = NotificationWidget(self._config, notification)
+        self.notification_box.progress_timeout.max_value = self.timeout
+        self._container.add(self.notification_box)
+        self._notification = notification
+        self._closed_id = notification.connect("closed", self.on_resolved)
+        # Restart the countdown; the running repeater picks this up
+        self._remaining = self.timeout
 
     def animate_popup_timeout(self):
-        time = self.timeout
+        self._remaining = self.timeout
 
         def do_animate():
-            nonlocal time
-            self.notification_box.progress_timeout.value = time
+            self.notification_box.progress_timeout.value = self._remaining
             if not self.child_revealed:
                 return False
-            if time <= 0:
+            if self._remaining <= 0:
                 self._notification.close("expired")
                 return False
-            time -= 10
+            self._remaining -= 10
             return True
 
         invoke_repeater(10, do_animate)
@@ -508,6 +606,83 @@ class NotificationRevealer(Revealer):
         self.set_reveal_child(False)
 
 
+class NotificationGroupCard(Revealer):
+    """A card standing in for notifications that did not get their own popup."""
+
+    def __init__(self, config: dict, notification: Notification, count: int):
+        self.app_name = notification.app_name
+        self.timeout = config.get("timeout", 3000)
+        self._timeout_id = None
+
+        self.label = Label(
+            h_align="start",
+            h_expand=True,
+            style_classes=["summary"],
+            max_chars_width=30,
+        )
+        self.set_count(count)
+
+        card = Box(
+            spacing=8,
+            name="notification",
+            style_classes=["notification-group"],
+            children=[
+                get_icon(notification.app_icon),
+                self.label,
+                Button(
+                    v_align="center",
+                    style_classes=["close-button"],
+                    child=nerd_font_icon(
+                        icon=text_icons["ui"]["window_close"],
+                        props={"style_classes": ["panel-font-icon", "close-icon"]},
+                    ),
+                    on_clicked=lambda *_: self.close(),
+                ),
+            ],
+        )
+
+        super().__init__(
+            child=Box(
+                style="margin: 12px;",
+                children=[
+                    EventBox(
+                        name="notification-eventbox",
+                        size=(constants.NOTIFICATION_WIDTH, -1),
+                        child=card,
+                    )
+                ],
+            ),
+            transition_duration=config.get("transition_duration", 200),
+            transition_type=config.get("transition_type", "slide-up"),
+        )
+
+        self.connect("notify::child-revealed", self.on_child_revealed)
+
+    def set_count(self, count: int):
+        """Show the number of coalesced notifications and restart the timeout."""
+        self.label.set_label(f"{count} more from {self.app_name}")
+        self._restart_timeout()
+
+    def close(self):
+        self._stop_timeout()
+        self.set_reveal_child(False)
+        return False
+
+    def on_child_revealed(self, *_):
+        if not self.get_child_revealed():
+            self.destroy()
+
+    def _restart_timeout(self):
+        self._stop_timeout()
+        if self.timeout > 0:
+            self._timeout_id = GLib.timeout_add(self.timeout, self.close)
+
+    def _stop_timeout(self):
+        if self._timeout_id is not None:
+            remove_handler(self._timeout_id)
+            self._timeout_id = None
+
+
 class ActionButton(HoverButton):
     """A button widget to represent a notification action."""
 
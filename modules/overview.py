@@ -14,6 +14,7 @@ from gi.repository import Gdk, GdkPixbuf, Gtk
 
 from shared.popup import PopupWindow
 from utils.app import AppUtils
+from utils.icon_cache import IconCache
 from utils.icon_resolver import IconResolver
 from utils.widget_settings import BarConfig
 from utils.widget_utils import create_surface_from_widget
@@ -52,36 +53,7 @@ class HyprlandWindowButton(Button):
 
         # Enhanced icon resolution using desktop apps
         desktop_app = AppUtils().find_app(app_id)
-
-        # Get icon using improved method with fallbacks
-        icon_pixbuf = None
-        if desktop_app:
-            icon_pixbuf = desktop_app.get_icon_pixbuf(size=icon_size_main)
-
-        if not icon_pixbuf:
-            # Fallback to IconResolver
-            icon_pixbuf = self.icon_resolver.get_icon_pixbuf(app_id, icon_size_main)
-
-        if not icon_pixbuf:
-            # Additional fallbacks for common apps
-            icon_pixbuf = self.icon_resolver.get_icon_pixbuf(
-                "application-x-executable-symbolic", icon_size_main
-            )
-            if not icon_pixbuf:
-                icon_pixbuf = self.icon_resolver.get_icon_pixbuf(
-                    "image-missing", icon_size_main
-                )
-
-        # Ensure icon is scaled to the correct size
-        if icon_pixbuf and (
-            icon_pixbuf.get_width() != icon_size_main
-            or icon_pixbuf.get_height() != icon_size_main
-        ):
-            icon_pixbuf = icon_pixbuf.scale_simple(
-                icon_size_main,
-                icon_size_main,
-                GdkPixbuf.InterpType.BILINEAR,
-            )
+        icon_pixbuf = self._resolve_icon(desktop_app, icon_size_main)
 
         super().__init__(
             name="overview-client-box",
@@ -126,39 +98,34 @@ class HyprlandWindowButton(Button):
             return True
         return False
 
-    def update_image(self, image):
-        # Compute overlay icon size dynamically.
-        icon_size_overlay = int(min(self.size) * 0.5)  # adjust factor as needed
-
-        # Enhanced icon resolution for overlay
-        icon_pixbuf = None
-        if hasattr(self, "desktop_app") and self.desktop_app:
-            icon_pixbuf = self.desktop_app.get_icon_pixbuf(size=icon_size_overlay)
-
-        if not icon_pixbuf:
-            icon_pixbuf = self.icon_resolver.get_icon_pixbuf(
-                self.app_id, icon_size_overlay
-            )
-
-        if not icon_pixbuf:
-            icon_pixbuf = self.icon_resolver.get_icon_pixbuf(
-                "application-x-executable-symbolic", icon_size_overlay
-            )
-            if not icon_pixbuf:
-                icon_pixbuf = self.icon_resolver.get_icon_pixbuf(
-                    "image-missing", icon_size_overlay
-                )
+    def _resolve_icon(self, desktop_app, size: int) -> GdkPixbuf.Pixbuf | None:
+        """Load the client icon at ``size`` through the shared icon cache."""
+        icon_pixbuf = IconCache().lookup(
+            (
+                getattr(desktop_app, "icon_name", None),
+                self.icon_resolver.get_icon_name(self.app_id),
+                "application-x-executable-symbolic",
+                "image-missing",
+            ),
+            size,
+        )
 
-        # Ensure icon is scaled to the correct size
+        # File icons keep their aspect ratio, the button expects a square
         if icon_pixbuf and (
-            icon_pixbuf.get_width() != icon_size_overlay
-            or icon_pixbuf.get_height() != icon_size_overlay
+            icon_pixbuf.get_width() != size or icon_pixbuf.get_height() != size
         ):
             icon_pixbuf = icon_pixbuf.scale_simple(
-                icon_size_overlay,
-                icon_size_overlay,
-                GdkPixbuf.InterpType.BILINEAR,
+                size, size, GdkPixbuf.InterpType.BILINEAR
             )
+        return icon_pixbuf
+
+    def update_image(self, image):
+        # Compute overlay icon size dynamically.
+        icon_size_overlay = int(min(self.size) * 0.5)  # adjust factor as needed
+
+        icon_pixbuf = self._resolve_icon(
+            getattr(self, "desktop_app", None), icon_size_overlay
+        )
 
         self.set_image(
             Overlay(
@@ -8,12 +8,13 @@ from fabric.widgets.grid import Grid
 from fabric.widgets.image import Image
 from fabric.widgets.label import Label
 from fabric.widgets.scrolledwindow import ScrolledWindow
-from gi.repository import Gtk
+from gi.repository import GLib, Gtk
 
 from shared.buttons import HoverButton
 from shared.popup import PopupWindow
 from utils.constants import WALLPAPER_DIR, WALLPAPER_THUMBS_DIR
 from utils.functions import ensure_directory
+from utils.image_loader import ImageLoader
 from utils.thread import run_in_thread
 
 
@@ -64,19 +65,25 @@ class ImageButton(HoverButton):
                     (self.thumb_size, self.thumb_size), PILImage.Resampling.LANCZOS
                 )
                 img_cropped.save(self.wp_thumb_path)
-            self.set_image(
-                Image(image_file=self.wp_thumb_path, tooltip_text=self.wallpaper_name)
-            )
+            GLib.idle_add(self._load_thumbnail)
         except Exception as e:
             logger.exception(f"Error creating thumbnail: {e}")
 
     def _load_thumbnail(self):
         if os.path.exists(self.wp_thumb_path):
-            self.set_image(
-                Image(image_file=self.wp_thumb_path, tooltip_text=self.wallpaper_name)
+            ImageLoader().load(
+                self.wp_thumb_path,
+                self.thumb_size,
+                self._on_thumbnail_loaded,
+                owner=self,
             )
-            return
+            return False
         self._create_thumbnail()
+        return False
+
+    def _on_thumbnail_loaded(self, pixbuf):
+        if pixbuf is not None:
+            self.set_image(Image(pixbuf=pixbuf, tooltip_text=self.wallpaper_name))
 
 
 class WallpaperPickerBox(ScrolledWindow):
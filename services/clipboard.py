@@ -0,0 +1,274 @@
+"""In-process clipboard history service."""
+
+import shutil
+import subprocess
+import time
+from collections.abc import Callable
+from functools import partial
+
+import gi
+from fabric.core.service import Signal
+from fabric.utils import logger
+from gi.repository import Gdk, GdkPixbuf, GLib, Gtk
+
+from utils.clipboard_store import (
+    ClipboardEntry,
+    ClipboardStore,
+    parse_cliphist_listing,
+)
+from utils.constants import (
+    CLIPBOARD_HISTORY_DIR,
+    CLIPBOARD_MAX_AGE_SECONDS,
+    CLIPBOARD_MAX_BYTES,
+    CLIPBOARD_MAX_ENTRIES,
+    CLIPBOARD_MAX_ENTRY_BYTES,
+    CLIPBOARD_PREVIEW_SIZE,
+    CLIPBOARD_THUMBNAIL_CACHE_BYTES,
+    CLIPBOARD_THUMBNAIL_DIR,
+)
+from utils.image_loader import ImageLoader
+from utils.thread import thread, thread_serial
+from utils.thumbnail_cache import ThumbnailCache
+
+from .base import SingletonService
+
+gi.require_versions({"Gtk": "3.0", "Gdk": "3.0", "GdkPixbuf": "2.0"})
+
+# PRIMARY changes continuously while a selection is dragged
+_SELECTION_SETTLE_MS = 300
+
+# Set by password managers on secrets that must not be recorded
+_SENSITIVE_TARGETS = frozenset(
+    ("x-kde-passwordManagerHint", "application/x-kde-passwordManagerHint")
+)
+
+
+def _encode_png(pixbuf: GdkPixbuf.Pixbuf) -> bytes | None:
+    try:
+        success, data = pixbuf.save_to_bufferv("png", [], [])
+    except GLib.Error as e:
+        logger.warning(f"[Clipboard] Cannot encode image: {e}")
+        return None
+    return bytes(data) if success else None
+
+
+def _scale_blob(path: str, size: int) -> GdkPixbuf.Pixbuf | None:
+    try:
+        return GdkPixbuf.Pixbuf.new_from_file_at_scale(path, size, size, True)
+    except GLib.Error as e:
+        logger.warning(f"[Clipboard] Cannot load image preview: {e}")
+        return None
+
+
+def _image_preview(pixbuf: GdkPixbuf.Pixbuf) -> str:
+    return f"[Image {pixbuf.get_width()}x{pixbuf.get_height()}]"
+
+
+class ClipboardService(SingletonService):
+    """Records CLIPBOARD and PRIMARY changes into a local history.
+
+    Replaces the cliphist daemon and its per-operation subprocesses: list,
+    decode, delete and search are served from `ClipboardStore` in process.
+    Contents are written by a single background worker in order.
+    """
+
+    @Signal
+    def changed(self) -> None:
+        """Emitted after entries were added, removed or wiped."""
+
+    def __init__(self, **kwargs):
+        if hasattr(self, "_initialized"):
+            return
+        super().__init__(**kwargs)
+
+        self.store = ClipboardStore(
+            CLIPBOARD_HISTORY_DIR,
+            max_entries=CLIPBOARD_MAX_ENTRIES,
+            max_bytes=CLIPBOARD_MAX_BYTES,
+            max_age=CLIPBOARD_MAX_AGE_SECONDS,
+            run_io=thread_serial,
+        )
+        self.thumbnails = ThumbnailCache(
+            CLIPBOARD_THUMBNAIL_DIR, CLIPBOARD_THUMBNAIL_CACHE_BYTES
+        )
+        self._settle_ids: dict[Gdk.Atom, int] = {}
+        self._clipboards = {
+            selection: Gtk.Clipboard.get(selection)
+            for selection in (Gdk.SELECTION_CLIPBOARD, Gdk.SELECTION_PRIMARY)
+        }
+        for selection, clipboard in self._clipboards.items():
+            clipboard.connect("owner-change", self._on_owner_change, selection)
+
+        if self.store.is_new and shutil.which("cliphist"):
+            self.import_cliphist()
+
+    @property
+    def entries(self) -> list[ClipboardEntry]:
+        """History entries, newest first."""
+        return self.store.entries
+
+    def decode(self, entry_id: int) -> bytes | None:
+        return self.store.read(entry_id)
+
+    def search(self, query: str) -> list[ClipboardEntry]:
+        return self.store.search(query)
+
+    def delete(self, entry_id: int):
+        entry = self.store.get(entry_id)
+        if entry is None:
+            return
+        self.store.delete(entry_id)
+        if entry.kind == "image":
+            thread_serial(self.thumbnails.remove, entry.digest)
+        self.emit("changed")
+
+    def wipe(self):
+        self.store.wipe()
+        thread_serial(self.thumbnails.clear)
+        self.emit("changed")
+
+    def thumbnail(
+        self,
+        entry: ClipboardEntry,
+        callback: Callable[[GdkPixbuf.Pixbuf | None], None],
+        owner: Gtk.Widget | None = None,
+    ):
+        """Deliver the preview of an image entry, scaling it only once.
+
+        Previews are kept on disk by content hash, so reopening the menu or
+        copying the same image again reuses the file.
+        """
+        path = self.thumbnails.lookup(entry.digest)
+        if path is not None:
+            thread(self.thumbnails.touch, entry.digest)
+            ImageLoader().load(path, CLIPBOARD_PREVIEW_SIZE, callback, owner)
+            return
+
+        ImageLoader().submit(
+            ("clipboard-thumbnail", entry.digest),
+            partial(self._make_thumbnail, entry),
+            callback,
+            owner,
+        )
+
+    def _make_thumbnail(self, entry: ClipboardEntry) -> GdkPixbuf.Pixbuf | None:
+        pixbuf = _scale_blob(self.store.blob_path(entry), CLIPBOARD_PREVIEW_SIZE)
+        if pixbuf is not None:
+            data = _encode_png(pixbuf)
+            if data is not None:
+                self.thumbnails.put(entry.digest, data)
+        return pixbuf
+
+    def copy(self, entry_id: int) -> bool:
+        """Put an entry back on the clipboard."""
+        entry = self.store.get(entry_id)
+        data = self.store.read(entry_id)
+        if entry is None or data is None:
+            return False
+
+        clipboard = self._clipboards[Gdk.SELECTION_CLIPBOARD]
+        if entry.kind == "image":
+            loader = GdkPixbuf.PixbufLoader()
+            try:
+                loader.write(data)
+                loader.close()
+            except GLib.Error as e:
+                logger.warning(f"[Clipboard] Cannot decode entry {entry_id}: {e}")
+                return False
+            clipboard.set_image(loader.get_pixbuf())
+        else:
+            clipboard.set_text(data.decode("utf-8", errors="replace"), -1)
+        clipboard.store()
+        return True
+
+    def add_text(self, text: str, created: float | None = None):
+        data = text.encode("utf-8")
+        if not text.strip() or len(data) > CLIPBOARD_MAX_ENTRY_BYTES:
+            return
+        self.store.add(data, "text", text, created)
+        self.emit("changed")
+
+    def add_image(self, data: bytes, preview: str, created: float | None = None):
+        if len(data) > CLIPBOARD_MAX_ENTRY_BYTES:
+            return
+        self.store.add(data, "image", preview, created)
+        self.emit("changed")
+
+    def _on_owner_change(self, clipboard, _event, selection):
+        if selection in self._settle_ids:
+            GLib.source_remove(self._settle_ids.pop(selection))
+        delay = _SELECTION_SETTLE_MS if selection == Gdk.SELECTION_PRIMARY else 0
+        self._settle_ids[selection] = GLib.timeout_add(
+            delay, self._read_clipboard, clipboard, selection
+        )
+
+    def _read_clipboard(self, clipboard, selection):
+        self._settle_ids.pop(selection, None)
+        clipboard.request_targets(self._on_targets, selection)
+        return False
+
+    def _on_targets(self, clipboard, targets, n_targets, selection=None):
+        # Older PyGObject passes no n_targets, shifting the user data
+        if selection is None:
+            selection, n_targets = n_targets, len(targets or ())
+        if not targets:
+            return
+        if any(target.name() in _SENSITIVE_TARGETS for target in targets):
+            return
+
+        if selection == Gdk.SELECTION_CLIPBOARD and Gtk.targets_include_image(
+            targets, False
+        ):
+            clipboard.request_image(self._on_image)
+        elif Gtk.targets_include_text(targets):
+            clipboard.request_text(self._on_text)
+
+    def _on_text(self, _clipboard, text):
+        if text:
+            self.add_text(text)
+
+    def _on_image(self, _clipboard, pixbuf):
+        if pixbuf is None:
+            return
+        preview = _image_preview(pixbuf)
+        created = time.time()
+
+        def encode():
+            data = _encode_png(pixbuf)
+            if data is not None:
+                GLib.idle_add(self.add_image, data, preview, created)
+
+        thread(encode)
+
+    def import_cliphist(self):
+        """Copy an existing cliphist database into the history, oldest first."""
+
+        def run():
+            try:
+                listing = subprocess.run(
+                    ["cliphist", "list"], capture_output=True, check=True
+                ).stdout.decode("utf-8", errors="replace")
+            except (OSError, subprocess.CalledProcessError) as e:
+                logger.warning(f"[Clipboard] cliphist import failed: {e}")
+                return
+
+            pairs = parse_cliphist_listing(listing)
+            now = time.time()
+            for index, (entry_id, preview) in enumerate(pairs):
+                try:
+                    data = subprocess.run(
+                        ["cliphist", "decode", entry_id],
+                        capture_output=True,
+                        check=True,
+                    ).stdout
+                except (OSError, subprocess.CalledProcessError):
+                    continue
+                created = now - (len(pairs) - index)
+                if preview.startswith("[[ binary data"):
+                    GLib.idle_add(self.add_image, data, "[Image]", created)
+                else:
+                    text = data.decode("utf-8", errors="replace")
+                    GLib.idle_add(self.add_text, text, created)
+            logger.info(f"[Clipboard] Imported {len(pairs)} cliphist entries")
+
+        thread(run)
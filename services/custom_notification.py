@@ -1,6 +1,5 @@
-import math
-import os
 import threading
+from collections import OrderedDict
 
 from fabric import Signal
 from fabric.notifications import Notification, Notifications, NotificationSerializedData
@@ -10,9 +9,28 @@ from gi.repository import GdkPixbuf, GLib
 from utils.colors import Colors
 from utils.constants import (
     NOTIFICATION_CACHE_FILE,
+    NOTIFICATION_IMAGE_DIR,
     NOTIFICATION_IMAGE_SIZE,
+    NOTIFICATION_JOURNAL_FILE,
+    NOTIFICATION_PIXBUF_CACHE_BYTES,
+    NOTIFICATION_WRITE_DELAY_MS,
 )
-from utils.functions import read_json_file, write_json_file
+from utils.notification_images import NotificationImageStore
+from utils.notification_journal import NotificationJournal
+from utils.notification_store import NotificationRecord, NotificationStore
+from utils.pixbuf_cache import PixbufCache
+from utils.thread import thread_serial
+
+# Bumped when the stored record layout changes; older records are re-validated
+NOTIFICATION_SCHEMA_VERSION = 1
+_SCHEMA_KEY = "schema"
+
+# Deserialized notifications kept alive for rows being shown
+_LIVE_CACHE_SIZE = 64
+
+
+def _scale_pixbuf(pixbuf: GdkPixbuf.Pixbuf, size: int) -> GdkPixbuf.Pixbuf | None:
+    return pixbuf.scale_simple(size, size, GdkPixbuf.InterpType.BILINEAR)
 
 
 class CustomNotifications(Notifications):
@@ -36,7 +54,7 @@ class CustomNotifications(Notifications):
     @property
     def count(self) -> int:
         """Return the count of notifications."""
-        return len(self.all_notifications)
+        return len(self._store)
 
     @property
     def dont_disturb(self) -> bool:
@@ -52,95 +70,80 @@ class CustomNotifications(Notifications):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._lock = threading.Lock()
-        self.all_notifications = []
+        self._store = NotificationStore()
         self._count = 0  # Will be updated to highest ID when loading
-        self.deserialized_notifications = []
+        self._live: OrderedDict[int, Notification] = OrderedDict()
+        # Ids shown in the history for this session only, never journaled
+        self._transient: set[int] = set()
         self._dont_disturb = False
-        # Cache for pre-scaled pixbufs: {notification_id: {size: GdkPixbuf.Pixbuf}}
-        self._pixbuf_cache: dict[int, dict[int, GdkPixbuf.Pixbuf]] = {}
+        # Scaled notification images, evicted least recently used first
+        self._pixbuf_cache = PixbufCache(
+            NOTIFICATION_PIXBUF_CACHE_BYTES, scale=_scale_pixbuf
+        )
+        # Image payloads live in shared files, records only reference them
+        self._images = NotificationImageStore(
+            NOTIFICATION_IMAGE_DIR, run_io=thread_serial
+        )
+        self._journal = NotificationJournal(
+            NOTIFICATION_JOURNAL_FILE,
+            snapshot=lambda: (self._persisted_data(), self._count),
+            legacy_path=NOTIFICATION_CACHE_FILE,
+            debounce_ms=NOTIFICATION_WRITE_DELAY_MS,
+            schedule=GLib.timeout_add,
+            run_io=thread_serial,
+        )
         self._load_notifications()
 
     def _load_notifications(self):
-        """Read and validate notifications from the cache file."""
-        if not os.path.exists(NOTIFICATION_CACHE_FILE):
-            return
-
-        try:
-            original_data = read_json_file(NOTIFICATION_CACHE_FILE)
-
-            if original_data is None:
-                logger.info(f"{Colors.INFO}[Notification] Cache file is empty.")
-                return
-
-            original_data.reverse()
-
-            valid_notifications = []
-            highest_id = self._count
-
-            for notification in original_data:
+        """Replay and validate notifications from the journal."""
+        records, last_id = self._journal.load()
+        if not records:
+            logger.info(f"{Colors.INFO}[Notification] Cache file is empty.")
+
+        changed = False
+        for data in records:
+            notification = self._images.extract(data)
+            changed = changed or notification is not data
+            if notification.get(_SCHEMA_KEY) != NOTIFICATION_SCHEMA_VERSION:
                 try:
-                    self._deserialize_notification(notification)
-                    valid_notifications.append(notification)
-                    highest_id = max(highest_id, notification.get("id", 0))
+                    self._deserialize_notification(notification, with_image=False)
                 except Exception as e:
                     msg = f"[Notification] Invalid: {str(e)[:50]}"
                     logger.exception(f"{Colors.INFO}{msg}")
+                    self._images.release(notification)
+                    self._journal.remove(notification["id"])
+                    continue
+                notification[_SCHEMA_KEY] = NOTIFICATION_SCHEMA_VERSION
+                changed = True
+            # Validated when it was stored; the journal replays in id order
+            self._store.add(NotificationRecord(notification))
 
-            # Write only if the validated data differs from what was originally loaded
-            if valid_notifications != original_data:
-                write_json_file(NOTIFICATION_CACHE_FILE, valid_notifications)
-                logger.info(
-                    f"{Colors.INFO}[Notification] Notifications written successfully."
-                )
+        self._count = max(self._count, last_id)
 
-            self.all_notifications = valid_notifications
-            self._count = highest_id
-
-            del valid_notifications
-            del original_data
-
-        except (KeyError, ValueError, IndexError) as e:
-            logger.exception(f"{Colors.INFO}[Notification] {e}")
+        if changed:
+            # Persist extracted images and validation stamps
+            self._journal.compact()
+        self._images.collect_garbage()
 
     def remove_notification(self, id: int):
         """Remove a notification by ID, ensuring thread safety."""
         with self._lock:
-            item = next((p for p in self.all_notifications if p["id"] == id), None)
-            if item:
-                self.all_notifications.remove(item)
-                # Clean up cached pixbuf for this notification
-                self._pixbuf_cache.pop(id, None)
-                self._persist_and_emit()
-
-                if len(self.all_notifications) == 0:
+            if record := self._store.remove(id):
+                self._forget(record)
+                self._emit_count()
+
+                if len(self._store) == 0:
                     self.emit("clear_all", True)
 
+    def set_pixbuf_cache_budget(self, max_bytes: int):
+        """Set the byte budget of the image cache, evicting to fit it."""
+        self._pixbuf_cache.max_bytes = max_bytes
+
     def get_cached_pixbuf(
         self, notification_id: int, size: int | None = None
     ) -> GdkPixbuf.Pixbuf | None:
-        """Get a cached pixbuf for a notification, optionally at a specific size."""
-        if notification_id not in self._pixbuf_cache:
-            return None
-
-        cache = self._pixbuf_cache[notification_id]
-        size = size or NOTIFICATION_IMAGE_SIZE
-
-        # Return exact size if cached
-        if size in cache:
-            return cache[size]
-
-        # Scale from largest available cached size
-        if cache:
-            largest_size = max(cache.keys())
-            source_pixbuf = cache[largest_size]
-            scaled = source_pixbuf.scale_simple(
-                size, size, GdkPixbuf.InterpType.BILINEAR
-            )
-            if scaled:
-                cache[size] = scaled
-            return scaled
-
-        return None
+        """Get a cached pixbuf for a notification, scaled to ``size`` if needed."""
+        return self._pixbuf_cache.get(notification_id, size or NOTIFICATION_IMAGE_SIZE)
 
     def cache_pixbuf(
         self,
@@ -149,130 +152,105 @@ class CustomNotifications(Notifications):
         size: int | None = None,
     ) -> None:
         """Cache a pixbuf for a notification."""
-        size = size or NOTIFICATION_IMAGE_SIZE
-        if notification_id not in self._pixbuf_cache:
-            self._pixbuf_cache[notification_id] = {}
-        self._pixbuf_cache[notification_id][size] = pixbuf
+        self._pixbuf_cache.put(notification_id, size or NOTIFICATION_IMAGE_SIZE, pixbuf)
 
     def cache_pixbuf_from_notification(
         self, notification_id: int, notification: Notification
     ) -> None:
-        """Cache a notification's image pixbuf at common sizes."""
+        """Cache a notification's image at the base size; others derive from it."""
         try:
             if pixbuf := notification.image_pixbuf:
-                # Cache at the base size
-                base_size = NOTIFICATION_IMAGE_SIZE
-                scaled = pixbuf.scale_simple(
-                    base_size, base_size, GdkPixbuf.InterpType.BILINEAR
-                )
+                scaled = _scale_pixbuf(pixbuf, NOTIFICATION_IMAGE_SIZE)
                 if scaled:
-                    self.cache_pixbuf(notification_id, scaled, base_size)
-
-                # Also cache smaller size used in date menu (75% of base)
-                smaller_size = math.ceil(0.75 * base_size)
-                scaled_small = pixbuf.scale_simple(
-                    smaller_size, smaller_size, GdkPixbuf.InterpType.BILINEAR
-                )
-                if scaled_small:
-                    self.cache_pixbuf(notification_id, scaled_small, smaller_size)
+                    self.cache_pixbuf(notification_id, scaled)
         except GLib.GError:
             logger.debug(f"[Notification] Could not cache pixbuf for {notification_id}")
 
-    def cache_notification(self, widget_config, data: Notification, max_count: int):
-        """Cache a notification, ensuring thread safety."""
+    def cache_notification(
+        self,
+        widget_config,
+        data: Notification,
+        max_count: int,
+        persist: bool = True,
+    ):
+        """Cache a notification, writing it to the journal if ``persist``."""
         with self._lock:
-            self._cleanup_invalid_notifications()
-            new_notification = self._create_serialized_notification(data)
+            new_notification = self._create_serialized_notification(data, persist)
             notification_id = new_notification["id"]
 
             # Cache the pixbuf before the notification object is potentially GC'd
             self.cache_pixbuf_from_notification(notification_id, data)
 
-            self._enforce_per_app_limit(widget_config, new_notification, max_count)
-            self.all_notifications.append(new_notification)
+            record = NotificationRecord(new_notification)
+            self._enforce_per_app_limit(widget_config, record.app_name, max_count)
+            self._store.add(record)
+            if persist:
+                self._journal.add(new_notification)
+            else:
+                self._transient.add(notification_id)
             self._enforce_global_limit(max_count)
-            self._persist_and_emit()
-
-    def _cleanup_invalid_notifications(self):
-        """Remove any invalid notifications."""
-
-        valid_notifications = []
-        invalid_count = 0
-
-        for notification in self.all_notifications:
-            try:
-                self._deserialize_notification(notification)
-                valid_notifications.append(notification)
-            except Exception as e:
-                msg = f"[Notification] Removing invalid: {str(e)[:50]}"
-                logger.exception(msg)
-                invalid_id = notification.get("id", 0)
-                self.emit("notification-closed", invalid_id, "dismissed-by-limit")
-                invalid_count += 1
-
-        if invalid_count > 0:
-            self.all_notifications = valid_notifications
-            self._persist_and_emit()
-            del valid_notifications
-            logger.info(
-                f"{Colors.INFO}[Notification] Cleaned "
-                f"{invalid_count} invalid notifications"
-            )
-
-    def _create_serialized_notification(self, data: Notification) -> dict:
+            self._emit_count()
+
+    def _create_serialized_notification(
+        self, data: Notification, persist: bool = True
+    ) -> dict:
         """Generate a new notification with a unique ID."""
         self._count += 1
         serialized = data.serialize()
+        # Serialized from a live notification, so valid by construction
         serialized.update(
             {
                 "id": self._count,
                 "app_name": data.app_name,
+                _SCHEMA_KEY: NOTIFICATION_SCHEMA_VERSION,
             }
         )
-        return serialized
+        # Session-only notifications keep their image inline, in memory
+        return self._images.extract(serialized) if persist else serialized
+
+    def _persisted_data(self) -> list[NotificationSerializedData]:
+        return [
+            record.data
+            for record in self._store
+            if record.id not in self._transient
+        ]
 
     def _enforce_global_limit(self, max_count: int):
         """Remove oldest notifications if total count exceeds global limit."""
-        while len(self.all_notifications) > max_count:
-            oldest = self.all_notifications.pop(0)
-            oldest_id = oldest["id"]
-            # Clean up cached pixbuf
-            self._pixbuf_cache.pop(oldest_id, None)
-            self.emit("notification-closed", oldest_id, "dismissed-by-limit")
-
-    def _enforce_per_app_limit(
-        self, widget_config, new_notification: dict, max_count: int
-    ):
-        """Ensure per-app limits are respected."""
-        app_name = new_notification["app_name"]
+        for oldest in self._store.trim(max_count):
+            self._forget(oldest)
+            self.emit("notification-closed", oldest.id, "dismissed-by-limit")
+
+    def _enforce_per_app_limit(self, widget_config, app_name: str, max_count: int):
+        """Make room for one more notification of ``app_name``."""
         per_app_limits = widget_config.get("notification", {}).get("per_app_limits", {})
         app_limit = per_app_limits.get(app_name, max_count)
 
-        app_notifications = [
-            n for n in self.all_notifications if n["app_name"] == app_name
-        ]
+        for old in self._store.trim_app(app_name, max(app_limit - 1, 0)):
+            self._forget(old)
+            self.emit("notification-closed", old.id, "dismissed-by-limit")
 
-        if len(app_notifications) >= app_limit:
-            app_notifications.sort(key=lambda x: x["id"])  # Oldest first
-            to_remove = len(app_notifications) - app_limit + 1
-            for old in app_notifications[:to_remove]:
-                self.all_notifications.remove(old)
-                old_id = old["id"]
-                # Clean up cached pixbuf
-                self._pixbuf_cache.pop(old_id, None)
-                self.emit("notification-closed", old_id, "dismissed-by-limit")
-
-    def _deserialize_notification(self, notification: NotificationSerializedData):
-        """Deserialize a notification."""
+    def _forget(self, record: NotificationRecord):
+        """Drop everything kept for a removed record."""
+        self._pixbuf_cache.discard(record.id)
+        self._live.pop(record.id, None)
+        if record.id in self._transient:
+            self._transient.discard(record.id)
+            return
+        self._images.release(record.data)
+        self._journal.remove(record.id)
+
+    def _deserialize_notification(
+        self, notification: NotificationSerializedData, with_image: bool = True
+    ):
+        """Deserialize a notification, loading its stored image if asked to."""
+        if with_image:
+            notification = self._images.restore(notification)
         return Notification.deserialize(notification)
 
-    def _persist_and_emit(self):
-        """Persist notifications and emit relevant signals."""
-        write_json_file(
-            NOTIFICATION_CACHE_FILE,
-            self.all_notifications,
-        )
-        self.emit("notification_count", len(self.all_notifications))
+    def _emit_count(self):
+        """Emit the notification count; the journal persists on its own."""
+        self.emit("notification_count", len(self._store))
 
     def clear_all_notifications(self):
         """Empty the notifications."""
@@ -281,48 +259,45 @@ class CustomNotifications(Notifications):
         # Clear notifications but preserve the highest ID we've seen
         highest_id = self._count
 
-        self.all_notifications = []
+        self._store.clear()
         # Clear all cached pixbufs
         self._pixbuf_cache.clear()
+        self._live.clear()
+        self._transient.clear()
+        self._images.release_all()
 
-        self._persist_and_emit()
-
-        logger.info(f"{Colors.INFO}[Notification] Notifications written successfully.")
+        self._journal.clear(highest_id)
+        self._emit_count()
 
         self.emit("clear_all", True)
 
         # Restore the ID counter so new notifications get unique IDs
         self._count = highest_id
 
-    def deserialize_with_id(self, notification):
-        """Helper to deserialize and return result with ID."""
+    def get_records(self) -> list[NotificationRecord]:
+        """Return the stored notification records, newest first."""
+        return self._store.newest_first()
+
+    def get_notification(self, record: NotificationRecord) -> Notification | None:
+        """Return the live notification for a stored record.
+
+        Records are only deserialized once they are shown, and the most
+        recently shown ones are kept. A record that fails is removed.
+        """
+        notification_id = record.id
+        if (notification := self._live.get(notification_id)) is not None:
+            self._live.move_to_end(notification_id)
+            return notification
+
         try:
-            return (self._deserialize_notification(notification), None)
+            notification = self._deserialize_notification(record.data)
         except Exception as e:
             msg = f"[Notification] Deserialize failed: {str(e)[:50]}"
             logger.exception(f"{Colors.INFO}{msg}")
-            return (None, notification.get("id"))
-
-    def get_deserialized(self) -> list[Notification]:
-        """Return the notifications."""
-
-        # Process all notifications at once
-        results = [
-            self.deserialize_with_id(notification)
-            for notification in self.all_notifications
-        ]
-
-        # Split into successful and failed
-        deserialized = []
-        invalid_ids = []
-        for result, error_id in results:
-            if result is not None:
-                deserialized.append(result)
-            elif error_id is not None:
-                invalid_ids.append(error_id)
-
-        # Clean up invalid notifications
-        for invalid_id in invalid_ids:
-            self.remove_notification(invalid_id)
+            self.remove_notification(notification_id)
+            return None
 
-        return deserialized
+        self._live[notification_id] = notification
+        if len(self._live) > _LIVE_CACHE_SIZE:
+            self._live.popitem(last=False)
+        return notification
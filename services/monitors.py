@@ -0,0 +1,95 @@
+"""Monitor layout service backed by Gdk (RandR on X11)."""
+
+from typing import Any
+
+import gi
+from fabric.core.service import Signal
+from fabric.utils import logger
+from gi.repository import Gdk, GLib
+
+from utils.constants import MONITOR_HOTPLUG_DELAY_MS
+from utils.monitor_layout import MonitorInfo, diff_monitors
+
+from .base import SingletonService
+
+gi.require_version("Gdk", "3.0")
+
+
+class MonitorService(SingletonService):
+    """Caches the monitor layout and reports hotplug changes as a diff.
+
+    The layout is read once from Gdk (which tracks RandR on X11) and only
+    re-read when the screen or display signals a change. Bursts of RandR
+    events are coalesced into a single refresh.
+    """
+
+    @Signal
+    def changed(self, diff: object) -> None:
+        """Emitted with a `MonitorDiff` when the layout actually changes."""
+
+    def __init__(self, **kwargs):
+        if hasattr(self, "_initialized"):
+            return
+        super().__init__(**kwargs)
+
+        self._display: Gdk.Display | None = Gdk.Display.get_default()
+        self._monitors: dict[str, MonitorInfo] = self._read_monitors()
+        self._refresh_id: int | None = None
+
+        if self._display is None:
+            logger.warning("[Monitors] No default display; hotplug disabled.")
+            return
+
+        self._display.connect("monitor-added", self._schedule_refresh)
+        self._display.connect("monitor-removed", self._schedule_refresh)
+        self._display.get_default_screen().connect(
+            "monitors-changed", self._schedule_refresh
+        )
+
+    @property
+    def monitors(self) -> list[MonitorInfo]:
+        """Cached monitors ordered by Gdk index."""
+        return sorted(self._monitors.values(), key=lambda info: info.index)
+
+    def get_monitor(self, name: str) -> MonitorInfo | None:
+        return self._monitors.get(name)
+
+    def _read_monitors(self) -> dict[str, MonitorInfo]:
+        if self._display is None:
+            return {}
+
+        screen = self._display.get_default_screen()
+        monitors = {}
+        for index in range(self._display.get_n_monitors()):
+            monitor = self._display.get_monitor(index)
+            if monitor is None:
+                continue
+            geometry = monitor.get_geometry()
+            name = screen.get_monitor_plug_name(index) or f"monitor-{index}"
+            monitors[name] = MonitorInfo(
+                index=index,
+                name=name,
+                model=monitor.get_model() or "",
+                x=geometry.x,
+                y=geometry.y,
+                width=geometry.width,
+                height=geometry.height,
+                scale=monitor.get_scale_factor(),
+            )
+        return monitors
+
+    def _schedule_refresh(self, *_: Any) -> None:
+        if self._refresh_id is not None:
+            GLib.source_remove(self._refresh_id)
+        self._refresh_id = GLib.timeout_add(MONITOR_HOTPLUG_DELAY_MS, self._refresh)
+
+    def _refresh(self) -> bool:
+        self._refresh_id = None
+        monitors = self._read_monitors()
+        diff = diff_monitors(self._monitors, monitors)
+        self._monitors = monitors
+
+        if diff:
+            logger.info(f"[Monitors] Layout changed: {diff}")
+            self.emit("changed", diff)
+        return False
@@ -9,6 +9,7 @@ from fabric.utils import bulk_connect, logger
 from gi.repository import GLib
 
 from utils.exceptions import PlayerctlImportError
+from utils.property_snapshot import PropertySnapshot
 
 try:
     gi.require_version("Playerctl", "2.0")
@@ -17,6 +18,22 @@ except ValueError:
     raise PlayerctlImportError()
 
 
+# Re-read on every metadata change, and notified only when their value differs
+_TRACKED_PROPERTIES = (
+    "metadata",
+    "title",
+    "artist",
+    "album",
+    "arturl",
+    "length",
+    "can-seek",
+    "can-pause",
+    "can-shuffle",
+    "can-go-next",
+    "can-go-previous",
+)
+
+
 class MprisPlayer(Service):
     """A service to manage a mpris player."""
 
@@ -24,7 +41,11 @@ class MprisPlayer(Service):
     def exit(self, value: bool) -> bool: ...
 
     @Signal
-    def changed(self) -> None: ...
+    def changed(self, props: object) -> None:
+        """Emitted once per update with the frozenset of changed property names."""
+
+    @Signal
+    def seeked(self, position: object) -> None: ...
 
     def __init__(
         self,
@@ -33,6 +54,8 @@ class MprisPlayer(Service):
     ):
         self._signal_connectors: dict = {}
         self._player: Playerctl.Player = player
+        self._snapshot = PropertySnapshot(_TRACKED_PROPERTIES)
+        self._status_pending = False
         super().__init__(**kwargs)
         for sn in ["playback-status", "loop-status", "shuffle"]:
             self._signal_connectors[sn] = self._player.connect(
@@ -44,39 +67,45 @@ class MprisPlayer(Service):
             "exit",
             self.on_player_exit,
         )
+        # Positions are microseconds, too large for an int signal argument
+        self._signal_connectors["seeked"] = self._player.connect(
+            "seeked",
+            lambda _, position: self.emit("seeked", position),
+        )
         self._signal_connectors["metadata"] = self._player.connect(
             "metadata",
             lambda *_: self.update_status(),
         )
         GLib.idle_add(self.update_status_once)
 
-    def _notify_property(self, prop):
-        if self.get_property(prop) is not None:
-            self.notifier(prop)
-
     def update_status(self):
-        # schedule each notifier asynchronously.
+        # Players often send several metadata updates in a row; read once
+        if not self._status_pending:
+            self._status_pending = True
+            GLib.idle_add(self._flush_status, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def _flush_status(self):
+        """Read the tracked properties in one pass and notify what changed."""
+        self._status_pending = False
+        if not hasattr(self, "_player"):
+            # The player exited meanwhile
+            return False
 
-        for prop in [
-            "metadata",
-            "title",
-            "artist",
-            "arturl",
-            "length",
-        ]:
-            GLib.idle_add(lambda p=prop: (self._notify_property(p), False))
-        for prop in [
-            "can-seek",
-            "can-pause",
-            "can-shuffle",
-            "can-go-next",
-            "can-go-previous",
-        ]:
-            GLib.idle_add(lambda p=prop: (self.notifier(p), False))
+        changed = self._snapshot.update(self.get_property)
+        if changed:
+            self._emit_changed(changed)
+        return False
+
+    def _emit_changed(self, names):
+        names = frozenset(names)
+        # Handlers run after every property of the batch is notified
+        with self.freeze_notify():
+            for name in names:
+                self.notify(name)
+        self.emit("changed", names)
 
     def _notify_all(self):
-        for prop in self.list_properties():  # type: ignore
-            self.notifier(prop.name)
+        self._emit_changed(prop.name for prop in self.list_properties())  # type: ignore
         return False
 
     def update_status_once(self):
@@ -85,8 +114,7 @@ class MprisPlayer(Service):
         GLib.idle_add(self._notify_all, priority=GLib.PRIORITY_DEFAULT_IDLE)
 
     def _notify_and_emit(self, name):
-        self.notify(name)
-        self.emit("changed")
+        self._emit_changed((name,))
         return False
 
     def notifier(self, name: str, args=None):
@@ -0,0 +1,87 @@
+"""Shared data models for widgets that appear once per monitor.
+
+With ``multi_monitor`` enabled every bar builds its own copy of each widget.
+A `WidgetModel` owns the polling and formatting for one widget type and
+parameter set, and the per-monitor widgets only bind to it, so the cost of a
+widget does not grow with the number of monitors.
+"""
+
+import json
+from typing import Any, Callable, ClassVar
+
+from fabric import Service
+from fabric.core.service import Signal
+from gi.repository import Gtk
+
+_UNSET = object()
+
+
+def _freeze(params: dict) -> str:
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+class WidgetModel(Service):
+    """Base class for a polled value shared between several views.
+
+    Subclasses implement `start` and `stop` to manage their poll source and
+    call `update` with the freshly computed value. Polling only runs while at
+    least one view is bound.
+    """
+
+    _registry: ClassVar[dict[tuple[type, str], "WidgetModel"]] = {}
+
+    @Signal
+    def changed(self, value: object) -> None:
+        """Emitted with the new value after every update."""
+
+    @classmethod
+    def get(cls, **params):
+        """Return the model shared by every view with the same parameters."""
+        key = (cls, _freeze(params))
+        model = WidgetModel._registry.get(key)
+        if model is None:
+            model = cls(**params)
+            WidgetModel._registry[key] = model
+        return model
+
+    def __init__(self, **kwargs):
+        super().__init__()
+        self.value: Any = _UNSET
+        self._view_count = 0
+
+    @property
+    def has_value(self) -> bool:
+        return self.value is not _UNSET
+
+    def bind(self, view: Gtk.Widget, callback: Callable[[Any], Any]) -> int:
+        """Deliver updates to ``callback`` until ``view`` is destroyed.
+
+        The current value, if any, is replayed immediately so late views
+        (e.g. a bar created on hotplug) render without waiting for a poll.
+        """
+        handler_id = self.connect("changed", lambda _, value: callback(value))
+        view.connect("destroy", lambda *_: self._unbind(handler_id))
+
+        self._view_count += 1
+        if self._view_count == 1:
+            self.start()
+
+        if self.has_value:
+            callback(self.value)
+        return handler_id
+
+    def _unbind(self, handler_id: int):
+        self.disconnect(handler_id)
+        self._view_count -= 1
+        if self._view_count == 0:
+            self.stop()
+
+    def update(self, value: Any):
+        self.value = value
+        self.emit("changed", value)
+
+    def start(self):
+        """Begin polling; called when the first view binds."""
+
+    def stop(self):
+        """Stop polling; called when the last view is destroyed."""
@@ -1,7 +1,8 @@
-from fabric.utils import invoke_repeater
 from fabric.widgets.label import Label
+from gi.repository import GLib
 
 import utils.functions as helpers
+from services.widget_model import WidgetModel
 from utils.widget_utils import (
     nerd_font_icon,
 )
@@ -9,6 +10,31 @@ from utils.widget_utils import (
 from .widget_container import ButtonWidget
 
 
+class ProcessStateModel(WidgetModel):
+    """Polls whether a command is running, once for every bar."""
+
+    def __init__(self, command: str, interval: int = 1000, **kwargs):
+        super().__init__(**kwargs)
+        self.command = command
+        self.interval = interval
+        self._source_id = None
+
+    def start(self):
+        self.refresh()
+        self._source_id = GLib.timeout_add(self.interval, self.refresh)
+
+    def stop(self):
+        if self._source_id is not None:
+            GLib.source_remove(self._source_id)
+            self._source_id = None
+
+    def refresh(self, *_):
+        is_running = helpers.is_app_running(self.command)
+        if is_running != self.value:
+            self.update(is_running)
+        return True
+
+
 class CommandSwitcher(ButtonWidget):
     """A button widget to toggle a command.
     Useful for making services with two states."""
@@ -22,6 +48,7 @@ class CommandSwitcher(ButtonWidget):
         label=True,
         args="",
         tooltip=True,
+        interval=1000,
         style_classes=[""],
         **kwargs,
     ):
@@ -60,9 +87,9 @@ class CommandSwitcher(ButtonWidget):
 
         self.connect("clicked", self.on_click)
 
-        # reusing the fabricator to call specified intervals
-        invoke_repeater(1000, self._update_ui)
-        self._update_ui()  # Initial update
+        # A single pidof poll shared by the same switcher on every monitor
+        self.state = ProcessStateModel.get(command=self.command, interval=interval)
+        self.state.bind(self, self._update_ui)
 
     # toggle the command on click
     def on_click(self, *_):
@@ -70,12 +97,10 @@ class CommandSwitcher(ButtonWidget):
             self.command,
             full_command=self.full_command,
         )
-        self._update_ui()
+        self.state.refresh()
         return True
 
-    def _update_ui(self, *_):
-        is_running = helpers.is_app_running(self.command)
-
+    def _update_ui(self, is_running: bool):
         self.toggle_css_class("active", is_running)
 
         label = "Enabled" if is_running else "Disabled"
@@ -87,5 +112,3 @@ class CommandSwitcher(ButtonWidget):
 
         if self.tooltip:
             self.set_tooltip_text(f"{self.command} {label.lower()}")
-
-        return True
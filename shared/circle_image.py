@@ -7,6 +7,8 @@ from fabric.core.service import Property
 from fabric.widgets.widget import Widget
 from gi.repository import Gdk, GdkPixbuf, Gtk
 
+from utils.image_loader import ImageLoader
+
 from .widget_container import BaseWidget
 
 gi.require_versions({"Gtk": "3.0", "Gdk": "3.0", "GdkPixbuf": "2.0"})
@@ -64,6 +66,7 @@ class CircularImage(Gtk.DrawingArea, BaseWidget):
             **kwargs,
         )
         self._image_file = image_file
+        self._pending_file: str | None = None
         self._angle = 0
         self.size = size
         self._image: GdkPixbuf.Pixbuf | None = (
@@ -95,23 +98,40 @@ class CircularImage(Gtk.DrawingArea, BaseWidget):
     def set_image_from_file(self, new_image_file):
         if new_image_file == "":
             return
-        self._image = (
-            GdkPixbuf.Pixbuf.new_from_file_at_size(
-                new_image_file,
-                -1,
-                self.size,
-            )
-            if self._image_file is not None
-            else None
+        if self._image_file is None:
+            self._image = None
+            self.queue_draw()
+            return
+
+        # Keep drawing the current image until the new one is decoded
+        self._pending_file = new_image_file
+        ImageLoader().load(
+            new_image_file,
+            (-1, self.size),
+            lambda pixbuf: self._on_image_loaded(new_image_file, pixbuf),
+            owner=self,
         )
+
+    def _on_image_loaded(self, image_file: str, pixbuf: GdkPixbuf.Pixbuf | None):
+        # A newer file may have been requested while this one was decoding
+        if image_file != self._pending_file:
+            return
+        self._pending_file = None
+        self._image = pixbuf
         self.queue_draw()
 
     def set_image_from_pixbuf(self, pixbuf):
         if not pixbuf:
             return
+        self._pending_file = None
         self._image = pixbuf
         self.queue_draw()
 
+    def clear(self):
+        self._pending_file = None
+        self._image = None
+        self.queue_draw()
+
     def set_image_size(self, size: Iterable[int] | int):
         if size is Iterable:
             x, y = size
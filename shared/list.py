@@ -1,7 +1,8 @@
-from collections.abc import Iterable
-from typing import Literal
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, Literal
 
 import gi
+from fabric.widgets.scrolledwindow import ScrolledWindow
 from fabric.widgets.widget import Widget
 from gi.repository import Gtk
 
@@ -54,3 +55,159 @@ class ListBox(Gtk.ListBox, Widget):
         for child in self.get_children():
             self.remove(child)
             child.destroy()
+
+
+class VirtualList(ScrolledWindow):
+    """A scrolled list that only keeps widgets for the visible rows.
+
+    A fixed pool of rows, sized to the visible area plus ``overscan`` rows
+    above and below, is positioned on a `Gtk.Layout` and rebound to the
+    items under the scroll position. Cost stays flat regardless of how many
+    items are set.
+    """
+
+    def __init__(
+        self,
+        row_factory: Callable[[], Gtk.Widget],
+        bind_row: Callable[[Gtk.Widget, Any, int], None],
+        row_height: int | None = None,
+        columns: int = 1,
+        spacing: int = 0,
+        overscan: int = 2,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+
+        self._row_factory = row_factory
+        self._bind_row = bind_row
+        self._row_height = row_height
+        self._columns = max(1, columns)
+        self._spacing = spacing
+        self._overscan = overscan
+        self._column_width = 0
+        self._items: Sequence[Any] = ()
+        self._rows: list[Gtk.Widget] = []
+        self._bound: list[int] = []
+
+        self._layout = Gtk.Layout()
+        self._layout.set_hexpand(True)
+        self._layout.set_vexpand(True)
+        self._layout.show()
+        self.add(self._layout)
+
+        self._layout.connect("size-allocate", self._on_size_allocate)
+        self.get_vadjustment().connect("value-changed", lambda *_: self._refresh())
+
+    @property
+    def items(self) -> Sequence[Any]:
+        return self._items
+
+    @property
+    def rows(self) -> list[Gtk.Widget]:
+        """The pooled row widgets (bound or not)."""
+        return self._rows
+
+    def set_items(self, items: Sequence[Any], reset_scroll: bool = True):
+        """Replace the backing items and rebind the visible rows."""
+        self._items = items
+        self._update_size()
+        if reset_scroll:
+            self.get_vadjustment().set_value(0)
+        self._refresh(force=True)
+
+    def row_for_index(self, index: int) -> Gtk.Widget | None:
+        """Return the pooled row currently bound to ``index``, if visible."""
+        for row, bound_index in zip(self._rows, self._bound):
+            if bound_index == index:
+                return row
+        return None
+
+    def scroll_to_index(self, index: int):
+        """Scroll the minimum amount needed to show the item at ``index``."""
+        if not self._items or self._row_height is None:
+            return
+
+        adjustment = self.get_vadjustment()
+        top = (index // self._columns) * self._stride
+        bottom = top + self._row_height
+        page = adjustment.get_page_size()
+        value = adjustment.get_value()
+
+        if top < value:
+            adjustment.set_value(top)
+        elif bottom > value + page:
+            adjustment.set_value(bottom - page)
+
+    @property
+    def _stride(self) -> int:
+        return self._row_height + self._spacing
+
+    def _measure_row_height(self) -> int:
+        row = self._row_factory()
+        self._layout.put(row, 0, 0)
+        self._rows.append(row)
+        self._bound.append(-1)
+        row.show_all()
+        _, natural = row.get_preferred_height()
+        row.hide()
+        return max(1, natural)
+
+    def _ensure_pool(self):
+        if self._row_height is None:
+            self._row_height = self._measure_row_height()
+
+        page = self.get_vadjustment().get_page_size() or self.get_allocated_height()
+        visible_rows = -(-int(page) // self._stride) + 2 * self._overscan
+        wanted = visible_rows * self._columns
+
+        while len(self._rows) < wanted:
+            row = self._row_factory()
+            if self._column_width:
+                row.set_size_request(self._column_width, self._row_height)
+            self._layout.put(row, 0, 0)
+            self._rows.append(row)
+            self._bound.append(-1)
+
+    def _update_size(self):
+        if self._row_height is None:
+            self._ensure_pool()
+        total_rows = -(-len(self._items) // self._columns)
+        width = self._layout.get_allocated_width()
+        height = max(0, total_rows * self._stride - self._spacing)
+        self._layout.set_size(width, height)
+
+    def _on_size_allocate(self, _, allocation):
+        column_width = allocation.width // self._columns
+        resized = column_width != self._column_width
+        if resized:
+            self._column_width = column_width
+            for row in self._rows:
+                row.set_size_request(column_width, self._row_height or -1)
+        self._update_size()
+        # Rows only need repositioning when the column width changed
+        self._refresh(force=resized)
+
+    def _refresh(self, force: bool = False):
+        self._ensure_pool()
+
+        stride = self._stride
+        value = self.get_vadjustment().get_value()
+        first_row = max(0, int(value // stride) - self._overscan)
+        first_index = first_row * self._columns
+
+        for slot, row in enumerate(self._rows):
+            index = first_index + slot
+            if index >= len(self._items):
+                self._bound[slot] = -1
+                row.hide()
+                continue
+
+            if force or self._bound[slot] != index:
+                self._bind_row(row, self._items[index], index)
+                self._bound[slot] = index
+                self._layout.move(
+                    row,
+                    (index % self._columns) * self._column_width,
+                    (index // self._columns) * stride,
+                )
+            row.show()
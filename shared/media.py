@@ -1,16 +1,14 @@
 import os
 import re
-import tempfile
 import urllib.parse
-import urllib.request
 from functools import partial
 
 import gi
 from fabric.utils import (
     bulk_connect,
     cooldown,
-    invoke_repeater,
     logger,
+    remove_handler,
 )
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
@@ -26,7 +24,13 @@ from services.mpris import MprisPlayer, MprisPlayerManager
 from shared.animator import cubic_bezier
 from shared.buttons import HoverButton
 from shared.circle_image import CircularImage
-from utils.constants import APP_DATA_DIRECTORY, ASSETS_DIR
+from utils.artwork_cache import ArtworkCache
+from utils.constants import (
+    APP_DATA_DIRECTORY,
+    ARTWORK_CACHE_BYTES,
+    ARTWORK_CACHE_DIR,
+    ASSETS_DIR,
+)
 from utils.functions import (
     ensure_directory,
     get_simple_palette_threaded,
@@ -35,6 +39,8 @@ from utils.functions import (
     tint_color,
 )
 from utils.icons import text_icons
+from utils.position_tracker import PositionTracker
+from utils.thread import thread, thread_serial
 from utils.widget_utils import (
     create_scale,
     nerd_font_icon,
@@ -47,6 +53,22 @@ gi.require_versions({"GObject": "2.0"})
 # Pre-compiled regex for newline replacement
 _NEWLINE_RE = re.compile(r"\r?\n")
 
+_artwork_cache: ArtworkCache | None = None
+
+
+def get_artwork_cache() -> ArtworkCache:
+    """Return the album art cache shared by every player."""
+    global _artwork_cache
+    if _artwork_cache is None:
+        _artwork_cache = ArtworkCache(
+            ARTWORK_CACHE_DIR,
+            ARTWORK_CACHE_BYTES,
+            run=thread,
+            post=GLib.idle_add,
+            run_io=thread_serial,
+        )
+    return _artwork_cache
+
 
 class PlayerBoxStack(Box):
     """A widget that displays the current player information."""
@@ -202,6 +224,10 @@ class PlayerBox(Box):
 
         # State
         self.exit = False
+        self._art_url = ""
+        # The seek bar is advanced locally and only resynced on changes
+        self._position = PositionTracker()
+        self._seekbar_driver_id = None
         self.angle_direction = 1
         self.skipped = False
 
@@ -420,6 +446,15 @@ class PlayerBox(Box):
                 "notify::playback-status": self.on_playback_change,
                 "notify::shuffle": self.on_shuffle_update,
                 "notify::metadata": self.on_metadata,
+                "seeked": self.on_seeked,
+            },
+        )
+
+        bulk_connect(
+            self,
+            {
+                "map": lambda *_: self._resync_position(),
+                "unmap": lambda *_: self._update_seekbar_driver(),
             },
         )
 
@@ -431,8 +466,13 @@ class PlayerBox(Box):
         if duration:
             self.length_label.set_label(self.length_str(self.player.length))
             self.seek_bar.set_range(0, duration)
+        self._position.length = int(duration or 0)
+
+        self._resync_position()
 
-        invoke_repeater(1000, self._move_seekbar)
+    def on_seeked(self, _, position: int):
+        self._position.sync(position, self._position.playing)
+        self._move_seekbar()
 
     def _set_notify_value(self, p, *_):
         self.image_box.angle = self.angle_direction * p.value
@@ -494,6 +534,8 @@ class PlayerBox(Box):
                 text_icons["mpris"]["paused"],
             )
 
+        self._resync_position()
+
     def _update_image(self, image_path):
         if image_path and os.path.isfile(image_path):
             self.image_box.set_image_from_file(image_path)
@@ -522,7 +564,9 @@ class PlayerBox(Box):
             f"trough highlight {{ {bg} {border} }} slider {{ {bg} }}"
         )
 
-        css_colors = [rgb_to_css(color) for color in palette]
+        css_colors = [
+            rgb_to_css(color) for color in palette or (base_color, base_color)
+        ]
         gradient = f"linear-gradient(135deg, {', '.join(css_colors)})"
 
         self.inner_box.set_style(f"background: {gradient};")
@@ -534,45 +578,67 @@ class PlayerBox(Box):
 
     def _set_image(self, *_):
         art_url = self.player.arturl
+        previous_url, self._art_url = self._art_url, art_url
 
         parsed = urllib.parse.urlparse(art_url)
         if parsed.scheme == "file":
             local_arturl = urllib.parse.unquote(parsed.path)
             self._update_image(local_arturl)
         elif parsed.scheme in ("http", "https"):
-            GLib.Thread.new("download-artwork", self._download_and_set_artwork, art_url)
+            if art_url == previous_url:
+                # Metadata changed, the cover did not, and it is either
+                # shown or still downloading
+                return
+            # Downloaded once per cover, and shared by concurrent requests
+            get_artwork_cache().fetch(
+                art_url, lambda path: self._on_artwork_fetched(art_url, path)
+            )
         else:
             self._update_image(art_url)
 
-    def _download_and_set_artwork(self, arturl):
-        """
-        Download the artwork from the given URL asynchronously and update the cover
-        using GLib.idle_add to ensure UI updates occur on the main thread.
-        """
-        try:
-            parsed = urllib.parse.urlparse(arturl)
-            suffix = os.path.splitext(parsed.path)[1] or ".png"
-            with urllib.request.urlopen(arturl) as response:
-                data = response.read()
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
-                temp_file.write(data)
-                local_arturl = temp_file.name
-        except Exception:
-            local_arturl = self.fallback_cover_path
-        GLib.idle_add(self._update_image, local_arturl)
-        return None
+    def _on_artwork_fetched(self, art_url: str, path: str | None):
+        # A newer cover may have been requested while this one downloaded
+        if self.exit or art_url != self._art_url:
+            return
+        if path is None:
+            logger.warning(f"[Media] Could not download artwork from {art_url}")
+            # Let the next metadata change retry the same url
+            self._art_url = ""
+        self._update_image(path or self.fallback_cover_path)
+
+    def _resync_position(self):
+        """Read the position from the player once and restart the estimate."""
+        if self.player is None or self.exit:
+            return
+        if self.get_mapped():
+            playing = self.player.playback_status == "playing"
+            self._position.sync(self.player.position, playing)
+            self._move_seekbar()
+        self._update_seekbar_driver()
+
+    def _update_seekbar_driver(self):
+        # One timer per player, only while it is shown and playing
+        running = not self.exit and self.get_mapped() and self._position.playing
+        if running and self._seekbar_driver_id is None:
+            self._seekbar_driver_id = GLib.timeout_add(1000, self._move_seekbar)
+        elif not running and self._seekbar_driver_id is not None:
+            remove_handler(self._seekbar_driver_id)
+            self._seekbar_driver_id = None
 
     def _move_seekbar(self, *_):
         if self.player is None or self.exit:
+            self._seekbar_driver_id = None
             return False
 
-        self.position_label.set_label(self.length_str(self.player.position))
-        self.seek_bar.set_value(self.player.position)
+        position = self._position.position()
+        self.position_label.set_label(self.length_str(position))
+        self.seek_bar.set_value(position)
 
         return True
 
     @cooldown(0.1)
     def on_scale_move(self, scale: Scale, event, pos: int):
         self.player.position = pos
+        self._position.sync(pos, self._position.playing)
         self.position_label.set_label(self.length_str(pos))
         self.seek_bar.set_value(pos)
@@ -0,0 +1,58 @@
+import unittest
+
+from utils.app_search import AppSearchIndex
+
+
+class _App:
+    def __init__(self, name, generic_name=None, executable=None):
+        self.name = name
+        self.display_name = name
+        self.generic_name = generic_name
+        self.executable = executable
+
+
+class AppSearchIndexTest(unittest.TestCase):
+    """Test suite for the launcher search index."""
+
+    def setUp(self):
+        self.apps = [
+            _App("Files", "File Manager", "/usr/bin/nautilus"),
+            _App("Firefox", "Web Browser", "/usr/bin/firefox"),
+            _App("Visual Studio Code", "Text Editor", "/usr/bin/code"),
+            _App("Profile Manager"),
+        ]
+        self.index = AppSearchIndex(self.apps)
+
+    def names(self, query):
+        return [app.name for app in self.index.search(query)]
+
+    def test_empty_query_returns_all_in_order(self):
+        self.assertEqual(self.index.search(""), self.apps)
+
+    def test_prefix_ranks_above_substring(self):
+        self.assertEqual(self.names("fi"), ["Files", "Firefox", "Profile Manager"])
+        self.assertEqual(self.names("fil"), ["Files", "Profile Manager"])
+
+    def test_word_start_fuzzy(self):
+        self.assertEqual(self.names("vsc"), ["Visual Studio Code"])
+        self.assertEqual(self.names("vscode"), ["Visual Studio Code"])
+
+    def test_aliases(self):
+        self.assertEqual(self.names("nautilus"), ["Files"])
+        self.assertEqual(self.names("browser"), ["Firefox"])
+
+    def test_multiple_terms(self):
+        self.assertEqual(self.names("code vis"), ["Visual Studio Code"])
+
+    def test_narrowing_and_backspace(self):
+        self.assertEqual(self.names("f"), self.names("f"))
+        self.assertEqual(self.names("fire"), ["Firefox"])
+        self.assertEqual(self.names("fi"), ["Files", "Firefox", "Profile Manager"])
+
+    def test_rebuild(self):
+        self.index.rebuild(self.apps[:1])
+        self.assertEqual(self.names("fi"), ["Files"])
+
+
+if __name__ == "__main__":
+    unittest.main()
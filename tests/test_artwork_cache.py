@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+
+from utils.artwork_cache import ArtworkCache
+
+
+class ArtworkCacheTest(unittest.TestCase):
+    """Test suite for the url-keyed artwork cache."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.downloads = []
+        self.pending = []
+        self.responses = {
+            "http://a/1.png": b"cover",
+            "http://a/2.png": b"cover",
+            "http://b/1.png": b"other",
+        }
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def download(self, url):
+        self.downloads.append(url)
+        if url not in self.responses:
+            raise OSError("not found")
+        return self.responses[url]
+
+    def cache(self, deferred=False):
+        return ArtworkCache(
+            self.tmp.name,
+            1024,
+            run=(lambda target, *args: self.pending.append((target, args)))
+            if deferred
+            else (lambda target, *args: target(*args)),
+            download=self.download,
+        )
+
+    def fetch(self, cache, url):
+        results = []
+        cache.fetch(url, results.append)
+        return results
+
+    def test_cached_by_url_and_content(self):
+        cache = self.cache()
+        [first] = self.fetch(cache, "http://a/1.png")
+        with open(first, "rb") as f:
+            self.assertEqual(f.read(), b"cover")
+
+        self.assertEqual(self.fetch(cache, "http://a/1.png"), [first])
+        # Same bytes behind another url share the file
+        self.assertEqual(self.fetch(cache, "http://a/2.png"), [first])
+        self.assertEqual(len(os.listdir(os.path.join(self.tmp.name, "files"))), 1)
+        self.assertEqual(self.downloads, ["http://a/1.png", "http://a/2.png"])
+
+    def test_concurrent_requests_share_a_download(self):
+        cache = self.cache(deferred=True)
+        first = self.fetch(cache, "http://b/1.png")
+        second = self.fetch(cache, "http://b/1.png")
+        self.assertEqual(len(self.pending), 1)
+
+        target, args = self.pending.pop()
+        target(*args)
+        self.assertEqual(self.downloads, ["http://b/1.png"])
+        self.assertEqual(first, second)
+        self.assertIsNotNone(first[0])
+
+    def test_failure(self):
+        cache = self.cache()
+        self.assertEqual(self.fetch(cache, "http://missing"), [None])
+        self.assertIsNone(cache.lookup("http://missing"))
+
+    def test_index_survives_restart(self):
+        [path] = self.fetch(self.cache(), "http://a/1.png")
+        reopened = self.cache()
+        self.assertEqual(reopened.lookup("http://a/1.png"), path)
+        self.assertEqual(self.fetch(reopened, "http://a/1.png"), [path])
+        self.assertEqual(self.downloads, ["http://a/1.png"])
+
+    def test_evicted_file_is_downloaded_again(self):
+        self.responses["http://big"] = b"x" * 1020
+        cache = self.cache()
+        self.fetch(cache, "http://a/1.png")
+        self.fetch(cache, "http://big")
+        self.fetch(cache, "http://b/1.png")
+        self.assertIsNone(cache.lookup("http://a/1.png"))
+        self.fetch(cache, "http://a/1.png")
+        self.assertEqual(self.downloads.count("http://a/1.png"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
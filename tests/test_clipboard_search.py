@@ -0,0 +1,81 @@
+import unittest
+from unittest import mock
+
+from utils import clipboard_search
+from utils.clipboard_search import ClipboardSearch
+from utils.clipboard_store import ClipboardEntry
+
+
+def _entries(previews):
+    return [
+        ClipboardEntry(i, str(i), "text", 0, len(p), p)
+        for i, p in enumerate(previews)
+    ]
+
+
+class ClipboardSearchTest(unittest.TestCase):
+    """Test suite for incremental clipboard history filtering."""
+
+    def setUp(self):
+        self.search = ClipboardSearch()
+        self.search.load(_entries(["Hello", "help", "World", "HELIUM"]))
+
+    def ids(self, query, search=None):
+        chunks = []
+        (search or self.search).search(query, chunks.append)
+        return [i for chunk in chunks for i in chunk]
+
+    def test_case_insensitive_match(self):
+        self.assertEqual(self.ids("hel"), [0, 1, 3])
+        self.assertEqual(self.ids(""), [0, 1, 2, 3])
+        self.assertEqual(self.ids("zzz"), [])
+
+    def test_extended_query_filters_previous_hits(self):
+        self.ids("he")
+        self.search._records = []
+        self.assertEqual(self.ids("hel"), [0, 1, 3])
+        self.assertEqual(self.ids("hell"), [0])
+
+    def test_load_resets_previous_hits(self):
+        self.ids("he")
+        self.search.load(_entries(["hello again"]))
+        self.assertEqual(self.ids("hel"), [0])
+
+    def test_sync_folds_only_changes(self):
+        self.assertEqual(self.ids("hel"), [0, 1, 3])
+        entries = _entries(["Hello", "help", "World", "HELIUM", "shell"])
+        # Newest first, with "help" deleted
+        entries = [entries[4], entries[0], entries[2], entries[3]]
+        self.search.sync(entries)
+        self.assertEqual(len(self.search), 4)
+        # Extends the last query, so only its updated hits are checked
+        self.search._records = []
+        self.assertEqual(self.ids("hell"), [4, 0])
+
+    def test_large_history_streams_chunks(self):
+        queued = []
+        search = ClipboardSearch(run=lambda target: queued.append(target))
+        search.load(_entries(["x", "y"] * 6))
+        done = []
+        chunks = []
+
+        with mock.patch.multiple(clipboard_search, ASYNC_THRESHOLD=4, CHUNK_SIZE=5):
+            search.search("x", chunks.append, lambda: done.append(True))
+            self.assertEqual(chunks, [])
+            queued.pop()()
+
+        self.assertEqual(chunks, [[0, 2, 4], [6, 8], [10]])
+        self.assertEqual(done, [True])
+
+    def test_cancelled_scan_delivers_nothing(self):
+        queued = []
+        search = ClipboardSearch(run=lambda target: queued.append(target))
+        search.load(_entries(["x"] * 8))
+        chunks = []
+
+        with mock.patch.object(clipboard_search, "ASYNC_THRESHOLD", 4):
+            search.search("x", chunks.append)
+            search.cancel()
+            queued.pop()()
+
+        self.assertEqual(chunks, [])
@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+
+from utils.clipboard_store import ClipboardStore, parse_cliphist_listing
+
+
+class ClipboardStoreTest(unittest.TestCase):
+    """Test suite for the append-only clipboard history store."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ClipboardStore(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def reopen(self, **kwargs):
+        return ClipboardStore(self.tmp.name, **kwargs)
+
+    def previews(self, store=None):
+        return [entry.preview for entry in (store or self.store).entries]
+
+    def blobs(self):
+        return sorted(os.listdir(os.path.join(self.tmp.name, "blobs")))
+
+    def test_add_and_read(self):
+        entry = self.store.add(b"hello", "text", "hello")
+        self.assertEqual(self.store.read(entry.id), b"hello")
+        self.assertTrue(self.reopen().get(entry.id))
+        self.assertFalse(self.store.is_new)
+
+    def test_duplicate_moves_to_top(self):
+        first = self.store.add(b"a", "text", "a")
+        self.store.add(b"b", "text", "b")
+        again = self.store.add(b"a", "text", "a")
+        self.assertEqual(self.previews(), ["a", "b"])
+        self.assertIsNone(self.store.get(first.id))
+        self.assertEqual(self.store.read(again.id), b"a")
+        self.assertEqual(len(self.blobs()), 2)
+        self.assertEqual(self.previews(self.reopen()), ["a", "b"])
+
+    def test_delete_and_wipe(self):
+        a = self.store.add(b"a", "text", "a")
+        self.store.add(b"b", "text", "b")
+        self.assertTrue(self.store.delete(a.id))
+        self.assertFalse(self.store.delete(a.id))
+        self.assertEqual(self.previews(self.reopen()), ["b"])
+        self.assertEqual(len(self.blobs()), 1)
+
+        self.store.wipe()
+        self.assertEqual(self.store.entries, [])
+        self.assertEqual(self.previews(self.reopen()), [])
+        self.assertEqual(self.blobs(), [])
+
+    def test_caps(self):
+        store = self.reopen(max_entries=2, max_bytes=5)
+        store.add(b"aa", "text", "aa", created=1)
+        store.add(b"bb", "text", "bb", created=2)
+        store.add(b"cc", "text", "cc", created=3)
+        self.assertEqual(self.previews(store), ["cc", "bb"])
+        store.add(b"dddd", "text", "dddd", created=4)
+        self.assertEqual(self.previews(store), ["dddd"])
+
+        store.max_age = 10
+        self.assertEqual(len(store.prune(now=100)), 1)
+        self.assertEqual(store.entries, [])
+
+    def test_cliphist_import_order(self):
+        # cliphist lists newest first
+        listing = "3\tnewest\n2\tmiddle\nnot an entry\n1\toldest\n"
+        pairs = parse_cliphist_listing(listing)
+        self.assertEqual([entry_id for entry_id, _ in pairs], ["1", "2", "3"])
+
+        store = self.reopen(max_entries=2)
+        for index, (_, preview) in enumerate(pairs):
+            store.add(preview.encode(), "text", preview, created=index)
+        # Pruning drops the oldest import, not the newest
+        self.assertEqual(self.previews(store), ["newest", "middle"])
+
+    def test_torn_journal_line_is_skipped(self):
+        self.store.add(b"a", "text", "a")
+        with open(os.path.join(self.tmp.name, "history.jsonl"), "a") as f:
+            f.write('{"op": "add", "id"')
+        store = self.reopen()
+        self.assertEqual(self.previews(store), ["a"])
+        store.add(b"b", "text", "b")
+        self.assertEqual(self.previews(self.reopen()), ["b", "a"])
+
+    def test_compaction_keeps_entries(self):
+        for i in range(200):
+            self.store.add(str(i % 3).encode(), "text", str(i % 3))
+        path = os.path.join(self.tmp.name, "history.jsonl")
+        with open(path) as f:
+            self.assertLess(len(f.readlines()), 200)
+        self.assertEqual(self.previews(self.reopen()), ["1", "0", "2"])
+
+    def test_search(self):
+        self.store.add(b"Hello World", "text", "Hello World")
+        self.store.add(b"other", "text", "other")
+        self.assertEqual(
+            [e.preview for e in self.store.search("world")], ["Hello World"]
+        )
+        self.assertEqual(len(self.store.search("")), 2)
@@ -0,0 +1,72 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from utils import emoji_index
+from utils.emoji_index import EmojiIndex, build_emoji_index, ensure_emoji_index
+
+_EMOJIS = {
+    "😀": {"name": "grinning face", "group": "Smileys & Emotion"},
+    "😼": {"name": "cat with wry smile", "group": "Smileys & Emotion"},
+    "🐱": {"name": "cat face", "group": "Animals & Nature"},
+    "🐈": {"name": "cat", "group": "Animals & Nature"},
+    "🇳🇵": {"name": "flag Nepal", "group": "Flags"},
+}
+
+
+class EmojiIndexTest(unittest.TestCase):
+    """Test suite for the compiled emoji index."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.tmp.name, "emoji.json")
+        self.destination = os.path.join(self.tmp.name, "emoji.bin")
+        with open(self.source, "w", encoding="utf-8") as f:
+            json.dump(_EMOJIS, f)
+        build_emoji_index(self.source, self.destination)
+        self.index = EmojiIndex(self.destination)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def chars(self, query, recent=()):
+        return [self.index.char(i) for i in self.index.search(query, recent)]
+
+    def test_round_trip(self):
+        self.assertEqual(len(self.index), len(_EMOJIS))
+        for emoji_id, (char, info) in enumerate(_EMOJIS.items()):
+            self.assertEqual(self.index.char(emoji_id), char)
+            self.assertEqual(self.index.name(emoji_id), info["name"])
+            self.assertEqual(self.index.group(emoji_id), info["group"])
+        self.assertEqual(self.index.find("🐱"), 2)
+        self.assertIsNone(self.index.find("x"))
+
+    def test_prefix_matches(self):
+        self.assertEqual(self.index.prefix_matches("ca"), {1, 2, 3})
+        self.assertEqual(self.index.prefix_matches("nep"), {4})
+        self.assertEqual(self.index.prefix_matches("zz"), set())
+
+    def test_exact_name_ranks_first(self):
+        self.assertEqual(self.chars("cat"), ["🐈", "😼", "🐱"])
+        self.assertEqual(self.chars("cat face"), ["🐱"])
+
+    def test_group_words_match_last(self):
+        self.assertEqual(self.chars("smil"), ["😼", "😀"])
+
+    def test_recent_breaks_ties(self):
+        self.assertEqual(self.chars("smileys", recent=["😼"]), ["😼", "😀"])
+        self.assertEqual(self.chars("", recent=["🐈"])[:2], ["🐈", "😀"])
+
+    def test_too_many_emojis_for_u16_ids(self):
+        limit = mock.patch.object(emoji_index, "_MAX_EMOJIS", len(_EMOJIS) - 1)
+        with limit, self.assertRaises(ValueError):
+            build_emoji_index(self.source, self.destination)
+
+    def test_ensure_rebuilds_stale_index(self):
+        os.utime(self.destination, (0, 0))
+        ensure_emoji_index(self.source, self.destination)
+        self.assertGreater(
+            os.path.getmtime(self.destination), os.path.getmtime(self.source) - 1
+        )
@@ -0,0 +1,111 @@
+import os
+import tempfile
+import unittest
+
+from utils.icon_store import IconStore
+
+
+class _Pixbuf:
+    def __init__(self, icon, size, nbytes):
+        self.icon = icon
+        self.size = size
+        self.nbytes = nbytes
+
+
+class IconStoreTest(unittest.TestCase):
+    """Test suite for the byte-budgeted icon store."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.loads = []
+        self.missing = set()
+        self.store = self.make_store(max_bytes=1000)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_store(self, max_bytes):
+        return IconStore(max_bytes, self.load, sizeof=lambda pixbuf: pixbuf.nbytes)
+
+    def load(self, icon, size, scale):
+        self.loads.append(icon)
+        if icon in self.missing:
+            return None
+        return _Pixbuf(icon, size * scale, 400)
+
+    def write(self, name, data):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_theme_icon_is_loaded_once(self):
+        first = self.store.get("firefox", 24)
+        self.assertIs(self.store.get("firefox", 24), first)
+        self.assertEqual(self.loads, ["firefox"])
+        # Another size is another entry
+        self.store.get("firefox", 32)
+        self.assertEqual(self.loads, ["firefox", "firefox"])
+
+    def test_eviction_keeps_bytes_under_budget(self):
+        for name in ("a", "b", "c"):
+            self.store.get(name, 24)
+        self.assertEqual(self.store.size, 800)
+        self.assertEqual(len(self.store), 2)
+        # "a" was least recently used
+        self.assertEqual(self.store.peek(("a", 24, 1)), (False, None))
+        self.assertTrue(self.store.peek(("b", 24, 1))[0])
+
+    def test_recent_use_protects_from_eviction(self):
+        self.store.get("a", 24)
+        self.store.get("b", 24)
+        self.store.get("a", 24)
+        self.store.get("c", 24)
+        self.assertTrue(self.store.peek(("a", 24, 1))[0])
+        self.assertFalse(self.store.peek(("b", 24, 1))[0])
+
+    def test_oversized_newest_entry_is_kept(self):
+        store = self.make_store(max_bytes=100)
+        self.assertIsNotNone(store.get("big", 24))
+        self.assertEqual(len(store), 1)
+
+    def test_misses_are_cached(self):
+        self.missing.add("ghost")
+        self.assertIsNone(self.store.get("ghost", 24))
+        self.assertIsNone(self.store.get("ghost", 24))
+        self.assertEqual(self.loads, ["ghost"])
+        self.assertEqual(self.store.peek(("ghost", 24, 1)), (True, None))
+        self.assertGreater(self.store.size, 0)
+
+    def test_file_icon_reloads_after_change(self):
+        path = self.write("icon.png", b"one")
+        first = self.store.get(path, 24)
+        self.assertIs(self.store.get(f"file://{path}", 24), first)
+        self.assertEqual(self.loads, [path])
+
+        # Same mtime, different size
+        stat = os.stat(path)
+        self.write("icon.png", b"longer")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.store.get(path, 24)
+        self.assertEqual(self.loads, [path, path])
+
+        # Same size, different mtime
+        self.write("icon.png", b"second")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.store.get(path, 24)
+        self.assertEqual(self.loads, [path, path, path])
+
+    def test_missing_file_is_not_cached(self):
+        path = os.path.join(self.tmp.name, "gone.png")
+        self.assertIsNone(self.store.get(path, 24))
+        self.assertEqual((self.loads, len(self.store)), ([], 0))
+
+    def test_clear(self):
+        self.store.get("a", 24)
+        self.store.clear()
+        self.assertEqual((len(self.store), self.store.size), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from utils.monitor_layout import MonitorInfo, diff_monitors
+
+
+def _monitor(name, index=0, x=0, width=1920, scale=1):
+    return MonitorInfo(index, name, "model", x, 0, width, 1080, scale)
+
+
+def _layout(*monitors):
+    return {info.name: info for info in monitors}
+
+
+class DiffMonitorsTest(unittest.TestCase):
+    """Test suite for the monitor layout diff."""
+
+    def test_unchanged_layout_is_empty(self):
+        old = _layout(_monitor("DP-1"), _monitor("HDMI-1", 1, x=1920))
+        new = _layout(_monitor("DP-1"), _monitor("HDMI-1", 1, x=1920))
+        self.assertFalse(diff_monitors(old, new))
+
+    def test_added(self):
+        old = _layout(_monitor("DP-1"))
+        new = _layout(_monitor("DP-1"), _monitor("HDMI-1", 1, x=1920))
+        diff = diff_monitors(old, new)
+        self.assertEqual([info.name for info in diff.added], ["HDMI-1"])
+        self.assertEqual((diff.removed, diff.changed), ((), ()))
+
+    def test_first_monitor_after_none(self):
+        diff = diff_monitors({}, _layout(_monitor("eDP-1")))
+        self.assertEqual([info.name for info in diff.added], ["eDP-1"])
+
+    def test_removed(self):
+        old = _layout(_monitor("DP-1"), _monitor("HDMI-1", 1, x=1920))
+        diff = diff_monitors(old, _layout(_monitor("DP-1")))
+        self.assertEqual([info.name for info in diff.removed], ["HDMI-1"])
+        self.assertEqual((diff.added, diff.changed), ((), ()))
+
+    def test_renamed_is_remove_and_add(self):
+        diff = diff_monitors(_layout(_monitor("DP-1")), _layout(_monitor("DP-2")))
+        self.assertEqual([info.name for info in diff.removed], ["DP-1"])
+        self.assertEqual([info.name for info in diff.added], ["DP-2"])
+        self.assertEqual(diff.changed, ())
+
+    def test_reindexed_is_changed(self):
+        old = _layout(_monitor("DP-1", 0), _monitor("HDMI-1", 1, x=1920))
+        new = _layout(_monitor("HDMI-1", 0, x=1920))
+        diff = diff_monitors(old, new)
+        self.assertEqual([info.name for info in diff.removed], ["DP-1"])
+        self.assertEqual(len(diff.changed), 1)
+        self.assertEqual(diff.changed[0].index, 0)
+
+    def test_geometry_change_is_changed(self):
+        old = _layout(_monitor("DP-1"))
+        new = _layout(_monitor("DP-1", width=2560, scale=2))
+        diff = diff_monitors(old, new)
+        self.assertEqual(diff.changed, (new["DP-1"],))
+        self.assertEqual((diff.added, diff.removed), ((), ()))
+
+
+if __name__ == "__main__":
+    unittest.main()
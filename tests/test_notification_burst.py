@@ -0,0 +1,66 @@
+import unittest
+
+from utils.notification_burst import (
+    COALESCE,
+    DROP,
+    SHOW,
+    NotificationBurstLimiter,
+)
+
+
+class NotificationBurstLimiterTest(unittest.TestCase):
+    """Test suite for the notification popup rate limiter."""
+
+    def setUp(self):
+        self.now = 0.0
+        self.limiter = NotificationBurstLimiter(
+            burst_limit=2,
+            burst_interval_ms=1000,
+            max_visible=3,
+            clock=lambda: self.now,
+        )
+
+    def test_burst_is_coalesced(self):
+        decisions = [self.limiter.admit("ci", visible=0) for _ in range(5)]
+        self.assertEqual(decisions, [SHOW, SHOW, COALESCE, COALESCE, COALESCE])
+        self.assertEqual(self.limiter.group_count("ci"), 3)
+        self.assertEqual(self.limiter.stats()["coalesced"], 3)
+
+    def test_tokens_refill(self):
+        self.limiter.admit("ci", visible=0)
+        self.limiter.admit("ci", visible=0)
+        self.now = 1.0
+        self.assertEqual(self.limiter.admit("ci", visible=0), SHOW)
+        self.assertEqual(self.limiter.admit("ci", visible=0), COALESCE)
+
+    def test_apps_are_limited_separately(self):
+        self.limiter.admit("ci", visible=0)
+        self.limiter.admit("ci", visible=0)
+        self.assertEqual(self.limiter.admit("mail", visible=0), SHOW)
+
+    def test_visible_cap(self):
+        # A full screen still updates an existing group card
+        self.assertEqual(self.limiter.admit("ci", visible=2), SHOW)
+        self.assertEqual(self.limiter.admit("ci", visible=2), SHOW)
+        self.assertEqual(self.limiter.admit("ci", visible=2), COALESCE)
+        self.assertEqual(self.limiter.admit("ci", visible=3), COALESCE)
+        self.assertEqual(self.limiter.admit("mail", visible=3), DROP)
+        self.assertEqual(self.limiter.stats()["dropped"], 1)
+
+    def test_urgent_always_shown(self):
+        self.limiter.admit("ci", visible=0)
+        self.limiter.admit("ci", visible=0)
+        self.assertEqual(self.limiter.admit("ci", visible=3, urgent=True), SHOW)
+
+    def test_close_group(self):
+        self.limiter.admit("ci", visible=3)
+        self.assertEqual(self.limiter.close_group("ci"), 0)
+        self.limiter.admit("ci", visible=0)
+        self.limiter.admit("ci", visible=0)
+        self.limiter.admit("ci", visible=0)
+        self.assertEqual(self.limiter.close_group("ci"), 1)
+        self.assertEqual(self.limiter.group_count("ci"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+
+from utils.notification_images import IMAGE_REF_KEY, NotificationImageStore
+
+_PIXMAP = [2, 2, 8, True, 8, 4, "AAAAAAAAAAAAAAAAAAAAAA=="]
+
+
+class NotificationImageStoreTest(unittest.TestCase):
+    """Test suite for the content-addressed notification image store."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = NotificationImageStore(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def files(self):
+        return os.listdir(self.tmp.name)
+
+    def test_extract_and_restore(self):
+        record = {"id": 1, "image-pixmap": _PIXMAP}
+        stripped = self.store.extract(record)
+        self.assertIsNone(stripped["image-pixmap"])
+        self.assertEqual(record["image-pixmap"], _PIXMAP)
+        self.assertEqual(self.files(), [stripped[IMAGE_REF_KEY]])
+        self.assertEqual(self.store.restore(stripped), record)
+
+    def test_identical_images_share_a_file(self):
+        a = self.store.extract({"id": 1, "image-pixmap": _PIXMAP})
+        b = self.store.extract({"id": 2, "image-pixmap": _PIXMAP})
+        self.assertEqual(a[IMAGE_REF_KEY], b[IMAGE_REF_KEY])
+        self.assertEqual(len(self.files()), 1)
+
+        self.store.release(a)
+        self.assertEqual(len(self.files()), 1)
+        self.store.release(b)
+        self.assertEqual(self.files(), [])
+
+    def test_records_without_image_are_untouched(self):
+        record = {"id": 1, "image-pixmap": None}
+        self.assertIs(self.store.extract(record), record)
+        self.assertIs(self.store.restore(record), record)
+
+    def test_garbage_collection_keeps_referenced_files(self):
+        kept = self.store.extract({"id": 1, "image-pixmap": _PIXMAP})
+        open(os.path.join(self.tmp.name, "orphan"), "w").close()
+
+        store = NotificationImageStore(self.tmp.name)
+        store.extract(kept)
+        store.collect_garbage()
+        self.assertEqual(self.files(), [kept[IMAGE_REF_KEY]])
+
+    def test_missing_file_restores_without_image(self):
+        stripped = self.store.extract({"id": 1, "image-pixmap": _PIXMAP})
+        self.store.release_all()
+        restored = self.store.restore(stripped)
+        self.assertIsNone(restored["image-pixmap"])
+        self.assertNotIn(IMAGE_REF_KEY, restored)
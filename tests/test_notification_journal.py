@@ -0,0 +1,107 @@
+import json
+import os
+import tempfile
+import unittest
+
+from utils.notification_journal import NotificationJournal
+
+
+class NotificationJournalTest(unittest.TestCase):
+    """Test suite for the append-only notification journal."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "notifications.jsonl")
+        self.legacy_path = os.path.join(self.tmp.name, "notifications.json")
+        self.records = []
+        self.last_id = 0
+        self.timers = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def journal(self, deferred=False):
+        def schedule(_delay, callback):
+            self.timers.append(callback)
+            return len(self.timers)
+
+        kwargs = {"schedule": schedule} if deferred else {}
+        return NotificationJournal(
+            self.path,
+            snapshot=lambda: (self.records, self.last_id),
+            legacy_path=self.legacy_path,
+            **kwargs,
+        )
+
+    def lines(self):
+        with open(self.path) as f:
+            return f.readlines()
+
+    def test_replay_add_and_remove(self):
+        journal = self.journal()
+        journal.add({"id": 1, "app_name": "a"})
+        journal.add({"id": 2, "app_name": "b"})
+        journal.remove(1)
+        records, last_id = self.journal().load()
+        self.assertEqual([r["id"] for r in records], [2])
+        self.assertEqual(last_id, 2)
+
+    def test_clear_keeps_last_id(self):
+        journal = self.journal()
+        journal.add({"id": 7})
+        journal.clear(7)
+        self.assertEqual(self.journal().load(), ([], 7))
+
+    def test_writes_are_batched(self):
+        journal = self.journal(deferred=True)
+        for i in range(1, 6):
+            journal.add({"id": i})
+        self.assertEqual(len(self.timers), 1)
+        self.assertFalse(os.path.exists(self.path))
+        self.timers.pop()()
+        self.assertEqual(len(self.lines()), 5)
+
+    def test_torn_line_is_skipped_and_repaired(self):
+        self.journal().add({"id": 1})
+        with open(self.path, "a") as f:
+            f.write('{"op": "add", "da')
+        journal = self.journal()
+        self.assertEqual([r["id"] for r in journal.load()[0]], [1])
+        journal.add({"id": 2})
+        self.assertEqual([r["id"] for r in self.journal().load()[0]], [1, 2])
+
+    def test_compaction_rewrites_live_records(self):
+        journal = self.journal()
+        for i in range(1, 60):
+            journal.add({"id": i})
+            journal.remove(i)
+        self.records = [{"id": 60}]
+        self.last_id = 60
+        journal.add({"id": 60})
+        self.assertLess(len(self.lines()), 40)
+        self.assertEqual(self.journal().load(), ([{"id": 60}], 60))
+
+    def test_compaction_serializes_on_the_writer(self):
+        queued = []
+        journal = NotificationJournal(
+            self.path,
+            snapshot=lambda: (self.records, self.last_id),
+            run_io=lambda target, *args: queued.append((target, args)),
+        )
+        self.records = [{"id": 1, "summary": "é"}]
+        self.last_id = 1
+        journal.compact()
+        # Records reach the writer as they are, not as JSON lines
+        target, args = queued.pop()
+        self.assertEqual(args, (self.records, 1))
+        target(*args)
+        self.assertEqual(self.journal().load(), (self.records, 1))
+
+    def test_imports_legacy_file(self):
+        with open(self.legacy_path, "w") as f:
+            json.dump([{"id": 3}, {"id": 1}, {"bad": True}], f)
+        records, last_id = self.journal().load()
+        self.assertEqual([r["id"] for r in records], [1, 3])
+        self.assertEqual(last_id, 3)
+        self.assertFalse(os.path.exists(self.legacy_path))
+        self.assertEqual(self.journal().load()[0], records)
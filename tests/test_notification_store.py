@@ -0,0 +1,60 @@
+import unittest
+
+from utils.notification_store import NotificationRecord, NotificationStore
+
+
+def _record(notification_id, app_name="app"):
+    return NotificationRecord({"id": notification_id, "app_name": app_name})
+
+
+class NotificationStoreTest(unittest.TestCase):
+    """Test suite for the indexed notification store."""
+
+    def setUp(self):
+        self.store = NotificationStore()
+
+    def ids(self):
+        return [record.id for record in self.store]
+
+    def test_order_and_lookup(self):
+        for i in (1, 2, 3):
+            self.store.add(_record(i))
+        self.assertEqual(self.ids(), [1, 2, 3])
+        self.assertEqual([r.id for r in self.store.newest_first()], [3, 2, 1])
+        self.assertEqual(self.store.get(2).id, 2)
+        self.assertIn(3, self.store)
+
+    def test_remove(self):
+        self.store.add(_record(1))
+        self.store.add(_record(2))
+        self.assertEqual(self.store.remove(1).id, 1)
+        self.assertIsNone(self.store.remove(1))
+        self.assertEqual(self.ids(), [2])
+        self.assertEqual(self.store.app_count("app"), 1)
+
+    def test_trim_removes_oldest(self):
+        for i in range(1, 6):
+            self.store.add(_record(i, "a" if i % 2 else "b"))
+        removed = self.store.trim(3)
+        self.assertEqual([r.id for r in removed], [1, 2])
+        self.assertEqual(self.ids(), [3, 4, 5])
+        self.assertEqual(self.store.app_count("a"), 2)
+        self.assertEqual(self.store.app_count("b"), 1)
+
+    def test_trim_app_skips_removed_ids(self):
+        for i in range(1, 6):
+            self.store.add(_record(i, "a" if i < 5 else "b"))
+        self.store.remove(1)
+        removed = self.store.trim_app("a", 1)
+        self.assertEqual([r.id for r in removed], [2, 3])
+        self.assertEqual(self.ids(), [4, 5])
+        self.assertEqual(self.store.trim_app("missing", 0), [])
+
+    def test_stale_ids_are_compacted(self):
+        for i in range(1, 101):
+            self.store.add(_record(i))
+        for i in range(1, 100):
+            self.store.remove(i)
+        self.assertLessEqual(len(self.store._by_app["app"]), 2 + 16)
+        self.assertEqual([r.id for r in self.store.trim_app("app", 0)], [100])
+        self.assertEqual(len(self.store), 0)
@@ -0,0 +1,57 @@
+import importlib.util
+import unittest
+from io import BytesIO
+
+from utils.palette import PaletteCache, extract_palette
+
+HAS_PILLOW = importlib.util.find_spec("PIL") is not None
+
+
+def _png(colors):
+    """A PNG made of vertical stripes, as (rgb, width) pairs."""
+    from PIL import Image
+
+    img = Image.new("RGB", (sum(width for _, width in colors), 8))
+    x = 0
+    for rgb, width in colors:
+        img.paste(rgb, (x, 0, x + width, 8))
+        x += width
+    buffer = BytesIO()
+    img.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+class PaletteCacheTest(unittest.TestCase):
+    """Test suite for the content-addressed palette cache."""
+
+    def test_lru(self):
+        cache = PaletteCache(max_entries=2)
+        cache.put("a", 5, [(1, 2, 3)])
+        cache.put("b", 5, [(4, 5, 6)])
+        cache.get("a", 5)
+        cache.put("c", 5, [(7, 8, 9)])
+
+        self.assertEqual(cache.get("a", 5), [(1, 2, 3)])
+        self.assertIsNone(cache.get("b", 5))
+        self.assertIsNone(cache.get("a", 3))
+        self.assertEqual(len(cache), 2)
+
+    @unittest.skipUnless(HAS_PILLOW, "Pillow is not installed")
+    def test_extract_orders_by_frequency(self):
+        data = _png([((200, 10, 10), 24), ((10, 10, 200), 8)])
+        palette = extract_palette(data, color_count=2)
+        self.assertEqual(len(palette), 2)
+        red, blue = palette
+        self.assertGreater(red[0], red[2])
+        self.assertGreater(blue[2], blue[0])
+
+    @unittest.skipUnless(HAS_PILLOW, "Pillow is not installed")
+    def test_palette_for_is_cached(self):
+        cache = PaletteCache()
+        data = _png([((0, 200, 0), 16)])
+        palette = cache.palette_for(data, 3)
+        self.assertIs(cache.palette_for(data, 3), palette)
+
+
+if __name__ == "__main__":
+    unittest.main()
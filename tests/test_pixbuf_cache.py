@@ -0,0 +1,66 @@
+import unittest
+
+from utils.pixbuf_cache import PixbufCache
+
+
+class _Pixbuf:
+    def __init__(self, size):
+        self.size = size
+
+    def get_byte_length(self):
+        return self.size * self.size * 4
+
+
+def _scale(pixbuf, size):
+    return _Pixbuf(size)
+
+
+class PixbufCacheTest(unittest.TestCase):
+    """Test suite for the byte-budgeted pixbuf cache."""
+
+    def test_sizes_are_derived_lazily(self):
+        cache = PixbufCache(1 << 20, scale=_scale)
+        cache.put(1, 80, _Pixbuf(80))
+        self.assertEqual(len(cache), 1)
+
+        scaled = cache.get(1, 60)
+        self.assertEqual(scaled.size, 60)
+        self.assertIs(cache.get(1, 60), scaled)
+        self.assertEqual(cache.size, (80 * 80 + 60 * 60) * 4)
+        self.assertIsNone(cache.get(2, 60))
+
+    def test_evicts_least_recently_used(self):
+        # Room for two 10x10 pixbufs
+        cache = PixbufCache(800, scale=_scale)
+        cache.put(1, 10, _Pixbuf(10))
+        cache.put(2, 10, _Pixbuf(10))
+        cache.get(1, 10)
+        cache.put(3, 10, _Pixbuf(10))
+
+        self.assertIn(1, cache)
+        self.assertNotIn(2, cache)
+        self.assertIn(3, cache)
+        self.assertEqual(cache.size, 800)
+
+    def test_shrinking_budget_evicts(self):
+        cache = PixbufCache(1 << 20, scale=_scale)
+        for owner in range(4):
+            cache.put(owner, 10, _Pixbuf(10))
+        cache.max_bytes = 400
+        self.assertEqual(len(cache), 1)
+        self.assertIn(3, cache)
+
+    def test_discard_and_replace(self):
+        cache = PixbufCache(1 << 20, scale=_scale)
+        cache.put(1, 10, _Pixbuf(10))
+        cache.get(1, 5)
+        cache.put(1, 10, _Pixbuf(10))
+        self.assertEqual(cache.size, (100 + 25) * 4)
+
+        cache.discard(1)
+        self.assertNotIn(1, cache)
+        self.assertEqual(cache.size, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
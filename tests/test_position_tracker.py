@@ -0,0 +1,43 @@
+import unittest
+
+from utils.position_tracker import PositionTracker
+
+
+class PositionTrackerTest(unittest.TestCase):
+    """Test suite for the extrapolated playback position."""
+
+    def setUp(self):
+        self.now = 100.0
+        self.tracker = PositionTracker(clock=lambda: self.now)
+
+    def test_extrapolates_while_playing(self):
+        self.tracker.sync(5_000_000, playing=True)
+        self.now += 2.5
+        self.assertEqual(self.tracker.position(), 7_500_000)
+
+    def test_paused_does_not_move(self):
+        self.tracker.sync(5_000_000, playing=False)
+        self.now += 10
+        self.assertEqual(self.tracker.position(), 5_000_000)
+
+    def test_set_playing_keeps_position(self):
+        self.tracker.sync(0, playing=True)
+        self.now += 3
+        self.tracker.set_playing(False)
+        self.now += 10
+        self.assertEqual(self.tracker.position(), 3_000_000)
+        self.tracker.set_playing(True)
+        self.now += 1
+        self.assertEqual(self.tracker.position(), 4_000_000)
+
+    def test_rate_and_length(self):
+        self.tracker.length = 10_000_000
+        self.tracker.sync(1_000_000, playing=True, rate=2.0)
+        self.now += 2
+        self.assertEqual(self.tracker.position(), 5_000_000)
+        self.now += 100
+        self.assertEqual(self.tracker.position(), 10_000_000)
+
+
+if __name__ == "__main__":
+    unittest.main()
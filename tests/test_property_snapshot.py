@@ -0,0 +1,35 @@
+import unittest
+
+from utils.property_snapshot import PropertySnapshot
+
+
+class PropertySnapshotTest(unittest.TestCase):
+    """Test suite for the MPRIS property change detection."""
+
+    def setUp(self):
+        self.values = {"title": "Song", "artist": "Band", "length": 1000}
+        self.reads = []
+        self.snapshot = PropertySnapshot(self.values)
+
+    def get_property(self, name):
+        self.reads.append(name)
+        return self.values[name]
+
+    def test_first_read_reports_everything(self):
+        changed = self.snapshot.update(self.get_property)
+        self.assertEqual(changed, {"title", "artist", "length"})
+
+    def test_unchanged_properties_do_not_notify_again(self):
+        self.snapshot.update(self.get_property)
+        self.assertEqual(self.snapshot.update(self.get_property), frozenset())
+
+    def test_only_changed_properties_are_reported(self):
+        self.snapshot.update(self.get_property)
+        self.values["title"] = "Next song"
+        self.assertEqual(self.snapshot.update(self.get_property), {"title"})
+        # Every property is still read back once per update
+        self.assertEqual(self.reads.count("artist"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
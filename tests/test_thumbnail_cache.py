@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+
+from utils.thumbnail_cache import ThumbnailCache
+
+
+class ThumbnailCacheTest(unittest.TestCase):
+    """Test suite for the on-disk LRU thumbnail cache."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ThumbnailCache(self.tmp.name, max_bytes=10)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_put_and_lookup(self):
+        path = self.cache.put("a", b"1234")
+        self.assertEqual(self.cache.lookup("a"), path)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"1234")
+        self.assertIsNone(self.cache.lookup("b"))
+        self.assertEqual(self.cache.size, 4)
+
+    def test_evicts_least_recently_used(self):
+        self.cache.put("a", b"1234")
+        self.cache.put("b", b"1234")
+        self.cache.lookup("a")
+        self.cache.put("c", b"1234")
+        self.assertIsNone(self.cache.lookup("b"))
+        self.assertFalse(os.path.exists(self.cache.path("b")))
+        self.assertIsNotNone(self.cache.lookup("a"))
+        self.assertEqual(self.cache.size, 8)
+
+    def test_reopen_restores_order_and_drops_partial_writes(self):
+        self.cache.put("a", b"12")
+        self.cache.put("b", b"12")
+        os.utime(self.cache.path("a"), (1, 1))
+        with open(os.path.join(self.tmp.name, "c.1.tmp"), "wb") as f:
+            f.write(b"partial")
+
+        cache = ThumbnailCache(self.tmp.name, max_bytes=2)
+        self.assertIsNone(cache.lookup("a"))
+        self.assertIsNotNone(cache.lookup("b"))
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ["b"])
+
+    def test_remove_and_clear(self):
+        self.cache.put("a", b"12")
+        self.cache.put("b", b"12")
+        self.cache.remove("a")
+        self.assertEqual(self.cache.size, 2)
+        self.cache.clear()
+        self.assertEqual(self.cache.size, 0)
+        self.assertEqual(os.listdir(self.tmp.name), [])
@@ -1,4 +1,4 @@
-from fabric.utils import get_desktop_applications
+from .desktop_entries import DesktopEntryIndex
 
 # Frozenset for O(1) suffix lookup
 _NORMALIZE_SUFFIXES = frozenset((".bin", ".exe", ".so", "-bin", "-gtk"))
@@ -7,7 +7,7 @@ _NORMALIZE_SUFFIXES = frozenset((".bin", ".exe", ".so", "-bin", "-gtk"))
 class AppUtils:
     """Singleton utility class for managing desktop applications"""
 
-    __slots__ = ("_all_applications", "_app_identifiers")
+    __slots__ = ("_app_identifiers", "_index")
 
     _instance = None
     _initialized = False
@@ -22,18 +22,27 @@ class AppUtils:
             return
         AppUtils._initialized = True
         # Defer loading until first access to save memory at startup
-        self._all_applications = None
+        self._index = None
         self._app_identifiers = None
 
     def _ensure_loaded(self):
-        """Lazily load applications on first access."""
-        if self._all_applications is None:
-            self._all_applications = get_desktop_applications()
+        """Lazily load applications from the desktop entry cache."""
+        if self._index is None:
+            self._index = DesktopEntryIndex()
             self._app_identifiers = self._build_app_identifiers_map()
+            self._index.connect(self._on_entries_changed)
+
+    @property
+    def _all_applications(self):
+        return self._index.applications
 
     @property
     def all_applications(self):
-        """Return all desktop applications (lazy-loaded)."""
+        """Return all desktop applications (lazy-loaded).
+
+        The list object is replaced whenever entries change on disk, so
+        callers can detect updates with an identity check.
+        """
         self._ensure_loaded()
         return self._all_applications
 
@@ -44,11 +53,11 @@ class AppUtils:
         return self._app_identifiers
 
     def refresh(self):
-        """Return all desktop applications, optionally refreshing the list."""
-        from fabric.utils import get_desktop_applications
-
-        self._all_applications = get_desktop_applications()
-        self._app_identifiers = self._build_app_identifiers_map()
+        """Pick up desktop files changed on disk, re-parsing only those."""
+        self._ensure_loaded()
+        removed, added = self._index.revalidate()
+        if removed or added:
+            self._on_entries_changed(removed, added)
         return True
 
     def _normalize_window_class(self, class_name: str) -> str:
@@ -81,27 +90,51 @@ class AppUtils:
     # App Lookup Helpers
     # -------------------------
 
+    @staticmethod
+    def _identifier_keys(app) -> list[str]:
+        executable = getattr(app, "executable", None)
+        command_line = getattr(app, "command_line", None)
+
+        keys = [
+            app.name,
+            app.display_name,
+            app.window_class,
+            executable.split("/")[-1] if executable else None,
+            command_line.split()[0].split("/")[-1] if command_line else None,
+        ]
+        return [key.lower() for key in keys if key]
+
     def _build_app_identifiers_map(self) -> dict:
         """Create a fast lookup dictionary for app identifiers."""
         identifiers = {}
         for app in self._all_applications:
-            # Pre-compute keys to avoid repeated getattr calls
-            executable = getattr(app, "executable", None)
-            command_line = getattr(app, "command_line", None)
-
-            keys = [
-                app.name,
-                app.display_name,
-                app.window_class,
-                executable.split("/")[-1] if executable else None,
-                command_line.split()[0].split("/")[-1] if command_line else None,
-            ]
-
-            for key in keys:
-                if key:
-                    identifiers[key.lower()] = app
+            for key in self._identifier_keys(app):
+                identifiers[key] = app
         return identifiers
 
+    def _on_entries_changed(self, removed: list, added: list):
+        """Patch the identifier map in place for changed entries only."""
+        identifiers = self._app_identifiers
+        orphaned = set()
+
+        for app in removed:
+            for key in self._identifier_keys(app):
+                if identifiers.get(key) is app:
+                    del identifiers[key]
+                    orphaned.add(key)
+
+        for app in added:
+            for key in self._identifier_keys(app):
+                identifiers[key] = app
+                orphaned.discard(key)
+
+        # Keys that another remaining app also provides
+        if orphaned:
+            for app in self._all_applications:
+                for key in self._identifier_keys(app):
+                    if key in orphaned:
+                        identifiers[key] = app
+
     def find_app(self, app_identifier):
         """Find an app by dict or direct identifier."""
         if not app_identifier:
@@ -126,6 +159,7 @@ class AppUtils:
         """Find app by identifier or partial match."""
         if not key_value:
             return None
+        self._ensure_loaded()
         normalized_id = str(key_value).lower()
 
         # Fast path: direct lookup
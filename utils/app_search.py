@@ -0,0 +1,316 @@
+"""Ranked fuzzy search over desktop applications.
+
+The index is built once per application refresh: every app gets its folded
+haystacks precomputed and is registered in a trigram index (for substring
+matches) and prefix/acronym tables (for word-start matches), so a
+keystroke only touches the apps that can possibly match.
+"""
+
+from collections import OrderedDict
+from typing import Any, Iterable
+
+# Score weights, highest wins
+_EXACT = 1000
+_PREFIX = 800
+_WORD_PREFIX = 600
+_SUBSTRING = 400
+_WORD_START_FUZZY = 300
+_CONTIGUOUS_BONUS = 10
+_ALIAS_WORD_PREFIX = 200
+_ALIAS_SUBSTRING = 100
+_CATEGORY = 50
+
+_WORD_SEPARATORS = frozenset(" -_./")
+
+# Queries remembered per index, so backspacing does not recompute
+_RESULT_CACHE_SIZE = 64
+
+# Terms shorter than this are answered from the prefix/acronym tables
+_SHORT_TERM = 3
+
+
+def _fold(text: str | None) -> str:
+    return " ".join((text or "").casefold().split())
+
+
+def _word_starts(text: str) -> tuple[int, ...]:
+    return tuple(
+        i
+        for i, char in enumerate(text)
+        if char not in _WORD_SEPARATORS
+        and (i == 0 or text[i - 1] in _WORD_SEPARATORS)
+    )
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _app_info_list(app: Any, getter: str) -> list[str]:
+    """Read keywords/categories from the app or its Gio.DesktopAppInfo."""
+    cached = getattr(app, getter.removeprefix("get_"), None)
+    if isinstance(cached, list):
+        return cached
+
+    info = getattr(app, "_app", None)
+    method = getattr(info, getter, None)
+    if method is None:
+        return []
+    try:
+        value = method()
+    except Exception:
+        return []
+    if isinstance(value, str):
+        value = value.split(";")
+    return [item for item in value or () if item]
+
+
+class _Entry:
+    """Precomputed search data for a single application."""
+
+    __slots__ = (
+        "aliases",
+        "app",
+        "categories",
+        "haystack",
+        "name",
+        "order",
+        "word_start_set",
+        "word_starts",
+    )
+
+    def __init__(self, app: Any, order: int):
+        executable = getattr(app, "executable", None) or ""
+
+        self.app = app
+        self.order = order
+        self.name = _fold(getattr(app, "display_name", None) or app.name)
+        self.word_starts = _word_starts(self.name)
+        self.word_start_set = frozenset(self.word_starts)
+        self.aliases = _fold(
+            " ".join(
+                (
+                    getattr(app, "name", None) or "",
+                    getattr(app, "generic_name", None) or "",
+                    executable.rsplit("/", 1)[-1],
+                    *_app_info_list(app, "get_keywords"),
+                )
+            )
+        )
+        self.categories = _fold(" ".join(_app_info_list(app, "get_categories")))
+        self.haystack = f"{self.name} {self.aliases} {self.categories}"
+
+    def word_start_fuzzy(self, term: str) -> int | None:
+        """Match ``term`` by jumping between word starts of the name.
+
+        Each character either continues the current run or starts at the
+        next word, so ``vsc`` and ``vscode`` both hit "Visual Studio Code".
+        Returns the number of contiguous continuations, or None.
+        """
+        name = self.name
+        starts = self.word_starts
+        position = -1
+        contiguous = 0
+
+        for char in term:
+            if 0 <= position + 1 < len(name) and name[position + 1] == char:
+                position += 1
+                contiguous += 1
+                continue
+            position = next(
+                (i for i in starts if i > position and name[i] == char), None
+            )
+            if position is None:
+                return None
+        return contiguous
+
+    def score(self, term: str) -> int | None:
+        name = self.name
+
+        if name == term:
+            return _EXACT
+        if name.startswith(term):
+            return _PREFIX
+
+        index = name.find(term)
+        if index > 0:
+            return _WORD_PREFIX if index in self.word_start_set else _SUBSTRING
+
+        contiguous = self.word_start_fuzzy(term)
+        if contiguous is not None:
+            return _WORD_START_FUZZY + contiguous * _CONTIGUOUS_BONUS
+
+        index = self.aliases.find(term)
+        if index >= 0:
+            at_word = index == 0 or self.aliases[index - 1] == " "
+            return _ALIAS_WORD_PREFIX if at_word else _ALIAS_SUBSTRING
+
+        if term in self.categories:
+            return _CATEGORY
+        return None
+
+
+class AppSearchIndex:
+    """Search index over a list of `DesktopApp` objects."""
+
+    __slots__ = (
+        "_acronyms",
+        "_all_ids",
+        "_entries",
+        "_last_ids",
+        "_last_query",
+        "_names",
+        "_prefixes",
+        "_results",
+        "_sort_keys",
+        "_trigrams",
+        "_word_prefixes",
+    )
+
+    def __init__(self, apps: Iterable[Any] = ()):
+        self.rebuild(apps)
+
+    def rebuild(self, apps: Iterable[Any]):
+        """Recompute the index for a new application list."""
+        self._entries = [_Entry(app, order) for order, app in enumerate(apps)]
+        self._all_ids = frozenset(range(len(self._entries)))
+        self._sort_keys = [(len(entry.name), entry.order) for entry in self._entries]
+        self._trigrams: dict[str, set[int]] = {}
+        self._names: dict[str, set[int]] = {}
+        self._prefixes: dict[str, set[int]] = {}
+        self._word_prefixes: dict[str, set[int]] = {}
+        self._acronyms: dict[str, set[int]] = {}
+
+        for entry_id, entry in enumerate(self._entries):
+            name = entry.name
+            for trigram in _trigrams(entry.haystack):
+                self._trigrams.setdefault(trigram, set()).add(entry_id)
+
+            self._names.setdefault(name, set()).add(entry_id)
+            for length in range(1, _SHORT_TERM):
+                self._prefixes.setdefault(name[:length], set()).add(entry_id)
+
+            initials = [name[start] for start in entry.word_starts]
+            for start in entry.word_starts:
+                for length in range(1, _SHORT_TERM):
+                    prefix = name[start : start + length]
+                    self._word_prefixes.setdefault(prefix, set()).add(entry_id)
+            for i, first in enumerate(initials):
+                for second in initials[i + 1 :]:
+                    self._acronyms.setdefault(first + second, set()).add(entry_id)
+
+        self._results: OrderedDict[str, list[Any]] = OrderedDict()
+        self._last_query = ""
+        self._last_ids: frozenset[int] = self._all_ids
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _candidates(self, term: str) -> set[int] | frozenset[int]:
+        if len(term) < _SHORT_TERM:
+            return self._all_ids
+
+        postings = sorted(
+            (self._trigrams.get(trigram, set()) for trigram in _trigrams(term)),
+            key=len,
+        )
+        substring_ids = set(postings[0]).intersection(*postings[1:])
+
+        # A word-start fuzzy match starts a word with the first character and
+        # either continues it or starts a later word with the second one
+        head = term[:2]
+        return (
+            substring_ids
+            | self._word_prefixes.get(head, set())
+            | self._acronyms.get(head, set())
+        )
+
+    def search(self, query: str) -> list[Any]:
+        """Return matching apps, best match first.
+
+        An empty query returns every app in its original order. When the
+        query extends the previous one, only the previous hits are searched.
+        """
+        query = _fold(query)
+        if not query:
+            return [entry.app for entry in self._entries]
+
+        cached = self._results.get(query)
+        if cached is not None:
+            self._results.move_to_end(query)
+            return cached
+
+        terms = query.split()
+        if len(terms) == 1 and len(query) < _SHORT_TERM:
+            ids = self._search_short(query)
+        else:
+            ids = self._search_scored(query, terms)
+
+        results = [self._entries[entry_id].app for entry_id in ids]
+
+        self._last_query = query
+        self._last_ids = frozenset(ids)
+        self._results[query] = results
+        if len(self._results) > _RESULT_CACHE_SIZE:
+            self._results.popitem(last=False)
+
+        return results
+
+    def _search_short(self, term: str) -> list[int]:
+        """Rank a one or two character query by tiers instead of scoring.
+
+        Almost every app matches a short query, so ranking is read from the
+        name, prefix and acronym tables and the remaining substring matches
+        are appended in a single pass.
+        """
+        sort_key = self._sort_keys.__getitem__
+        ordered: list[int] = []
+        seen: set[int] = set()
+
+        for table in (self._names, self._prefixes, self._word_prefixes):
+            tier = table.get(term, set()) - seen
+            ordered.extend(sorted(tier, key=sort_key))
+            seen |= tier
+
+        acronyms = self._acronyms.get(term, set()) - seen
+        ordered.extend(sorted(acronyms, key=sort_key))
+        seen |= acronyms
+
+        names, aliases, categories = [], [], []
+        for entry_id, entry in enumerate(self._entries):
+            if entry_id in seen or term not in entry.haystack:
+                continue
+            if term in entry.name:
+                names.append(entry_id)
+            elif term in entry.aliases:
+                aliases.append(entry_id)
+            else:
+                categories.append(entry_id)
+
+        for tier in (names, aliases, categories):
+            ordered.extend(sorted(tier, key=sort_key))
+        return ordered
+
+    def _search_scored(self, query: str, terms: list[str]) -> list[int]:
+        if self._last_query and query.startswith(self._last_query):
+            candidates = self._last_ids
+        else:
+            candidates = self._all_ids
+
+        for term in terms:
+            candidates = candidates & self._candidates(term)
+
+        scored = []
+        for entry_id in candidates:
+            entry = self._entries[entry_id]
+            total = 0
+            for term in terms:
+                term_score = entry.score(term)
+                if term_score is None:
+                    break
+                total += term_score
+            else:
+                scored.append((-total, len(entry.name), entry.order, entry_id))
+
+        scored.sort()
+        return [item[3] for item in scored]
@@ -0,0 +1,147 @@
+"""Persistent cache of downloaded album art.
+
+Players hand out cover art as http(s) urls, and every track of an album
+usually points at the same image. Downloads are stored once per content
+hash under a disk budget, and a url index maps each url to its file, so
+skipping through an album downloads the cover at most once. Concurrent
+requests for one url share a single download.
+"""
+
+import hashlib
+import json
+import os
+import urllib.request
+from collections import OrderedDict
+from collections.abc import Callable
+
+from .thumbnail_cache import ThumbnailCache
+
+# Urls remembered in the index; files are bounded by the byte budget
+_MAX_INDEXED_URLS = 512
+# Larger responses are not album art
+_MAX_DOWNLOAD_BYTES = 16 * 1024 * 1024
+_DOWNLOAD_TIMEOUT_SECONDS = 10
+
+ArtworkCallback = Callable[[str | None], None]
+
+
+def _run_now(target: Callable, *args):
+    target(*args)
+
+
+def _download(url: str) -> bytes:
+    with urllib.request.urlopen(url, timeout=_DOWNLOAD_TIMEOUT_SECONDS) as response:
+        data = response.read(_MAX_DOWNLOAD_BYTES + 1)
+    if len(data) > _MAX_DOWNLOAD_BYTES:
+        raise ValueError("response too large")
+    return data
+
+
+class ArtworkCache:
+    """Url-keyed, content-addressed artwork files with deduplicated downloads.
+
+    ``fetch`` is called on the main loop; downloads go through ``run`` and
+    their result comes back through ``post``. Index writes go through
+    ``run_io``, which must run tasks in submission order.
+    """
+
+    __slots__ = (
+        "_download",
+        "_files",
+        "_index",
+        "_index_path",
+        "_post",
+        "_run",
+        "_run_io",
+        "_waiters",
+    )
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int,
+        run: Callable[..., object] = _run_now,
+        post: Callable[..., object] = _run_now,
+        run_io: Callable[..., object] = _run_now,
+        download: Callable[[str], bytes] = _download,
+    ):
+        self._files = ThumbnailCache(os.path.join(directory, "files"), max_bytes)
+        self._index_path = os.path.join(directory, "index.json")
+        self._run = run
+        self._post = post
+        self._run_io = run_io
+        self._download = download
+        self._waiters: dict[str, list[ArtworkCallback]] = {}
+        self._index: OrderedDict[str, str] = OrderedDict(self._load_index())
+
+    def lookup(self, url: str) -> str | None:
+        """Return the cached file for ``url`` without downloading it."""
+        digest = self._index.get(url)
+        if digest is None:
+            return None
+        if (path := self._files.lookup(digest)) is None:
+            # Evicted by the byte budget
+            del self._index[url]
+            return None
+        self._index.move_to_end(url)
+        return path
+
+    def fetch(self, url: str, callback: ArtworkCallback):
+        """Pass the local file for ``url`` to ``callback``, or None on failure.
+
+        Cached files are delivered synchronously.
+        """
+        if (path := self.lookup(url)) is not None:
+            self._run_io(self._files.touch, self._index[url])
+            callback(path)
+            return
+
+        waiters = self._waiters.get(url)
+        if waiters is not None:
+            waiters.append(callback)
+            return
+        self._waiters[url] = [callback]
+        self._run(self._fetch, url)
+
+    def _fetch(self, url: str):
+        try:
+            data = self._download(url)
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+            # Another url may have brought the same image already
+            path = self._files.lookup(digest) or self._files.put(digest, data)
+        except Exception:
+            # Callers fall back to a placeholder
+            digest = path = None
+        self._post(self._deliver, url, digest, path)
+
+    def _deliver(self, url: str, digest: str | None, path: str | None):
+        if digest is not None:
+            self._index[url] = digest
+            self._index.move_to_end(url)
+            while len(self._index) > _MAX_INDEXED_URLS:
+                self._index.popitem(last=False)
+            self._run_io(self._save_index, list(self._index.items()))
+
+        for callback in self._waiters.pop(url, ()):
+            callback(path)
+        return False
+
+    def _load_index(self) -> list[tuple[str, str]]:
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return []
+        if not isinstance(entries, list):
+            return []
+        return [
+            (entry[0], entry[1])
+            for entry in entries
+            if isinstance(entry, list) and len(entry) == 2
+        ]
+
+    def _save_index(self, entries: list[tuple[str, str]]):
+        tmp_path = f"{self._index_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, self._index_path)
@@ -0,0 +1,151 @@
+"""Incremental filtering of clipboard history entries.
+
+Entries are folded once when loaded, and `sync` only folds entries added
+since. A query that extends the last completed one only re-checks that
+query's hits. Large histories are filtered in chunks through ``run`` (a
+worker) and every chunk's hits are handed back through ``post`` (the main
+loop), so typing never waits for a full scan.
+"""
+
+from collections.abc import Callable, Iterable
+
+# Records filtered between two posts back to the caller
+CHUNK_SIZE = 250
+
+# Candidate counts from which filtering leaves the calling thread; kept
+# below CLIPBOARD_MAX_ENTRIES so a full history is streamed
+ASYNC_THRESHOLD = 500
+
+# (entry id, case-folded preview, kind)
+SearchRecord = tuple[int, str, str]
+
+
+def _call_now(target: Callable, *args):
+    target(*args)
+
+
+class ClipboardSearch:
+    """Streams the ids of entries whose preview contains the query."""
+
+    __slots__ = (
+        "_generation",
+        "_hits",
+        "_post",
+        "_query",
+        "_records",
+        "_run",
+    )
+
+    def __init__(
+        self,
+        run: Callable[..., object] = _call_now,
+        post: Callable[..., object] = _call_now,
+    ):
+        self._run = run
+        self._post = post
+        self._records: list[SearchRecord] = []
+        self._query: str | None = None
+        self._hits: list[SearchRecord] = []
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def load(self, entries: Iterable):
+        """Replace the searchable entries, newest first."""
+        self._records = [
+            (entry.id, entry.preview.casefold(), entry.kind) for entry in entries
+        ]
+        self._query = None
+        self._hits = []
+        self.cancel()
+
+    def sync(self, entries: list):
+        """Catch up with ``entries`` (newest first) without refolding them all."""
+        if not self._records:
+            self.load(entries)
+            return
+        live = {entry.id for entry in entries}
+        known = {record[0] for record in self._records}
+        if stale := known - live:
+            self.remove(stale)
+        # New entries only ever appear on top
+        for entry in reversed([entry for entry in entries if entry.id not in known]):
+            self.add(entry)
+
+    def add(self, entry):
+        """Index ``entry`` as the newest one."""
+        record = (entry.id, entry.preview.casefold(), entry.kind)
+        self._records.insert(0, record)
+        # Keep the last hits valid as a base for extended queries
+        if self._query is not None and self._query in record[1]:
+            self._hits.insert(0, record)
+        self.cancel()
+
+    def remove(self, entry_ids: Iterable[int]):
+        """Forget the entries with ``entry_ids``."""
+        entry_ids = set(entry_ids)
+        self._records = [r for r in self._records if r[0] not in entry_ids]
+        self._hits = [r for r in self._hits if r[0] not in entry_ids]
+        self.cancel()
+
+    def cancel(self):
+        """Drop the results of a search still in flight."""
+        self._generation += 1
+
+    def search(
+        self,
+        query: str,
+        on_chunk: Callable[[list[int]], object],
+        on_done: Callable[[], object] | None = None,
+    ):
+        """Call ``on_chunk`` with matching ids in order, then ``on_done``."""
+        self.cancel()
+        generation = self._generation
+        folded = query.casefold()
+
+        if self._query is not None and folded.startswith(self._query):
+            candidates = self._hits
+        else:
+            candidates = self._records
+
+        if len(candidates) < ASYNC_THRESHOLD:
+            hits = [record for record in candidates if folded in record[1]]
+            self._finish(generation, folded, hits, on_chunk, on_done)
+            return
+
+        def scan():
+            hits = []
+            for start in range(0, len(candidates), CHUNK_SIZE):
+                if generation != self._generation:
+                    return
+                chunk = [
+                    record
+                    for record in candidates[start : start + CHUNK_SIZE]
+                    if folded in record[1]
+                ]
+                if chunk:
+                    hits.extend(chunk)
+                    self._post(self._deliver, generation, chunk, on_chunk)
+            self._post(self._complete, generation, folded, hits, on_done)
+
+        self._run(scan)
+
+    def _finish(self, generation, folded, hits, on_chunk, on_done):
+        if hits:
+            on_chunk([record[0] for record in hits])
+        self._complete(generation, folded, hits, on_done)
+
+    def _deliver(self, generation, chunk, on_chunk):
+        if generation == self._generation:
+            on_chunk([record[0] for record in chunk])
+        return False
+
+    def _complete(self, generation, folded, hits, on_done):
+        if generation != self._generation:
+            return False
+        self._query = folded
+        self._hits = hits
+        if on_done is not None:
+            on_done()
+        return False
@@ -0,0 +1,320 @@
+"""Append-only clipboard history store.
+
+Entries live in memory, newest first. Every change is appended to a JSON
+lines journal and contents are kept as one blob file per content hash, so
+copying the same thing twice only moves its entry to the top. The journal
+is rewritten once it holds far more records than live entries. Disk work
+goes through ``run_io`` so callers can move it off their thread; it must
+run tasks in submission order.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import time
+from collections.abc import Callable
+
+# Rewrite the journal when dead records outnumber live entries by this much
+_COMPACT_SLACK = 64
+
+# Characters of text content kept in memory for display and search
+PREVIEW_CHARS = 256
+
+
+class ClipboardEntry:
+    """Metadata of one history entry; the content stays on disk."""
+
+    __slots__ = ("created", "digest", "id", "kind", "preview", "size")
+
+    def __init__(
+        self,
+        entry_id: int,
+        digest: str,
+        kind: str,
+        created: float,
+        size: int,
+        preview: str,
+    ):
+        self.id = entry_id
+        self.digest = digest
+        self.kind = kind
+        self.created = created
+        self.size = size
+        self.preview = preview
+
+    def __repr__(self) -> str:
+        return f"ClipboardEntry({self.id}, {self.kind!r}, {self.preview[:20]!r})"
+
+    def to_record(self) -> dict:
+        return {
+            "op": "add",
+            "id": self.id,
+            "digest": self.digest,
+            "kind": self.kind,
+            "time": self.created,
+            "size": self.size,
+            "preview": self.preview,
+        }
+
+
+def _run_now(target: Callable, *args):
+    target(*args)
+
+
+def parse_cliphist_listing(listing: str) -> list[tuple[str, str]]:
+    """Return the ``(id, preview)`` pairs of ``cliphist list``, oldest first.
+
+    cliphist lists its newest entry first; adding the pairs in the returned
+    order leaves the newest one on top of the store.
+    """
+    pairs = []
+    for line in reversed(listing.splitlines()):
+        entry_id, tab, preview = line.partition("\t")
+        if tab:
+            pairs.append((entry_id, preview))
+    return pairs
+
+
+class ClipboardStore:
+    """Clipboard entries with content-hash dedup and count, size and age caps."""
+
+    __slots__ = (
+        "_blob_dir",
+        "_by_digest",
+        "_by_id",
+        "_journal_path",
+        "_journal_records",
+        "_next_id",
+        "_run_io",
+        "entries",
+        "max_age",
+        "max_bytes",
+        "max_entries",
+        "total_bytes",
+    )
+
+    def __init__(
+        self,
+        directory: str,
+        max_entries: int = 1000,
+        max_bytes: int = 256 * 1024 * 1024,
+        max_age: float | None = None,
+        run_io: Callable[..., object] = _run_now,
+    ):
+        self._blob_dir = os.path.join(directory, "blobs")
+        self._journal_path = os.path.join(directory, "history.jsonl")
+        self._run_io = run_io
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+        self.entries: list[ClipboardEntry] = []
+        self._by_id: dict[int, ClipboardEntry] = {}
+        self._by_digest: dict[str, ClipboardEntry] = {}
+        self._journal_records = 0
+        self._next_id = 1
+        self.total_bytes = 0
+
+        os.makedirs(self._blob_dir, exist_ok=True)
+        self._replay()
+        self.prune()
+        self._run_io(self._collect_orphan_blobs, set(self._by_digest))
+
+    @property
+    def is_new(self) -> bool:
+        """True when no journal existed, e.g. before an import."""
+        return self._journal_records == 0 and not self.entries
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def get(self, entry_id: int) -> ClipboardEntry | None:
+        return self._by_id.get(entry_id)
+
+    def blob_path(self, entry: ClipboardEntry) -> str:
+        return os.path.join(self._blob_dir, entry.digest)
+
+    def read(self, entry_id: int) -> bytes | None:
+        """Return the stored content of an entry."""
+        entry = self._by_id.get(entry_id)
+        if entry is None:
+            return None
+        try:
+            with open(self.blob_path(entry), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def add(
+        self,
+        data: bytes,
+        kind: str,
+        preview: str,
+        created: float | None = None,
+    ) -> ClipboardEntry:
+        """Add content as the newest entry; a duplicate moves to the top."""
+        digest = self.digest(data)
+        existing = self._by_digest.get(digest)
+        if existing is not None:
+            self._remove(existing, keep_blob=True)
+        else:
+            self._run_io(self._write_blob, digest, data)
+
+        entry = ClipboardEntry(
+            self._next_id,
+            digest,
+            kind,
+            time.time() if created is None else created,
+            len(data),
+            preview[:PREVIEW_CHARS],
+        )
+        self._next_id += 1
+        self._insert(entry)
+        self._append(entry.to_record())
+        if not self.prune():
+            self._maybe_compact()
+        return entry
+
+    def delete(self, entry_id: int) -> bool:
+        entry = self._by_id.get(entry_id)
+        if entry is None:
+            return False
+        self._remove(entry)
+        self._maybe_compact()
+        return True
+
+    def wipe(self):
+        for entry in self.entries:
+            self._run_io(self._remove_blob, entry.digest)
+        self.entries = []
+        self._by_id.clear()
+        self._by_digest.clear()
+        self.total_bytes = 0
+        self._append({"op": "wipe"})
+        self._maybe_compact()
+
+    def prune(self, now: float | None = None) -> list[ClipboardEntry]:
+        """Drop the oldest entries beyond the count, size and age caps."""
+        now = time.time() if now is None else now
+        removed = []
+        while self.entries:
+            oldest = self.entries[-1]
+            expired = self.max_age is not None and now - oldest.created > self.max_age
+            if not (
+                expired
+                or len(self.entries) > self.max_entries
+                or self.total_bytes > self.max_bytes
+            ):
+                break
+            self._remove(oldest)
+            removed.append(oldest)
+        if removed:
+            self._maybe_compact()
+        return removed
+
+    def search(self, query: str) -> list[ClipboardEntry]:
+        """Entries whose preview contains ``query``, ignoring case."""
+        folded = query.casefold()
+        if not folded:
+            return list(self.entries)
+        return [entry for entry in self.entries if folded in entry.preview.casefold()]
+
+    def _insert(self, entry: ClipboardEntry):
+        self.entries.insert(0, entry)
+        self._by_id[entry.id] = entry
+        self._by_digest[entry.digest] = entry
+        self.total_bytes += entry.size
+
+    def _remove(self, entry: ClipboardEntry, keep_blob: bool = False):
+        self.entries.remove(entry)
+        del self._by_id[entry.id]
+        del self._by_digest[entry.digest]
+        self.total_bytes -= entry.size
+        self._append({"op": "del", "id": entry.id})
+        if not keep_blob:
+            self._run_io(self._remove_blob, entry.digest)
+
+    def _replay(self):
+        try:
+            with open(self._journal_path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except OSError:
+            return
+
+        entries: dict[int, ClipboardEntry] = {}
+        torn = False
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A torn last line from a crash mid-append
+                torn = True
+                continue
+            self._journal_records += 1
+            op = record.get("op")
+            if op == "add":
+                entry = ClipboardEntry(
+                    record["id"],
+                    record["digest"],
+                    record["kind"],
+                    record["time"],
+                    record["size"],
+                    record["preview"],
+                )
+                entries[entry.id] = entry
+                self._next_id = max(self._next_id, entry.id + 1)
+            elif op == "del":
+                entries.pop(record.get("id"), None)
+            elif op == "wipe":
+                entries.clear()
+
+        # Journal order is oldest first
+        for entry in entries.values():
+            self._insert(entry)
+
+        if torn:
+            # Later appends would otherwise be glued onto the torn line
+            records = [entry.to_record() for entry in reversed(self.entries)]
+            self._journal_records = len(records)
+            self._run_io(self._rewrite_journal, records)
+
+    def _append(self, record: dict):
+        self._journal_records += 1
+        self._run_io(self._append_line, json.dumps(record, ensure_ascii=False))
+
+    def _maybe_compact(self):
+        if self._journal_records > 2 * len(self.entries) + _COMPACT_SLACK:
+            records = [entry.to_record() for entry in reversed(self.entries)]
+            self._journal_records = len(records)
+            self._run_io(self._rewrite_journal, records)
+
+    def _append_line(self, line: str):
+        with open(self._journal_path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+    def _rewrite_journal(self, records: list[dict]):
+        tmp_path = f"{self._journal_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self._journal_path)
+
+    def _write_blob(self, digest: str, data: bytes):
+        path = os.path.join(self._blob_dir, digest)
+        if not os.path.exists(path):
+            # A crash mid-write must not leave a torn blob under its hash
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+    def _remove_blob(self, digest: str):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(os.path.join(self._blob_dir, digest))
+
+    def _collect_orphan_blobs(self, live_digests: set[str]):
+        for name in os.listdir(self._blob_dir):
+            if name not in live_digests:
+                self._remove_blob(name)
@@ -11,6 +11,16 @@ NOTIFICATION_WIDTH = 400
 NOTIFICATION_IMAGE_SIZE = 78
 HIGH_POLL_INTERVAL = 3600  # 1 hour in seconds
 MONITOR_HOTPLUG_DELAY_MS = 500  # Delay for monitor hotplug recreation
+NOTIFICATION_WRITE_DELAY_MS = 500  # Batch history writes within this window
+NOTIFICATION_PIXBUF_CACHE_BYTES = 32 * 1024 * 1024  # Decoded image budget
+ICON_PIXBUF_CACHE_BYTES = 16 * 1024 * 1024  # Pixel memory budget for icons
+CLIPBOARD_MAX_ENTRIES = 1000  # Clipboard history entries kept
+CLIPBOARD_MAX_BYTES = 256 * 1024 * 1024  # Total clipboard history size
+CLIPBOARD_MAX_ENTRY_BYTES = 32 * 1024 * 1024  # Larger copies are not recorded
+CLIPBOARD_MAX_AGE_SECONDS = 30 * 24 * 3600  # 30 days
+CLIPBOARD_PREVIEW_SIZE = 40  # Image preview size in the clipboard menu rows
+CLIPBOARD_THUMBNAIL_CACHE_BYTES = 16 * 1024 * 1024  # Disk budget for previews
+ARTWORK_CACHE_BYTES = 64 * 1024 * 1024  # Disk budget for downloaded album art
 
 # Network service constants
 NETWORK_RECENCY_THRESHOLD_SECONDS = 300  # 5 minutes for WiFi network freshness
@@ -21,9 +31,17 @@ APP_DATA_DIRECTORY = f"{SYSTEM_CACHE_DIR}/{APPLICATION_NAME}"
 
 
 NOTIFICATION_CACHE_FILE = f"{APP_DATA_DIRECTORY}/notifications.json"
+NOTIFICATION_JOURNAL_FILE = f"{APP_DATA_DIRECTORY}/notifications.jsonl"
+NOTIFICATION_IMAGE_DIR = f"{APP_DATA_DIRECTORY}/notification_images"
+ARTWORK_CACHE_DIR = f"{APP_DATA_DIRECTORY}/media/artwork"
 WEATHER_CACHE_FILE = f"{APP_DATA_DIRECTORY}/weather.json"
 QUOTES_CACHE_FILE = f"{APP_DATA_DIRECTORY}/quotes.json"
 ICON_CACHE_FILE = f"{APP_DATA_DIRECTORY}/icons.json"
+DESKTOP_ENTRIES_CACHE_FILE = f"{APP_DATA_DIRECTORY}/desktop_entries.json"
+EMOJI_INDEX_FILE = f"{APP_DATA_DIRECTORY}/emoji.bin"
+EMOJI_RECENT_FILE = f"{APP_DATA_DIRECTORY}/emoji_recent.json"
+CLIPBOARD_HISTORY_DIR = f"{APP_DATA_DIRECTORY}/clipboard"
+CLIPBOARD_THUMBNAIL_DIR = f"{CLIPBOARD_HISTORY_DIR}/thumbnails"
 PINNED_APPS_FILE = f"{APP_DATA_DIRECTORY}/pinned_apps.json"
 KANBAN_FILE = f"{APP_DATA_DIRECTORY}/kanban.json"
 
@@ -399,6 +417,10 @@ DEFAULT_CONFIG = {
             "transition_type": "slide-left",
             "transition_duration": 350,
             "per_app_limits": {},
+            "max_visible": 5,  # Popups on screen at once, including "N more" cards
+            "burst_limit": 3,  # Popups an app may show back to back
+            "burst_interval": 1000,  # Milliseconds for an app to earn one more popup
+            "image_cache_mb": 32,  # Memory budget for scaled notification images
             "play_sound": False,
             "max_actions": 5,
             "dismiss_on_hover": False,
@@ -0,0 +1,375 @@
+"""Persistent index of parsed .desktop entries.
+
+Parsing every desktop file through Gio on each start is the slow part of
+loading applications. The index keeps the parsed fields of every entry on
+disk together with the mtime of each XDG ``applications`` directory and of
+each file, so a warm start only stats the directories. While running,
+`Gio.FileMonitor` re-parses just the files that were added or changed.
+"""
+
+import os
+import re
+from collections.abc import Callable
+
+import gi
+from fabric.utils import logger
+from gi.repository import GdkPixbuf, Gio, GLib, Gtk
+
+from .constants import DESKTOP_ENTRIES_CACHE_FILE
+from .functions import read_json_file, write_json_file
+from .thread import thread
+
+gi.require_versions({"Gtk": "3.0", "GdkPixbuf": "2.0"})
+
+_CACHE_VERSION = 1
+
+# Separators of desktop ids and window classes, e.g. org.gnome.Nautilus
+_TOKEN_SPLIT_RE = re.compile(r"[-._\s]+")
+
+# Coalesce bursts of file events (package installs touch many files)
+_RESCAN_DELAY_MS = 500
+
+_RECORD_FIELDS = (
+    "name",
+    "display_name",
+    "generic_name",
+    "description",
+    "executable",
+    "command_line",
+    "window_class",
+    "icon_name",
+    "keywords",
+    "categories",
+    "hidden",
+)
+
+
+def applications_dirs() -> list[str]:
+    """XDG application directories, highest precedence first."""
+    data_dirs = [GLib.get_user_data_dir(), *GLib.get_system_data_dirs()]
+    return list(dict.fromkeys(f"{path}/applications" for path in data_dirs))
+
+
+def _mtime(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _normalize(text: str) -> str:
+    return "".join(text.lower().split())
+
+
+def _parse_desktop_file(path: str) -> dict | None:
+    """Parse a desktop file into a plain, JSON-serializable record."""
+    try:
+        info = Gio.DesktopAppInfo.new_from_filename(path)
+    except Exception:
+        return None
+    if info is None:
+        return None
+
+    icon = info.get_icon()
+    return {
+        "name": info.get_name() or "",
+        "display_name": info.get_display_name() or "",
+        "generic_name": info.get_generic_name(),
+        "description": info.get_description(),
+        "executable": info.get_executable(),
+        "command_line": info.get_commandline(),
+        "window_class": info.get_startup_wm_class(),
+        "icon_name": icon.to_string() if icon else None,
+        "keywords": list(info.get_keywords() or ()),
+        "categories": [c for c in (info.get_categories() or "").split(";") if c],
+        "hidden": not info.should_show(),
+    }
+
+
+class DesktopEntry:
+    """A desktop application backed by a cached record.
+
+    Exposes the same attributes as fabric's `DesktopApp`; the
+    `Gio.DesktopAppInfo` is only created when the app is launched.
+    """
+
+    __slots__ = ("_info", "app_id", "mtime", "path", *_RECORD_FIELDS)
+
+    def __init__(self, app_id: str, path: str, mtime: int, record: dict):
+        self.app_id = app_id
+        self.path = path
+        self.mtime = mtime
+        self._info = None
+        for field in _RECORD_FIELDS:
+            setattr(self, field, record.get(field))
+
+    def __repr__(self) -> str:
+        return f"DesktopEntry({self.app_id!r})"
+
+    @property
+    def app_info(self) -> Gio.DesktopAppInfo | None:
+        if self._info is None:
+            self._info = Gio.DesktopAppInfo.new_from_filename(self.path)
+        return self._info
+
+    def get_icon_pixbuf(
+        self, size: int = 48, default_icon: str | None = "image-missing"
+    ) -> GdkPixbuf.Pixbuf | None:
+        icon_theme = Gtk.IconTheme.get_default()
+        for icon in (self.icon_name, default_icon):
+            if not icon:
+                continue
+            try:
+                if icon.startswith("/"):
+                    return GdkPixbuf.Pixbuf.new_from_file_at_size(icon, size, size)
+                return icon_theme.load_icon(
+                    icon, size, Gtk.IconLookupFlags.FORCE_SIZE
+                )
+            except GLib.Error:
+                continue
+        return None
+
+    def launch(self) -> bool:
+        info = self.app_info
+        if info is None:
+            logger.warning(f"[DesktopEntries] Cannot launch {self.path}")
+            return False
+        return info.launch([], None)
+
+
+class DesktopEntryIndex:
+    """Loads desktop entries from the on-disk cache and keeps them current.
+
+    Shared by every consumer, so the directories are only watched once.
+    """
+
+    __slots__ = (
+        "_by_id",
+        "_by_token",
+        "_dir_mtimes",
+        "_entries",
+        "_files",
+        "_listeners",
+        "_monitors",
+        "_pending_dirs",
+        "_rescan_id",
+        "applications",
+    )
+
+    _instance = None
+    _initialized = False
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if DesktopEntryIndex._initialized:
+            return
+        DesktopEntryIndex._initialized = True
+
+        # path -> (mtime, record or None for unparseable files)
+        self._files: dict[str, tuple[int, dict | None]] = {}
+        self._dir_mtimes: dict[str, int] = {}
+        self._entries: dict[str, DesktopEntry] = {}
+        self._by_id: dict[str, DesktopEntry] = {}
+        self._by_token: dict[str, DesktopEntry] = {}
+        self._listeners: list[Callable[[list, list], None]] = []
+        self._monitors: list[Gio.FileMonitor] = []
+        self._pending_dirs: set[str] = set()
+        self._rescan_id: int | None = None
+        self.applications: list[DesktopEntry] = []
+
+        self._load_cache()
+        self._rebuild_entries()
+        self.revalidate()
+        self._watch_directories()
+
+    def connect(self, callback: Callable[[list, list], None]):
+        """Call ``callback(removed, added)`` whenever entries change."""
+        self._listeners.append(callback)
+
+    def find(self, app_id: str) -> DesktopEntry | None:
+        """Find the desktop entry of a window class or app id in O(1).
+
+        The whole id is matched against desktop ids and StartupWMClass
+        values first, then it and each of its words against the words of
+        the desktop ids.
+        """
+        if not app_id:
+            return None
+        normalized = _normalize(app_id)
+        entry = self._by_id.get(normalized) or self._by_token.get(normalized)
+        if entry is not None:
+            return entry
+        for word in _TOKEN_SPLIT_RE.split(app_id.lower()):
+            if word and (entry := self._by_token.get(word)) is not None:
+                return entry
+        return None
+
+    def _load_cache(self):
+        if not os.path.exists(DESKTOP_ENTRIES_CACHE_FILE):
+            return
+        cache = read_json_file(DESKTOP_ENTRIES_CACHE_FILE)
+        if not isinstance(cache, dict) or cache.get("version") != _CACHE_VERSION:
+            return
+        self._dir_mtimes = cache.get("dirs", {})
+        self._files = {
+            path: (item["mtime"], item["record"])
+            for path, item in cache.get("files", {}).items()
+        }
+
+    def _save_cache(self):
+        data = {
+            "version": _CACHE_VERSION,
+            "dirs": dict(self._dir_mtimes),
+            "files": {
+                path: {"mtime": mtime, "record": record}
+                for path, (mtime, record) in self._files.items()
+            },
+        }
+        thread(write_json_file, DESKTOP_ENTRIES_CACHE_FILE, data)
+
+    def revalidate(self, dirs: list[str] | None = None) -> tuple[list, list]:
+        """Re-parse entries in directories whose mtime changed.
+
+        Returns the ``(removed, added)`` visible applications, which is
+        empty when nothing changed on disk.
+        """
+        changed = False
+        for directory in dirs or applications_dirs():
+            mtime = _mtime(directory)
+            if mtime == self._dir_mtimes.get(directory):
+                continue
+            changed |= self._rescan_directory(directory, mtime)
+
+        if not changed:
+            return [], []
+
+        diff = self._rebuild_entries()
+        self._save_cache()
+        return diff
+
+    def _rescan_directory(self, directory: str, mtime: int | None) -> bool:
+        prefix = directory + "/"
+        known = {path for path in self._files if path.startswith(prefix)}
+        found: set[str] = set()
+        changed = False
+
+        if mtime is None:
+            self._dir_mtimes.pop(directory, None)
+        else:
+            self._dir_mtimes[directory] = mtime
+            for root, _, filenames in os.walk(directory):
+                for filename in filenames:
+                    if not filename.endswith(".desktop"):
+                        continue
+                    path = os.path.join(root, filename)
+                    file_mtime = _mtime(path)
+                    if file_mtime is None:
+                        continue
+                    found.add(path)
+                    cached = self._files.get(path)
+                    if cached is None or cached[0] != file_mtime:
+                        self._files[path] = (file_mtime, _parse_desktop_file(path))
+                        changed = True
+
+        for path in known - found:
+            del self._files[path]
+            changed = True
+        return changed
+
+    def _rebuild_entries(self) -> tuple[list, list]:
+        """Resolve desktop ids by directory precedence and diff the result."""
+        entries: dict[str, DesktopEntry] = {}
+        for directory in applications_dirs():
+            prefix = directory + "/"
+            for path, (mtime, record) in self._files.items():
+                if not path.startswith(prefix) or record is None:
+                    continue
+                app_id = path[len(prefix) :].replace("/", "-")
+                if app_id in entries:
+                    continue
+                current = self._entries.get(app_id)
+                if (
+                    current is not None
+                    and current.path == path
+                    and current.mtime == mtime
+                ):
+                    entries[app_id] = current
+                    continue
+                entries[app_id] = DesktopEntry(app_id, path, mtime, record)
+
+        self._entries = entries
+        self._index_tokens()
+
+        # The diff covers visible applications only, hidden entries are
+        # reachable through `find` but never listed
+        previous = self.applications
+        # A new list object lets consumers detect the change by identity
+        self.applications = sorted(
+            (entry for entry in entries.values() if not entry.hidden),
+            key=lambda entry: (entry.display_name or entry.name).casefold(),
+        )
+        previous_ids = set(map(id, previous))
+        current_ids = set(map(id, self.applications))
+        removed = [entry for entry in previous if id(entry) not in current_ids]
+        added = [entry for entry in self.applications if id(entry) not in previous_ids]
+        return removed, added
+
+    def _index_tokens(self):
+        """Map desktop ids, their words and window classes to entries."""
+        by_id: dict[str, DesktopEntry] = {}
+        by_token: dict[str, DesktopEntry] = {}
+
+        # Entries are in precedence order, the first claim on a key wins
+        for app_id, entry in self._entries.items():
+            stem = _normalize(app_id.removesuffix(".desktop"))
+            by_id.setdefault(stem, entry)
+            if entry.window_class:
+                by_id.setdefault(_normalize(entry.window_class), entry)
+            for token in _TOKEN_SPLIT_RE.split(stem):
+                if token:
+                    by_token.setdefault(token, entry)
+
+        self._by_id = by_id
+        self._by_token = by_token
+
+    def _watch_directories(self):
+        for directory in applications_dirs():
+            if not os.path.isdir(directory):
+                continue
+            try:
+                monitor = Gio.File.new_for_path(directory).monitor_directory(
+                    Gio.FileMonitorFlags.WATCH_MOVES, None
+                )
+            except GLib.Error as e:
+                logger.warning(f"[DesktopEntries] Cannot watch {directory}: {e}")
+                continue
+            monitor.connect("changed", self._on_directory_changed, directory)
+            self._monitors.append(monitor)
+
+    def _on_directory_changed(self, _monitor, file, _other, _event, directory):
+        if not (file.get_basename() or "").endswith(".desktop"):
+            return
+        self._pending_dirs.add(directory)
+        if self._rescan_id is None:
+            self._rescan_id = GLib.timeout_add(_RESCAN_DELAY_MS, self._flush_changes)
+
+    def _flush_changes(self):
+        self._rescan_id = None
+        dirs, self._pending_dirs = list(self._pending_dirs), set()
+
+        # In-place edits do not bump the directory mtime
+        for directory in dirs:
+            self._dir_mtimes.pop(directory, None)
+
+        removed, added = self.revalidate(dirs)
+        if removed or added:
+            logger.info(
+                f"[DesktopEntries] {len(added)} added/changed, {len(removed)} removed"
+            )
+            for callback in self._listeners:
+                callback(removed, added)
+        return False
@@ -0,0 +1,248 @@
+"""Compact, memory-mapped emoji database with a word prefix index.
+
+`build_emoji_index` compiles ``assets/emoji.json`` into a single binary
+file. `EmojiIndex` maps it and answers queries without parsing anything up
+front, so opening the picker costs a ``mmap`` call.
+
+File layout (native byte order, it is a local build artifact)::
+
+    header            magic, version, emoji count, word count
+    string offsets    u32 * (3 * count + 1)  char, name, group per emoji
+    word offsets      u32 * (words + 1)      sorted, distinct words
+    posting offsets   u32 * (words + 1)      into the postings array
+    string blob       utf-8
+    word blob         utf-8
+    postings          u16 emoji ids per word
+"""
+
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+from collections.abc import Iterable
+
+_MAGIC = b"EMJI"
+_VERSION = 1
+_HEADER = struct.Struct("=4sIII")
+
+# Postings store emoji ids as u16
+_MAX_EMOJIS = 1 << 16
+
+_WORD_RE = re.compile(r"\w+")
+
+# Ranking, highest wins
+_EXACT_NAME = 3
+_NAME_PREFIX = 2
+_NAME_WORD = 1
+
+
+def _words(text: str) -> list[str]:
+    return _WORD_RE.findall(text.casefold())
+
+
+def build_emoji_index(source: str, destination: str):
+    """Compile the emoji JSON at ``source`` into an index at ``destination``."""
+    with open(source, "r", encoding="utf-8") as f:
+        emojis = json.load(f)
+    if len(emojis) > _MAX_EMOJIS:
+        raise ValueError(f"{len(emojis)} emojis do not fit the u16 ids of the index")
+
+    strings: list[bytes] = []
+    postings: dict[str, list[int]] = {}
+
+    for emoji_id, (char, info) in enumerate(emojis.items()):
+        name = info.get("name", "")
+        group = info.get("group", "")
+        strings += (char.encode(), name.encode(), group.encode())
+        for word in dict.fromkeys(_words(f"{name} {group}")):
+            postings.setdefault(word, []).append(emoji_id)
+
+    words = sorted(postings)
+    encoded_words = [word.encode() for word in words]
+
+    def offsets(chunks: Iterable[int]) -> list[int]:
+        table = [0]
+        for length in chunks:
+            table.append(table[-1] + length)
+        return table
+
+    string_offsets = offsets(map(len, strings))
+    word_offsets = offsets(map(len, encoded_words))
+    posting_offsets = offsets(len(postings[word]) for word in words)
+
+    tmp_path = f"{destination}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, len(emojis), len(words)))
+        for table in (string_offsets, word_offsets, posting_offsets):
+            f.write(struct.pack(f"={len(table)}I", *table))
+        f.write(b"".join(strings))
+        f.write(b"".join(encoded_words))
+        for word in words:
+            f.write(struct.pack(f"={len(postings[word])}H", *postings[word]))
+    os.replace(tmp_path, destination)
+
+
+def ensure_emoji_index(source: str, destination: str) -> str:
+    """Rebuild ``destination`` when it is missing or older than ``source``."""
+    try:
+        stale = os.path.getmtime(destination) < os.path.getmtime(source)
+    except OSError:
+        stale = True
+    if stale:
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        build_emoji_index(source, destination)
+    return destination
+
+
+class EmojiIndex:
+    """Read-only view over a compiled emoji index."""
+
+    __slots__ = (
+        "_char_ids",
+        "_count",
+        "_map",
+        "_posting_offsets",
+        "_postings",
+        "_string_offsets",
+        "_strings",
+        "_word_count",
+        "_word_offsets",
+        "_words",
+    )
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, word_count = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"Not an emoji index: {path}")
+
+        view = memoryview(self._map)
+        position = _HEADER.size
+
+        def table(length: int, fmt: str, start: int) -> memoryview:
+            size = length * struct.calcsize(fmt)
+            return view[start : start + size].cast(fmt)
+
+        self._char_ids: dict[str, int] | None = None
+        self._count = count
+        self._word_count = word_count
+        self._string_offsets = table(3 * count + 1, "I", position)
+        position += len(self._string_offsets) * 4
+        self._word_offsets = table(word_count + 1, "I", position)
+        position += len(self._word_offsets) * 4
+        self._posting_offsets = table(word_count + 1, "I", position)
+        position += len(self._posting_offsets) * 4
+
+        strings_size = self._string_offsets[-1]
+        self._strings = view[position : position + strings_size]
+        position += strings_size
+        words_size = self._word_offsets[-1]
+        self._words = view[position : position + words_size]
+        position += words_size
+        self._postings = table(self._posting_offsets[-1], "H", position)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _string(self, string_id: int) -> str:
+        start = self._string_offsets[string_id]
+        end = self._string_offsets[string_id + 1]
+        return str(self._strings[start:end], "utf-8")
+
+    def char(self, emoji_id: int) -> str:
+        return self._string(3 * emoji_id)
+
+    def name(self, emoji_id: int) -> str:
+        return self._string(3 * emoji_id + 1)
+
+    def group(self, emoji_id: int) -> str:
+        return self._string(3 * emoji_id + 2)
+
+    def find(self, char: str) -> int | None:
+        """Return the id of ``char``; the reverse map is built on first use."""
+        if self._char_ids is None:
+            self._char_ids = {
+                self.char(emoji_id): emoji_id for emoji_id in range(self._count)
+            }
+        return self._char_ids.get(char)
+
+    def _word(self, word_id: int) -> bytes:
+        start = self._word_offsets[word_id]
+        end = self._word_offsets[word_id + 1]
+        return bytes(self._words[start:end])
+
+    def _lower_bound(self, key: bytes) -> int:
+        low, high = 0, self._word_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._word(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def prefix_matches(self, prefix: str) -> set[int]:
+        """Ids of emojis with a name or group word starting with ``prefix``."""
+        key = prefix.encode()
+        matches: set[int] = set()
+        word_id = self._lower_bound(key)
+        while word_id < self._word_count and self._word(word_id).startswith(key):
+            start = self._posting_offsets[word_id]
+            end = self._posting_offsets[word_id + 1]
+            matches.update(self._postings[start:end])
+            word_id += 1
+        return matches
+
+    def search(self, query: str, recent: Iterable[str] = ()) -> list[int]:
+        """Return emoji ids matching every word of ``query``, best first.
+
+        Exact names rank first, then names starting with the query, then
+        names containing a matching word, then group-only matches. Recently
+        used emojis (most recent first) win ties. An empty query returns
+        the recent emojis followed by everything in file order.
+        """
+        recent_rank = {char: rank for rank, char in enumerate(recent)}
+        terms = _words(query)
+
+        if not terms:
+            ids = [
+                emoji_id
+                for char in recent_rank
+                if (emoji_id := self.find(char)) is not None
+            ]
+            seen = set(ids)
+            ids.extend(i for i in range(self._count) if i not in seen)
+            return ids
+
+        candidates = self.prefix_matches(terms[0])
+        for term in terms[1:]:
+            if not candidates:
+                break
+            candidates &= self.prefix_matches(term)
+
+        folded = " ".join(terms)
+        no_rank = len(recent_rank)
+        scored = []
+        for emoji_id in candidates:
+            name = self.name(emoji_id).casefold()
+            if name == folded:
+                score = _EXACT_NAME
+            elif name.startswith(folded):
+                score = _NAME_PREFIX
+            elif any(word.startswith(terms[0]) for word in _words(name)):
+                score = _NAME_WORD
+            else:
+                score = 0
+            rank = recent_rank.get(self.char(emoji_id), no_rank)
+            scored.append((-score, rank, emoji_id))
+
+        scored.sort()
+        return [emoji_id for _, _, emoji_id in scored]
+
+
+if __name__ == "__main__":
+    build_emoji_index(*sys.argv[1:3])
@@ -6,7 +6,6 @@ import re
 import shutil
 import subprocess
 import time
-from collections import Counter
 from datetime import datetime
 from functools import lru_cache
 from io import BytesIO
@@ -30,7 +29,8 @@ from .colors import Colors
 from .constants import NAMED_COLORS
 from .exceptions import ExecutableNotFoundError
 from .icons import text_icons
-from .thread import run_in_thread, thread
+from .palette import PaletteCache
+from .thread import run_in_thread, thread, thread_cpu
 
 gi.require_versions({"Gtk": "3.0", "Gdk": "3.0", "GdkPixbuf": "2.0"})
 
@@ -125,19 +125,16 @@ def delayed_call_seconds(
     return delayed_call(int(delay_seconds * 1000), callback, *args, **kwargs)
 
 
-def _pillow_worker(image_path, callback, color_count, resize):
-    try:
-        from PIL import Image
-
-        with Image.open(image_path) as img:
-            img = img.convert("RGB")
-            img.thumbnail((resize, resize), Image.LANCZOS)  # Fast, in-place resize
-            pixels = img.getdata()
+# Shared by everything that derives colors from an image
+palette_cache = PaletteCache()
 
-            most_common = Counter(pixels).most_common(color_count)
-            palette = [color for color, _ in most_common]
 
-            GLib.idle_add(callback, palette)
+def _pillow_worker(image_path, callback, color_count, resize):
+    try:
+        with open(image_path, "rb") as f:
+            data = f.read()
+        palette = palette_cache.palette_for(data, color_count, resize)
+        GLib.idle_add(callback, palette)
     except Exception as e:
         logger.exception(f"Error generating color palette: {e}")
         GLib.idle_add(callback, None)
@@ -150,7 +147,7 @@ def get_simple_palette_threaded(
     color_count: int = 4,
     resize: int = 64,
 ):
-    thread(_pillow_worker, image_path, callback, color_count, resize)
+    thread_cpu(_pillow_worker, image_path, callback, color_count, resize)
 
 
 # Function to escape the markup
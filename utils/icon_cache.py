@@ -0,0 +1,87 @@
+from collections.abc import Iterable
+
+import gi
+from fabric.utils import logger
+from gi.repository import GdkPixbuf, GLib, Gtk
+
+from .constants import ICON_PIXBUF_CACHE_BYTES
+from .icon_store import IconStore
+
+gi.require_versions({"Gtk": "3.0", "GdkPixbuf": "2.0"})
+
+
+def _load_icon(icon: str, size: int, scale: int) -> GdkPixbuf.Pixbuf | None:
+    try:
+        if icon.startswith("/"):
+            return GdkPixbuf.Pixbuf.new_from_file_at_size(
+                icon, size * scale, size * scale
+            )
+        return Gtk.IconTheme.get_default().load_icon_for_scale(
+            icon, size, scale, Gtk.IconLookupFlags.FORCE_SIZE
+        )
+    except GLib.Error as e:
+        logger.debug(f"[ICONS] Cannot load '{icon}' at {size}px: {e}")
+        return None
+
+
+class IconCache:
+    """Singleton cache of icon pixbufs shared by every widget.
+
+    Backed by an `IconStore` under ICON_PIXBUF_CACHE_BYTES. Everything is
+    dropped when the icon theme changes.
+    """
+
+    __slots__ = ("_store",)
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._store = IconStore(ICON_PIXBUF_CACHE_BYTES, _load_icon)
+            Gtk.IconTheme.get_default().connect(
+                "changed", lambda *_: cls._instance.clear()
+            )
+        return cls._instance
+
+    @property
+    def size(self) -> int:
+        """Bytes currently accounted to cached pixbufs."""
+        return self._store.size
+
+    def clear(self):
+        self._store.clear()
+
+    def get_icon(
+        self, icon: str | None, size: int, scale: int = 1
+    ) -> GdkPixbuf.Pixbuf | None:
+        """Return ``icon`` (a theme name or file path) at ``size``, or None."""
+        if not icon:
+            return None
+        return self._store.get(icon, size, scale)
+
+    def peek(self, key: tuple) -> tuple[bool, GdkPixbuf.Pixbuf | None]:
+        """Return ``(found, pixbuf)``; a cached miss is ``(True, None)``."""
+        return self._store.peek(key)
+
+    def store(self, key: tuple, pixbuf: GdkPixbuf.Pixbuf | None):
+        """Cache ``pixbuf`` (or a miss) under ``key`` and evict if needed."""
+        self._store.store(key, pixbuf)
+
+    def lookup(
+        self, icons: Iterable[str | None], size: int, scale: int = 1
+    ) -> GdkPixbuf.Pixbuf | None:
+        """Return the first of ``icons`` that can be loaded."""
+        for icon in icons:
+            pixbuf = self.get_icon(icon, size, scale)
+            if pixbuf is not None:
+                return pixbuf
+        return None
+
+    def get_app_icon(
+        self, app, size: int, scale: int = 1
+    ) -> GdkPixbuf.Pixbuf | None:
+        """Return the icon of a desktop app, falling back to image-missing."""
+        return self.lookup(
+            (getattr(app, "icon_name", None), "image-missing"), size, scale
+        )
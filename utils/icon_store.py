@@ -0,0 +1,92 @@
+"""Byte-budgeted LRU store behind the shared icon cache.
+
+Icons are keyed by (icon name or file path, size, scale factor); file
+icons also by their mtime and size, so an icon rewritten in place is
+loaded again. Failed loads are remembered as misses, so a missing icon
+does not walk the theme again. Once the accounted bytes exceed the
+budget, the least recently used entries are evicted, misses included.
+"""
+
+import os
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+# Accounted size of a remembered miss, so misses are also evicted in time
+_MISS_COST = 64
+
+
+def _byte_length(pixbuf: Any) -> int:
+    return pixbuf.get_byte_length()
+
+
+class IconStore:
+    """Icon pixbufs and misses under a byte budget."""
+
+    __slots__ = ("_entries", "_load", "_max_bytes", "_size", "_sizeof")
+
+    def __init__(
+        self,
+        max_bytes: int,
+        load: Callable[[str, int, int], Any | None],
+        sizeof: Callable[[Any], int] = _byte_length,
+    ):
+        self._max_bytes = max_bytes
+        self._load = load
+        self._sizeof = sizeof
+        self._entries: OrderedDict[tuple, tuple[Any | None, int]] = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Bytes currently accounted to cached pixbufs and misses."""
+        return self._size
+
+    def clear(self):
+        self._entries.clear()
+        self._size = 0
+
+    def get(self, icon: str, size: int, scale: int = 1) -> Any | None:
+        """Return ``icon`` (a theme name or file path) at ``size``, or None."""
+        if icon.startswith("file://"):
+            icon = icon[7:]
+        if icon.startswith("/"):
+            try:
+                stat = os.stat(icon)
+            except OSError:
+                return None
+            key = (icon, size, scale, stat.st_mtime_ns, stat.st_size)
+        else:
+            key = (icon, size, scale)
+
+        found, pixbuf = self.peek(key)
+        if not found:
+            pixbuf = self._load(icon, size, scale)
+            self.store(key, pixbuf)
+        return pixbuf
+
+    def peek(self, key: tuple) -> tuple[bool, Any | None]:
+        """Return ``(found, pixbuf)``; a cached miss is ``(True, None)``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        self._entries.move_to_end(key)
+        return True, entry[0]
+
+    def store(self, key: tuple, pixbuf: Any | None):
+        """Cache ``pixbuf`` (or a miss) under ``key`` and evict if needed."""
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= previous[1]
+
+        cost = self._sizeof(pixbuf) if pixbuf is not None else _MISS_COST
+        self._entries[key] = (pixbuf, cost)
+        self._size += cost
+
+        # The newest entry is kept even if it alone exceeds the budget
+        while self._size > self._max_bytes and len(self._entries) > 1:
+            _, (_, evicted_cost) = self._entries.popitem(last=False)
+            self._size -= evicted_cost
@@ -0,0 +1,152 @@
+"""Asynchronous image decoding.
+
+Decoding a large SVG or reading from a cold disk on the GTK main thread
+stalls the bar. `ImageLoader` decodes and scales in the shared thread pool
+and hands the pixbuf back on the main loop. Callers show a placeholder in
+the meantime.
+"""
+
+import os
+from collections.abc import Callable
+from functools import partial
+
+import gi
+from fabric.utils import logger
+from gi.repository import GdkPixbuf, GLib, Gtk
+
+from .icon_cache import IconCache
+from .thread import thread
+
+gi.require_versions({"Gtk": "3.0", "GdkPixbuf": "2.0"})
+
+PixbufCallback = Callable[[GdkPixbuf.Pixbuf | None], None]
+
+
+def _decode_file(path: str, width: int, height: int) -> GdkPixbuf.Pixbuf | None:
+    try:
+        return GdkPixbuf.Pixbuf.new_from_file_at_size(path, width, height)
+    except GLib.Error as e:
+        logger.debug(f"[ImageLoader] Cannot decode '{path}': {e}")
+        return None
+
+
+class ImageLoader:
+    """Singleton that loads images in a worker and delivers them on the main loop.
+
+    Concurrent requests for the same key share one decode. Callbacks tied to
+    an ``owner`` widget are dropped once it is destroyed.
+    """
+
+    __slots__ = ("_waiters",)
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._waiters = {}
+        return cls._instance
+
+    def load(
+        self,
+        source: str | None,
+        size: int | tuple[int, int],
+        callback: PixbufCallback,
+        owner: Gtk.Widget | None = None,
+        scale: int = 1,
+    ):
+        """Load an icon name, file path or ``file://`` uri at ``size``.
+
+        ``size`` is a square size or a ``(width, height)`` where -1 keeps the
+        aspect ratio. Results are kept in the shared `IconCache`, so a cached
+        image is delivered synchronously. Files are keyed by mtime as well,
+        so an image rewritten in place is decoded again.
+        """
+        if not source:
+            callback(None)
+            return
+
+        path = source[7:] if source.startswith("file://") else source
+
+        if path.startswith("/"):
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                callback(None)
+                return
+            width, height = (size, size) if isinstance(size, int) else size
+            width = width * scale if width > 0 else -1
+            height = height * scale if height > 0 else -1
+            key = (path, size, scale, mtime)
+            decode = partial(_decode_file, path, width, height)
+        else:
+            icon_size = size if isinstance(size, int) else max(size)
+            key = (path, icon_size, scale)
+            decode = None
+
+        found, pixbuf = IconCache().peek(key)
+        if found:
+            callback(pixbuf)
+            return
+
+        if decode is None:
+            info = Gtk.IconTheme.get_default().lookup_icon_for_scale(
+                path, icon_size, scale, Gtk.IconLookupFlags.FORCE_SIZE
+            )
+            filename = info.get_filename() if info is not None else None
+            if filename is None:
+                # Missing, or built into a resource: nothing to offload
+                callback(IconCache().get_icon(path, icon_size, scale))
+                return
+            pixels = icon_size * scale
+            decode = partial(_decode_file, filename, pixels, pixels)
+
+        self.submit(key, decode, callback, owner, cache=True)
+
+    def submit(
+        self,
+        key: tuple,
+        decode: Callable[[], GdkPixbuf.Pixbuf | None],
+        callback: PixbufCallback,
+        owner: Gtk.Widget | None = None,
+        cache: bool = False,
+    ):
+        """Run ``decode`` in a worker and pass its result to ``callback``.
+
+        ``decode`` must only touch GdkPixbuf, never GTK widgets.
+        """
+        waiter = [callback, owner, None]
+        if owner is not None:
+            waiter[2] = owner.connect(
+                "destroy", lambda *_: self._drop_waiter(key, waiter)
+            )
+
+        waiters = self._waiters.get(key)
+        if waiters is not None:
+            waiters.append(waiter)
+            return
+        self._waiters[key] = [waiter]
+        thread(self._decode, key, decode, cache)
+
+    def _decode(self, key: tuple, decode: Callable, cache: bool):
+        try:
+            pixbuf = decode()
+        except Exception as e:
+            logger.warning(f"[ImageLoader] Decoding {key[0]} failed: {e}")
+            pixbuf = None
+        GLib.idle_add(self._deliver, key, pixbuf, cache)
+
+    def _drop_waiter(self, key: tuple, waiter: list):
+        waiters = self._waiters.get(key)
+        if waiters is not None:
+            waiters[:] = [other for other in waiters if other is not waiter]
+
+    def _deliver(self, key: tuple, pixbuf: GdkPixbuf.Pixbuf | None, cache: bool):
+        if cache:
+            IconCache().store(key, pixbuf)
+
+        for callback, owner, handler_id in self._waiters.pop(key, ()):
+            if owner is not None:
+                owner.disconnect(handler_id)
+            callback(pixbuf)
+        return False
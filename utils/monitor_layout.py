@@ -0,0 +1,91 @@
+"""Monitor layout snapshots and the diff between two of them."""
+
+
+class MonitorInfo:
+    """Immutable snapshot of a single output."""
+
+    __slots__ = ("height", "index", "model", "name", "scale", "width", "x", "y")
+
+    def __init__(
+        self,
+        index: int,
+        name: str,
+        model: str,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        scale: int,
+    ):
+        self.index = index
+        self.name = name
+        self.model = model
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.scale = scale
+
+    @property
+    def geometry(self) -> tuple[int, int, int, int, int]:
+        return (self.x, self.y, self.width, self.height, self.scale)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MonitorInfo):
+            return NotImplemented
+        return (
+            self.index == other.index
+            and self.name == other.name
+            and self.geometry == other.geometry
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.index, self.name, self.geometry))
+
+    def __repr__(self) -> str:
+        return (
+            f"MonitorInfo({self.index}, {self.name!r}, "
+            f"{self.width}x{self.height}+{self.x}+{self.y}@{self.scale})"
+        )
+
+
+class MonitorDiff:
+    """Outputs added, removed or reconfigured between two layouts."""
+
+    __slots__ = ("added", "changed", "removed")
+
+    def __init__(
+        self,
+        added: tuple[MonitorInfo, ...] = (),
+        removed: tuple[MonitorInfo, ...] = (),
+        changed: tuple[MonitorInfo, ...] = (),
+    ):
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def __repr__(self) -> str:
+        return (
+            f"MonitorDiff(added={self.added}, removed={self.removed}, "
+            f"changed={self.changed})"
+        )
+
+
+def diff_monitors(
+    old: dict[str, MonitorInfo], new: dict[str, MonitorInfo]
+) -> MonitorDiff:
+    """Compare two name-keyed layouts.
+
+    A monitor whose index, position, size or scale changed is reported in
+    ``changed`` (with its new info) rather than as a remove/add pair.
+    """
+    return MonitorDiff(
+        added=tuple(info for name, info in new.items() if name not in old),
+        removed=tuple(info for name, info in old.items() if name not in new),
+        changed=tuple(
+            info for name, info in new.items() if name in old and old[name] != info
+        ),
+    )
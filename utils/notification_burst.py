@@ -0,0 +1,107 @@
+"""Rate limiting for notification popups.
+
+Each app gets a token bucket: it may show ``burst_limit`` popups back to
+back and earns another one every ``burst_interval_ms``. Notifications over
+the limit, or arriving while ``max_visible`` popups are already on screen,
+are folded into one "N more" card per app. When there is no room for that
+card either, the popup is dropped; the notification itself is still
+stored in the history.
+"""
+
+import time
+from collections.abc import Callable
+
+SHOW = "show"
+COALESCE = "coalesce"
+DROP = "drop"
+
+# Buckets of apps that have been idle long enough are pruned past this
+_MAX_TRACKED_APPS = 256
+
+
+class NotificationBurstLimiter:
+    """Decides whether a notification gets a popup, a group card or nothing."""
+
+    __slots__ = (
+        "_buckets",
+        "_clock",
+        "_groups",
+        "burst_limit",
+        "coalesced",
+        "dropped",
+        "interval",
+        "max_visible",
+        "shown",
+    )
+
+    def __init__(
+        self,
+        burst_limit: int = 3,
+        burst_interval_ms: int = 1000,
+        max_visible: int = 5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.burst_limit = max(burst_limit, 1)
+        self.interval = max(burst_interval_ms, 1) / 1000
+        self.max_visible = max(max_visible, 1)
+        self._clock = clock
+        # app name -> (tokens, time of last refill)
+        self._buckets: dict[str, tuple[float, float]] = {}
+        # app name -> notifications folded into its visible group card
+        self._groups: dict[str, int] = {}
+        self.shown = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    def admit(self, app_name: str, visible: int, urgent: bool = False) -> str:
+        """Return SHOW, COALESCE or DROP for a new notification.
+
+        ``visible`` counts the popups and group cards on screen. Critical
+        notifications are always shown.
+        """
+        if urgent or (visible < self.max_visible and self._take(app_name)):
+            self.shown += 1
+            return SHOW
+
+        # A new group card needs a free slot, an existing one is updated
+        if app_name in self._groups or visible < self.max_visible:
+            self._groups[app_name] = self._groups.get(app_name, 0) + 1
+            self.coalesced += 1
+            return COALESCE
+
+        self.dropped += 1
+        return DROP
+
+    def group_count(self, app_name: str) -> int:
+        return self._groups.get(app_name, 0)
+
+    def close_group(self, app_name: str) -> int:
+        """Forget the group card of ``app_name``, returning its count."""
+        return self._groups.pop(app_name, 0)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "shown": self.shown,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+        }
+
+    def _take(self, app_name: str) -> bool:
+        now = self._clock()
+        tokens, last = self._buckets.get(app_name, (self.burst_limit, now))
+        tokens = min(self.burst_limit, tokens + (now - last) / self.interval)
+        if tokens < 1:
+            self._buckets[app_name] = (tokens, now)
+            return False
+        if len(self._buckets) > _MAX_TRACKED_APPS:
+            self._prune(now)
+        self._buckets[app_name] = (tokens - 1, now)
+        return True
+
+    def _prune(self, now: float):
+        # Apps whose bucket has refilled behave as if never seen
+        self._buckets = {
+            app: (tokens, last)
+            for app, (tokens, last) in self._buckets.items()
+            if tokens + (now - last) / self.interval < self.burst_limit
+        }
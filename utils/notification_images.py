@@ -0,0 +1,127 @@
+"""Content-addressed storage for notification image payloads.
+
+Serialized notifications embed their image pixmap inline, so every
+notification from the same chat app carries the same icon again. The
+store moves the payload into a file named after its hash and leaves a
+reference in the record. Files are reference counted and removed once no
+record points at them; payloads are only read back when a notification is
+actually shown.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+from collections.abc import Callable
+
+# Serialized image pixmap keys, as written by fabric's Notification
+_PIXMAP_KEYS = ("image-pixmap", "image_pixmap")
+
+# Record key holding the content hash of the extracted pixmap
+IMAGE_REF_KEY = "image-ref"
+
+
+def _run_now(target: Callable, *args):
+    target(*args)
+
+
+class NotificationImageStore:
+    """Deduplicated image payload files referenced from notification records."""
+
+    __slots__ = ("_directory", "_refs", "_run_io")
+
+    def __init__(self, directory: str, run_io: Callable[..., object] = _run_now):
+        self._directory = directory
+        self._run_io = run_io
+        self._refs: dict[str, int] = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def path(self, digest: str) -> str:
+        return os.path.join(self._directory, digest)
+
+    def extract(self, record: dict) -> dict:
+        """Return ``record`` with its inline pixmap replaced by a reference.
+
+        Records that already hold a reference are retained as they are.
+        """
+        for key in _PIXMAP_KEYS:
+            payload = record.get(key)
+            if payload is not None:
+                break
+        else:
+            self.retain(record)
+            return record
+
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        if digest not in self._refs:
+            self._run_io(self._write, digest, data)
+
+        stripped = dict(record)
+        stripped[key] = None
+        stripped[IMAGE_REF_KEY] = digest
+        self.retain(stripped)
+        return stripped
+
+    def retain(self, record: dict):
+        if digest := record.get(IMAGE_REF_KEY):
+            self._refs[digest] = self._refs.get(digest, 0) + 1
+
+    def release(self, record: dict):
+        """Drop a record's reference, deleting the file when it was the last."""
+        digest = record.get(IMAGE_REF_KEY)
+        count = self._refs.get(digest, 0)
+        if count > 1:
+            self._refs[digest] = count - 1
+        elif count == 1:
+            del self._refs[digest]
+            self._run_io(self._remove, digest)
+
+    def release_all(self):
+        for digest in self._refs:
+            self._run_io(self._remove, digest)
+        self._refs.clear()
+
+    def restore(self, record: dict) -> dict:
+        """Return a copy of ``record`` with its pixmap loaded back inline."""
+        digest = record.get(IMAGE_REF_KEY)
+        if not digest:
+            return record
+
+        restored = dict(record)
+        del restored[IMAGE_REF_KEY]
+        try:
+            with open(self.path(digest), "rb") as f:
+                payload = json.loads(f.read())
+        except (OSError, ValueError):
+            # The image is lost, the notification itself is still valid
+            return restored
+
+        key = next((key for key in _PIXMAP_KEYS if key in record), _PIXMAP_KEYS[0])
+        restored[key] = payload
+        return restored
+
+    def collect_garbage(self):
+        """Remove files no live record refers to."""
+        self._run_io(self._collect, set(self._refs))
+
+    def _collect(self, live: set[str]):
+        for name in os.listdir(self._directory):
+            if name not in live:
+                self._remove(name)
+
+    def _write(self, digest: str, data: bytes):
+        path = self.path(digest)
+        if os.path.exists(path):
+            return
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _remove(self, digest: str):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.path(digest))
@@ -0,0 +1,184 @@
+"""Append-only persistence for the notification history.
+
+Every add, removal and clear is one JSON line. Changes made within the
+debounce window are written together, and the file is rewritten from the
+live records once dead lines outnumber them. Writes go through ``run_io``,
+which must run tasks in submission order; ``schedule`` arms the debounce
+timer. Replay tolerates a torn last line left by a crash mid-write.
+"""
+
+import json
+import os
+from collections.abc import Callable
+
+# Rewrite the journal when dead records outnumber live ones by this much
+_COMPACT_SLACK = 32
+
+
+def _run_now(target: Callable, *args):
+    target(*args)
+
+
+def _schedule_now(_delay_ms: int, callback: Callable[[], object]) -> int:
+    callback()
+    return 0
+
+
+class NotificationJournal:
+    """JSON lines log of notification records with batched writes.
+
+    ``snapshot`` returns the live records, oldest first, and the last id
+    handed out; it is only called to compact.
+    """
+
+    __slots__ = (
+        "_debounce_ms",
+        "_disk_records",
+        "_flush_id",
+        "_legacy_path",
+        "_path",
+        "_pending",
+        "_run_io",
+        "_schedule",
+        "_snapshot",
+    )
+
+    def __init__(
+        self,
+        path: str,
+        snapshot: Callable[[], tuple[list[dict], int]],
+        legacy_path: str | None = None,
+        debounce_ms: int = 500,
+        schedule: Callable[[int, Callable[[], object]], int] = _schedule_now,
+        run_io: Callable[..., object] = _run_now,
+    ):
+        self._path = path
+        self._snapshot = snapshot
+        self._legacy_path = legacy_path
+        self._debounce_ms = debounce_ms
+        self._schedule = schedule
+        self._run_io = run_io
+        self._pending: list[str] = []
+        self._flush_id = 0
+        self._disk_records = 0
+
+    def load(self) -> tuple[list[dict], int]:
+        """Replay the journal into records, oldest first, and the last id.
+
+        A legacy JSON array file is imported the first time.
+        """
+        records: dict[int, dict] = {}
+        last_id = 0
+        rewrite = False
+
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except OSError:
+            lines = None
+
+        if lines is None:
+            for record in self._load_legacy():
+                records[record["id"]] = record
+                last_id = max(last_id, record["id"])
+            rewrite = bool(records)
+        else:
+            for line in lines:
+                try:
+                    entry = json.loads(line)
+                    op = entry["op"]
+                    if op == "add":
+                        record = entry["data"]
+                        records[record["id"]] = record
+                        last_id = max(last_id, record["id"])
+                    elif op == "del":
+                        records.pop(entry["id"], None)
+                    elif op == "clear":
+                        records.clear()
+                        last_id = max(last_id, entry.get("last_id", 0))
+                except (ValueError, KeyError, TypeError):
+                    # Torn by a crash mid-write; appends must not follow it
+                    rewrite = True
+                    continue
+                self._disk_records += 1
+
+        ordered = sorted(records.values(), key=lambda record: record["id"])
+        if rewrite or self._needs_compaction(len(ordered)):
+            self._compact(ordered, last_id)
+        return ordered, last_id
+
+    def add(self, record: dict):
+        self._append({"op": "add", "data": record})
+
+    def remove(self, notification_id: int):
+        self._append({"op": "del", "id": notification_id})
+
+    def clear(self, last_id: int):
+        # Keeps ids unique across restarts once the history is empty
+        self._append({"op": "clear", "last_id": last_id})
+
+    def flush(self):
+        """Write pending changes now, compacting if the file is bloated."""
+        self._flush_id = 0
+        if not self._pending:
+            return False
+        lines, self._pending = self._pending, []
+        self._disk_records += len(lines)
+
+        records, last_id = self._snapshot()
+        if self._needs_compaction(len(records)):
+            self._compact(records, last_id)
+        else:
+            self._run_io(self._append_lines, lines)
+        return False
+
+    def compact(self):
+        """Rewrite the file from the live records, dropping pending lines."""
+        self._pending = []
+        records, last_id = self._snapshot()
+        self._compact(records, last_id)
+
+    def _append(self, entry: dict):
+        self._pending.append(json.dumps(entry, ensure_ascii=False))
+        if not self._flush_id:
+            self._flush_id = self._schedule(self._debounce_ms, self.flush) or 0
+
+    def _needs_compaction(self, live: int) -> bool:
+        return self._disk_records > 2 * live + _COMPACT_SLACK
+
+    def _compact(self, records: list[dict], last_id: int):
+        self._disk_records = len(records) + 1
+        # Serialized by the writer, so a large history does not block the caller
+        self._run_io(self._rewrite, list(records), last_id)
+
+    def _load_legacy(self) -> list[dict]:
+        if not self._legacy_path:
+            return []
+        try:
+            with open(self._legacy_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return []
+        if not isinstance(data, list):
+            return []
+        return [
+            record
+            for record in data
+            if isinstance(record, dict) and isinstance(record.get("id"), int)
+        ]
+
+    def _append_lines(self, lines: list[str]):
+        with open(self._path, "a", encoding="utf-8") as f:
+            f.write("".join(line + "\n" for line in lines))
+
+    def _rewrite(self, records: list[dict], last_id: int):
+        os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+        tmp_path = f"{self._path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"op": "clear", "last_id": last_id}) + "\n")
+            for record in records:
+                entry = {"op": "add", "data": record}
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self._path)
+        if self._legacy_path and os.path.exists(self._legacy_path):
+            os.remove(self._legacy_path)
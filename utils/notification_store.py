@@ -0,0 +1,110 @@
+"""Indexed in-memory notification history.
+
+Records are kept in an ordered id map, oldest first, plus a deque of ids
+per app. Removing a record leaves its id in the app deque; stale ids are
+skipped when trimming and the deque is rebuilt once they pile up, so
+insert, remove and both limits are O(1) amortized.
+"""
+
+from collections import OrderedDict, deque
+from collections.abc import Iterator
+
+# Rebuild an app's id deque once stale ids outnumber live ones by this much
+_STALE_SLACK = 16
+
+
+class NotificationRecord:
+    """A stored notification: its id, app and serialized data."""
+
+    __slots__ = ("app_name", "data", "id")
+
+    def __init__(self, data: dict):
+        self.id: int = data["id"]
+        self.app_name: str = data.get("app_name", "")
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"NotificationRecord({self.id}, {self.app_name!r})"
+
+
+class NotificationStore:
+    """Ordered id -> record map with per-app limits."""
+
+    __slots__ = ("_app_counts", "_by_app", "_records")
+
+    def __init__(self):
+        self._records: OrderedDict[int, NotificationRecord] = OrderedDict()
+        self._by_app: dict[str, deque[int]] = {}
+        self._app_counts: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[NotificationRecord]:
+        """Records, oldest first."""
+        return iter(self._records.values())
+
+    def __contains__(self, notification_id: int) -> bool:
+        return notification_id in self._records
+
+    def get(self, notification_id: int) -> NotificationRecord | None:
+        return self._records.get(notification_id)
+
+    def newest_first(self) -> list[NotificationRecord]:
+        return list(reversed(self._records.values()))
+
+    def app_count(self, app_name: str) -> int:
+        return self._app_counts.get(app_name, 0)
+
+    def add(self, record: NotificationRecord):
+        """Insert ``record``; ids must increase so the map stays ordered."""
+        self._records[record.id] = record
+        self._by_app.setdefault(record.app_name, deque()).append(record.id)
+        self._app_counts[record.app_name] = self.app_count(record.app_name) + 1
+
+    def remove(self, notification_id: int) -> NotificationRecord | None:
+        record = self._records.pop(notification_id, None)
+        if record is not None:
+            self._forget(record)
+        return record
+
+    def trim(self, limit: int) -> list[NotificationRecord]:
+        """Remove the oldest records beyond ``limit``."""
+        removed = []
+        while len(self._records) > limit:
+            _, record = self._records.popitem(last=False)
+            self._forget(record)
+            removed.append(record)
+        return removed
+
+    def trim_app(self, app_name: str, limit: int) -> list[NotificationRecord]:
+        """Remove the oldest records of ``app_name`` beyond ``limit``."""
+        removed = []
+        while self.app_count(app_name) > limit:
+            # Ids of records removed by other means are skipped here
+            record = self.remove(self._by_app[app_name].popleft())
+            if record is not None:
+                removed.append(record)
+        return removed
+
+    def clear(self):
+        self._records.clear()
+        self._by_app.clear()
+        self._app_counts.clear()
+
+    def _forget(self, record: NotificationRecord):
+        app_name = record.app_name
+        count = self._app_counts[app_name] - 1
+        ids = self._by_app[app_name]
+        if count == 0:
+            del self._app_counts[app_name]
+            del self._by_app[app_name]
+            return
+
+        self._app_counts[app_name] = count
+        if len(ids) > 2 * count + _STALE_SLACK:
+            self._by_app[app_name] = deque(
+                notification_id
+                for notification_id in ids
+                if notification_id in self._records
+            )
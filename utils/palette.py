@@ -0,0 +1,80 @@
+"""Dominant color palettes for album art and other images.
+
+The image is decoded at a reduced size and quantized with Pillow's fast
+octree, which groups similar shades instead of counting exact pixel
+values, so photos give a usable palette. Palettes are cached by the
+content hash of the image, so the same cover is only analyzed once, under
+any file name.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from io import BytesIO
+
+RGB = tuple[int, int, int]
+
+# Palettes remembered; each is only a few tuples
+_MAX_CACHED_PALETTES = 256
+
+
+def extract_palette(data: bytes, color_count: int = 5, resize: int = 64) -> list[RGB]:
+    """Return up to ``color_count`` colors of an encoded image, most common first."""
+    from PIL import Image
+
+    with Image.open(BytesIO(data)) as img:
+        # JPEG decoders can scale down while decoding
+        img.draft("RGB", (resize, resize))
+        img = img.convert("RGB")
+        img.thumbnail((resize, resize), Image.Resampling.BILINEAR)
+        quantized = img.quantize(colors=color_count, method=Image.Quantize.FASTOCTREE)
+
+    palette = quantized.getpalette() or []
+    counts = sorted(quantized.getcolors(256) or [], reverse=True)
+    return [
+        tuple(palette[index * 3 : index * 3 + 3])
+        for _, index in counts[:color_count]
+    ]
+
+
+class PaletteCache:
+    """Thread-safe LRU of palettes keyed by image content hash."""
+
+    __slots__ = ("_entries", "_lock", "max_entries")
+
+    def __init__(self, max_entries: int = _MAX_CACHED_PALETTES):
+        self._entries: OrderedDict[tuple[str, int], list[RGB]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def get(self, digest: str, color_count: int) -> list[RGB] | None:
+        key = (digest, color_count)
+        with self._lock:
+            palette = self._entries.get(key)
+            if palette is not None:
+                self._entries.move_to_end(key)
+            return palette
+
+    def put(self, digest: str, color_count: int, palette: list[RGB]):
+        with self._lock:
+            self._entries[(digest, color_count)] = palette
+            self._entries.move_to_end((digest, color_count))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def palette_for(
+        self, data: bytes, color_count: int = 5, resize: int = 64
+    ) -> list[RGB]:
+        """Return the cached palette of ``data``, extracting it on a miss."""
+        digest = self.digest(data)
+        if (palette := self.get(digest, color_count)) is None:
+            palette = extract_palette(data, color_count, resize)
+            self.put(digest, color_count, palette)
+        return palette
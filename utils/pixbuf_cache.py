@@ -0,0 +1,110 @@
+"""Byte-budgeted LRU cache of scaled pixbufs.
+
+Pixbufs are keyed by an owner (a notification id) and a square size. Only
+the size an owner is stored at is kept up front; other sizes are scaled
+from the largest pixbuf cached for that owner when first asked for. Once
+the decoded bytes exceed the budget, the least recently used pixbufs are
+evicted, whatever their owner.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+def _byte_length(pixbuf: Any) -> int:
+    return pixbuf.get_byte_length()
+
+
+class PixbufCache:
+    """(owner, size) -> pixbuf map that keeps its decoded bytes under budget."""
+
+    __slots__ = ("_entries", "_max_bytes", "_scale", "_sizeof", "_sizes", "_total")
+
+    def __init__(
+        self,
+        max_bytes: int,
+        scale: Callable[[Any, int], Any],
+        sizeof: Callable[[Any], int] = _byte_length,
+    ):
+        self._max_bytes = max_bytes
+        self._scale = scale
+        self._sizeof = sizeof
+        self._entries: OrderedDict[tuple[Hashable, int], tuple[Any, int]] = (
+            OrderedDict()
+        )
+        # owner -> sizes cached for it, to find a source without a scan
+        self._sizes: dict[Hashable, set[int]] = {}
+        self._total = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, owner: Hashable) -> bool:
+        return owner in self._sizes
+
+    @property
+    def size(self) -> int:
+        """Decoded bytes currently held."""
+        return self._total
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int):
+        self._max_bytes = value
+        self._evict()
+
+    def get(self, owner: Hashable, size: int) -> Any | None:
+        """Return the pixbuf of ``owner`` at ``size``, scaling one if needed."""
+        key = (owner, size)
+        if (entry := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+            return entry[0]
+
+        sizes = self._sizes.get(owner)
+        if not sizes:
+            return None
+
+        # Scale down from the largest one to keep the most detail
+        source, _ = self._entries[(owner, max(sizes))]
+        scaled = self._scale(source, size)
+        if scaled is not None:
+            self.put(owner, size, scaled)
+        return scaled
+
+    def put(self, owner: Hashable, size: int, pixbuf: Any):
+        key = (owner, size)
+        if key in self._entries:
+            self._drop(key)
+        nbytes = self._sizeof(pixbuf)
+        self._entries[key] = (pixbuf, nbytes)
+        self._sizes.setdefault(owner, set()).add(size)
+        self._total += nbytes
+        self._evict()
+
+    def discard(self, owner: Hashable):
+        """Drop every size cached for ``owner``."""
+        for size in self._sizes.get(owner, ()).copy():
+            self._drop((owner, size))
+
+    def clear(self):
+        self._entries.clear()
+        self._sizes.clear()
+        self._total = 0
+
+    def _evict(self):
+        # The newest entry is kept even if it alone exceeds the budget
+        while self._total > self._max_bytes and len(self._entries) > 1:
+            self._drop(next(iter(self._entries)))
+
+    def _drop(self, key: tuple[Hashable, int]):
+        _, nbytes = self._entries.pop(key)
+        self._total -= nbytes
+        owner, size = key
+        sizes = self._sizes[owner]
+        sizes.discard(size)
+        if not sizes:
+            del self._sizes[owner]
@@ -0,0 +1,48 @@
+"""Local playback position estimate for media players.
+
+Reading the position of an MPRIS player is a blocking D-Bus call, and
+players only signal it when it jumps. The tracker keeps the last position
+read and the time it was read, and extrapolates from there while playing,
+so the position only has to be read again when playback changes course
+(a seek, a status change or a new track).
+"""
+
+import time
+from collections.abc import Callable
+
+_MICROSECONDS = 1_000_000
+
+
+class PositionTracker:
+    """Extrapolates a position in microseconds from the last known one."""
+
+    __slots__ = ("_anchor", "_anchor_time", "_clock", "length", "playing", "rate")
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._anchor = 0
+        self._anchor_time = clock()
+        self.playing = False
+        self.rate = 1.0
+        # Track length in microseconds; 0 when unknown
+        self.length = 0
+
+    def sync(self, position: int, playing: bool, rate: float = 1.0):
+        """Restart the estimate from a position read from the player."""
+        self._anchor = max(0, position)
+        self._anchor_time = self._clock()
+        self.playing = playing
+        self.rate = rate
+
+    def set_playing(self, playing: bool):
+        """Pause or resume the estimate from where it currently is."""
+        self.sync(self.position(), playing, self.rate)
+
+    def position(self) -> int:
+        position = self._anchor
+        if self.playing:
+            elapsed = self._clock() - self._anchor_time
+            position += int(elapsed * self.rate * _MICROSECONDS)
+        if self.length > 0:
+            position = min(position, self.length)
+        return position
@@ -0,0 +1,32 @@
+"""Change detection for polled properties.
+
+Some sources only signal that "something" changed and have to be read
+back in full. A snapshot remembers the last value of each property, so a
+read-back only reports the properties whose value actually differs.
+"""
+
+from collections.abc import Callable, Iterable
+
+
+class PropertySnapshot:
+    """Last known values of a fixed set of properties."""
+
+    __slots__ = ("_names", "_values")
+
+    def __init__(self, names: Iterable[str]):
+        self._names = tuple(names)
+        self._values: dict[str, object] = {}
+
+    def update(self, read: Callable[[str], object]) -> frozenset[str]:
+        """Read every property through ``read`` and return those that changed.
+
+        A property read for the first time always counts as changed.
+        """
+        changed = set()
+        for name in self._names:
+            value = read(name)
+            if name in self._values and self._values[name] == value:
+                continue
+            self._values[name] = value
+            changed.add(name)
+        return frozenset(changed)
@@ -22,3 +22,27 @@ def run_in_thread(func: Callable) -> Callable:
         return thread(func, *args, **kwargs)
 
     return wrapper
+
+
+# Single worker for tasks that must run in submission order (e.g. file appends)
+serial_pool = ThreadPoolExecutor(max_workers=1)
+
+
+def thread_serial(target: Callable, *args, **kwargs):
+    """
+    Submit the given function to the single-worker pool.
+    Tasks run one at a time, in the order they were submitted.
+    """
+    return serial_pool.submit(target, *args, **kwargs)
+
+
+# Workers for CPU-bound work (e.g. palette quantization), kept apart so it
+# cannot hold up I/O waiting on the shared pool
+cpu_pool = ThreadPoolExecutor(max_workers=2)
+
+
+def thread_cpu(target: Callable, *args, **kwargs):
+    """
+    Submit the given CPU-bound function to its own worker pool.
+    """
+    return cpu_pool.submit(target, *args, **kwargs)
@@ -0,0 +1,99 @@
+"""Persistent thumbnail files under a byte budget.
+
+Thumbnails are stored as one file per key, usually a content hash, so the
+same image is only ever scaled once. Files are evicted least recently used
+first; the order survives restarts through file mtimes.
+"""
+
+import contextlib
+import os
+import threading
+from collections import OrderedDict
+
+
+class ThumbnailCache:
+    """Directory of encoded thumbnails with LRU eviction by total size."""
+
+    __slots__ = ("_directory", "_entries", "_lock", "max_bytes", "size")
+
+    def __init__(self, directory: str, max_bytes: int):
+        self._directory = directory
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_bytes = max_bytes
+        self.size = 0
+
+        os.makedirs(directory, exist_ok=True)
+        found = []
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.endswith(".tmp"):
+                    # Left behind by a write interrupted mid-way
+                    self._unlink(entry.name)
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                found.append((stat.st_mtime, entry.name, stat.st_size))
+
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self.size += size
+        self._evict()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self._directory, key)
+
+    def lookup(self, key: str) -> str | None:
+        """Return the file of a cached thumbnail and mark it recently used."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+        return self.path(key)
+
+    def touch(self, key: str):
+        """Persist the recent use of ``key``; meant for a worker thread."""
+        with contextlib.suppress(OSError):
+            os.utime(self.path(key))
+
+    def put(self, key: str, data: bytes) -> str:
+        """Store encoded thumbnail ``data``; safe to call from a worker."""
+        path = self.path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self.size += len(data) - self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self._evict()
+        return path
+
+    def remove(self, key: str):
+        with self._lock:
+            size = self._entries.pop(key, None)
+            if size is None:
+                return
+            self.size -= size
+        self._unlink(key)
+
+    def clear(self):
+        with self._lock:
+            keys = list(self._entries)
+            self._entries.clear()
+            self.size = 0
+        for key in keys:
+            self._unlink(key)
+
+    def _evict(self):
+        while self.size > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self.size -= size
+            self._unlink(key)
+
+    def _unlink(self, name: str):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(os.path.join(self._directory, name))
@@ -154,6 +154,10 @@ Notification = TypedDict(
         "dnd_on_screencast": bool,
         "max_actions": int,
         "per_app_limits": dict[str, int],
+        "max_visible": int,
+        "burst_limit": int,
+        "burst_interval": int,
+        "image_cache_mb": int,
         "transition_type": Reveal_Animations,
         "transition_duration": int,
     },
@@ -11,12 +11,13 @@ from fabric.widgets.image import Image
 from fabric.widgets.label import Label
 from fabric.widgets.scale import ScaleMark
 from fabric.widgets.widget import Widget
-from gi.repository import Gdk, GdkPixbuf, GLib
+from gi.repository import Gdk
 
 from shared.animated.scale import AnimatedScale
 
 from .config import widget_config
 from .icons import symbolic_icons, text_icons
+from .image_loader import ImageLoader
 
 storage_config = widget_config.get("widgets", {}).get("storage", {})
 
@@ -93,36 +94,30 @@ def setup_cursor_hover(
 # Function to get the system stats using
 def get_icon(app_icon, size=25) -> Image:
     icon_size = size - 5
-    try:
-        match app_icon:
-            case str(x) if "file://" in x:
-                return Image(
-                    name="app-icon",
-                    pixbuf=GdkPixbuf.Pixbuf.new_from_file_at_size(
-                        app_icon[7:], size, size
-                    ),
-                    size=size,
-                )
-            case str(x) if len(x) > 0 and x[0] == "/":
-                return Image(
-                    name="app-icon",
-                    pixbuf=GdkPixbuf.Pixbuf.new_from_file_at_size(app_icon, size, size),
-                    size=size,
-                )
-            case _:
-                return Image(
-                    name="app-icon",
-                    icon_name=app_icon
-                    if app_icon
-                    else symbolic_icons["fallback"]["notification"],
-                    icon_size=icon_size,
-                )
-    except GLib.GError:
-        return Image(
-            name="app-icon",
-            icon_name=symbolic_icons["fallback"]["notification"],
-            icon_size=icon_size,
-        )
+    match app_icon:
+        case str(x) if "file://" in x or (len(x) > 0 and x[0] == "/"):
+            # Show the fallback icon until the file is decoded
+            image = Image(
+                name="app-icon",
+                icon_name=symbolic_icons["fallback"]["notification"],
+                icon_size=icon_size,
+                size=size,
+            )
+            ImageLoader().load(
+                app_icon,
+                size,
+                lambda pixbuf: pixbuf and image.set_from_pixbuf(pixbuf),
+                owner=image,
+            )
+            return image
+        case _:
+            return Image(
+                name="app-icon",
+                icon_name=app_icon
+                if app_icon
+                else symbolic_icons["fallback"]["notification"],
+                icon_size=icon_size,
+            )
 
 
 # Function to get the widget class dynamically
@@ -1,31 +1,114 @@
 import os
-import re
-import tempfile
 from urllib.parse import unquote, urlparse
 
 import gi
-from fabric.utils import logger, remove_handler
+from fabric.utils import remove_handler
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
 from fabric.widgets.entry import Entry
 from fabric.widgets.image import Image
 from fabric.widgets.label import Label
-from fabric.widgets.scrolledwindow import ScrolledWindow
-from gi.repository import Gdk, GdkPixbuf, Gio, GLib, Gtk
+from gi.repository import Gdk, GLib, Gtk
 
-from shared.list import ListBox
+from services.clipboard import ClipboardService
+from shared.list import VirtualList
 from shared.mixins import PopoverMixin
 from shared.widget_container import ButtonWidget
+from utils.clipboard_search import ClipboardSearch
+from utils.clipboard_store import ClipboardEntry
+from utils.constants import CLIPBOARD_PREVIEW_SIZE
+from utils.image_loader import ImageLoader
+from utils.thread import thread
 from utils.widget_utils import nerd_font_icon
 
-gi.require_versions({"Gdk": "3.0", "GdkPixbuf": "2.0"})
+gi.require_versions({"Gdk": "3.0"})
 
 
-# Pre-compiled regex for HTML image tag detection
-_HTML_IMG_RE = re.compile(r"^\s*<img\s+")
+def is_file_image(content: str) -> bool:
+    """Whether the content is a ``file://`` uri of an image"""
+    return content.startswith("file:///") and content.endswith(
+        (".png", ".jpg", ".jpeg", ".bmp", ".gif")
+    )
+
+
+class ClipRow(Button):
+    """A history row that is rebound to different entries as the list scrolls."""
+
+    def __init__(self, service: ClipboardService):
+        self.entry: ClipboardEntry | None = None
+        self.index = -1
+        self._service = service
+
+        self.icon_image = Image(name="clip-icon", h_align="start")
+        self.icon_image.set_size_request(
+            CLIPBOARD_PREVIEW_SIZE, CLIPBOARD_PREVIEW_SIZE
+        )
+        self.name_label = Label(
+            name="clip-label",
+            ellipsization="end",
+            v_align="center",
+            h_align="start",
+            h_expand=True,
+        )
+
+        super().__init__(
+            name="slot-button",
+            child=Box(
+                name="slot-box",
+                orientation="h",
+                spacing=10,
+                # Text and image rows share one height
+                size=(-1, CLIPBOARD_PREVIEW_SIZE),
+                children=[self.icon_image, self.name_label],
+            ),
+        )
+
+    def bind(self, entry: ClipboardEntry, index: int):
+        """Show ``entry`` in this row, reusing the existing child widgets."""
+        self.index = index
+        if entry is self.entry:
+            return
+        self.entry = entry
+        self.icon_image.clear()
+
+        content = entry.preview
+        file_path = unquote(urlparse(content).path) if is_file_image(content) else ""
+
+        if entry.kind == "image":
+            self.name_label.set_label("[Image]")
+            self.set_tooltip_text("Image in clipboard")
+            self.icon_image.show()
+            # Only rows that become visible ever load a preview
+            self._service.thumbnail(
+                entry,
+                lambda pixbuf: self._on_preview_loaded(entry, pixbuf),
+                owner=self,
+            )
+        elif file_path and os.path.exists(file_path):
+            self.name_label.set_label("[File]")
+            self.set_tooltip_text("File in clipboard")
+            self.icon_image.show()
+            ImageLoader().load(
+                file_path,
+                CLIPBOARD_PREVIEW_SIZE,
+                lambda pixbuf: self._on_preview_loaded(entry, pixbuf),
+                owner=self,
+            )
+        else:
+            # Truncate content for display
+            display_text = content.strip()
+            if len(display_text) > 100:
+                display_text = display_text[:97] + "..."
+            self.name_label.set_label(display_text)
+            self.set_tooltip_text(display_text)
+            self.icon_image.hide()
+
+    def _on_preview_loaded(self, entry: ClipboardEntry, pixbuf):
+        # The row may have been rebound while the preview was loading
+        if entry is self.entry and pixbuf is not None:
+            self.icon_image.set_from_pixbuf(pixbuf)
 
 
-# TODO: add scrolled pagination
 class ClipHistoryMenu(Box):
     """A widget to display and manage clipboard history."""
 
@@ -38,27 +121,15 @@ class ClipHistoryMenu(Box):
             **kwargs,
         )
 
-        # Create a temporary directory for image icons
-        self.tmp_dir = tempfile.mkdtemp(prefix="cliphist-")
-        self.image_cache = {}  # Cache for image previews (limited to MAX_IMAGE_CACHE)
-        self.MAX_IMAGE_CACHE = 30  # Limit cache size to prevent memory bloat
-
         self.selected_index = -1  # Track the selected item index
-        self._arranger_handler = 0
-        self.clipboard_items = []
-        self._loading = False
-        self._pending_updates = False
+        self.clipboard_items: list[ClipboardEntry] = []
 
-        # Pagination state, reset for new scan
-        self.items_loaded = 0
-        self.batch_size = 7
-        self.loading = False
-        self.max_items = 0  # ← LIMIT HERE
+        self._search = ClipboardSearch(run=thread, post=GLib.idle_add)
+        self.service = ClipboardService()
+        self.service.connect("changed", lambda *_: self._refresh_items())
 
         self._search_timer_id = 0  # Timer ID for search text change
 
-        self.viewport = ListBox(name="viewport", spacing=4, orientation="v")
-
         self.search_entry = Entry(
             name="search-entry",
             placeholder="Search Clipboard History",
@@ -84,14 +155,43 @@ class ClipHistoryMenu(Box):
 
         self.search_entry.props.xalign = 0.1
 
-        self.scrolled_window = ScrolledWindow(
+        # Only the visible rows exist; they are rebound as results change
+        self.scrolled_window = VirtualList(
             name="scrolled-window",
-            spacing=10,
+            row_factory=self._make_row,
+            bind_row=self._bind_row,
+            spacing=4,
             min_content_size=(300, 105),
             max_content_size=(300, 105),
-            child=self.viewport,
         )
 
+        self.empty_box = Box(
+            name="no-clip-container",
+            orientation="v",
+            h_align="center",
+            v_align="center",
+            h_expand=True,
+            spacing=10,
+            v_expand=True,
+            visible=False,
+            children=[
+                Image(
+                    name="no-clip-icon",
+                    icon_name="clipboard-symbolic",
+                    icon_size=32,
+                    h_align="center",
+                    v_align="center",
+                ),
+                Label(
+                    name="no-clip",
+                    label="Clipboard history is empty",
+                    h_align="center",
+                    v_align="center",
+                ),
+            ],
+        )
+        self.empty_box.set_no_show_all(True)
+
         self.header_box = Box(
             name="header_box",
             spacing=10,
@@ -115,6 +215,7 @@ class ClipHistoryMenu(Box):
             children=[
                 self.header_box,
                 self.scrolled_window,
+                self.empty_box,
             ],
         )
 
@@ -125,20 +226,6 @@ class ClipHistoryMenu(Box):
         if icon_pos == Gtk.EntryIconPosition.SECONDARY:
             self.search_entry.set_text("")
 
-    def _load_next_batch(self, aps):
-        if self.loading or self.items_loaded >= self.max_items:
-            return
-        self.loading = True
-
-        items_to_add = min(self.batch_size, self.max_items - self.items_loaded)
-
-        for i in range(self.items_loaded, self.items_loaded + items_to_add):
-            notification_item = self.make_button_from_ap(aps[i])
-            self.viewport.add(notification_item)
-
-        self.items_loaded += items_to_add
-        self.loading = False
-
     def on_search_text_changed(self, entry, pspec):
         # Remove any existing pending filter operation
         if self._search_timer_id > 0:
@@ -158,381 +245,78 @@ class ClipHistoryMenu(Box):
 
     def close(self, *_):
         """Close the clipboard history panel"""
-        self.viewport.children = []
-        self.selected_index = -1  # Reset selection
+        self.update_selection(-1)  # Reset selection
 
     def open(self):
         """Open the clipboard history panel and load items"""
-        if self._loading:
-            return
-        self._loading = True
         self.search_entry.set_text("")  # Clear search
         self.search_entry.grab_focus()
-        # Start loading asynchronously
-        self._load_clipboard_items_async()
-
-    def _load_clipboard_items_async(self):
-        """Load clipboard items asynchronously without blocking UI"""
-        try:
-            # Use Gio.Subprocess for true async execution
-            launcher = Gio.SubprocessLauncher.new(
-                Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_PIPE
-            )
-            proc = launcher.spawnv(["cliphist", "list"])
-            proc.communicate_async(None, None, self._on_clipboard_list_ready, None)
-        except Exception as e:
-            logger.exception(f"Error starting cliphist: {e}")
-            self._loading = False
-
-    def _on_clipboard_list_ready(self, proc, result, user_data):
-        """Callback when clipboard list command completes"""
-        try:
-            _, stdout, _ = proc.communicate_finish(result)
-            if stdout:
-                stdout_str = stdout.get_data().decode("utf-8", errors="replace")
-                lines = stdout_str.strip().split("\n")
-                new_items = []
-                for line in lines:
-                    if not line or "<meta http-equiv" in line:
-                        continue
-                    new_items.append(line)
-                self._update_items(new_items)
-        except Exception as e:
-            logger.exception(f"Error loading clipboard history: {e}")
-        finally:
-            self._loading = False
-            if self._pending_updates:
-                self._pending_updates = False
-                self._load_clipboard_items_async()
-
-    def _update_items(self, new_items):
-        """Update the items list from main thread"""
-        self.clipboard_items = new_items
-        self._display_clipboard_items()
+        self._refresh_items()
+
+    def _refresh_items(self):
+        """Pick up history changes and redraw with the current filter"""
+        self._search.sync(self.service.entries)
+        self._display_clipboard_items(self.search_entry.get_text())
 
     def _display_clipboard_items(self, filter_text=""):
         """Display clipboard items in the viewport"""
-        remove_handler(self._arranger_handler) if self._arranger_handler else None
-        self.viewport.remove_all()
         self.selected_index = -1  # Reset selection
+        self.clipboard_items = []
+        self.scrolled_window.set_items(self.clipboard_items)
 
-        # Filter items if search text is provided
-        filtered_items = []
-        for item in self.clipboard_items:
-            # Extract just the content part (after the first tab)
-            content = item.split("\t", 1)[1] if "\t" in item else item
-            if filter_text.lower() in content.lower():
-                filtered_items.append(item)
-
-        # Show message if no items are found
-        if not filtered_items:
-            # Create a container box to better center the message
-            container = Box(
-                name="no-clip-container",
-                orientation="v",
-                h_align="center",
-                v_align="center",
-                h_expand=True,
-                spacing=10,
-                v_expand=True,
-            )
-
-            # Show a message if no clipboard items
-            label = Label(
-                name="no-clip",
-                label="Clipboard history is empty",
-                h_align="center",
-                v_align="center",
-            )
-            image = Image(
-                name="no-clip-icon",
-                icon_name="clipboard-symbolic",
-                icon_size=32,
-                h_align="center",
-                v_align="center",
-            )
-
-            container.add(image)
-            container.add(label)
-            self.viewport.add(container)
-            return
-
-        # Display items in batches to prevent UI freeze
-        self._display_items_batch(filtered_items, 0, 10)
-
-    def _display_items_batch(self, items, start, batch_size):
-        """Display items in batches to keep UI responsive"""
-        end = min(start + batch_size, len(items))
-
-        for i in range(start, end):
-            item = items[i]
-            self.viewport.add(self.create_clipboard_item(item))
-
-        # Schedule next batch if there are more items
-        if end < len(items):
-            GLib.idle_add(self._display_items_batch, items, end, batch_size)
-        else:
-            # Auto-select first item if we have filter text
-            if self.search_entry.get_text() and self.viewport.get_children():
-                self.update_selection(0)
-
-    def create_clipboard_item(self, item):
-        """Create a button for a clipboard item"""
-        # Extract ID and content
-        parts = item.split("\t", 1)
-        item_id = parts[0] if len(parts) > 1 else "0"
-        content = parts[1] if len(parts) > 1 else item
-
-        # Truncate content for display
-        display_text = content.strip()
-        if len(display_text) > 100:
-            display_text = display_text[:97] + "..."
-
-        # Check if this is an image by examining the content
-        is_image = self.is_image_data(content)
-
-        is_file_image = self.is_file_image(content) and os.path.exists(
-            unquote(urlparse(content).path)
-        )
-
-        if is_image:
-            # For images, create item with image preview
-            button = Button(
-                name="slot-button",
-                child=Box(
-                    name="slot-box",
-                    orientation="h",
-                    spacing=10,
-                    children=[
-                        Image(name="clip-icon", h_align="start"),  # Placeholder
-                        Label(
-                            name="clip-label",
-                            label="[Image]",
-                            ellipsization="end",
-                            v_align="center",
-                            h_align="start",
-                            h_expand=True,
-                        ),
-                    ],
-                ),
-                tooltip_text="Image in clipboard",
-                on_clicked=lambda *_, id=item_id: self.paste_item(id),
-            )
-            # Load image preview in background
-            self._load_image_preview_async(item_id, button)
-
-        elif is_file_image:
-            button = Button(
-                name="slot-button",
-                child=Box(
-                    name="slot-box",
-                    orientation="h",
-                    spacing=10,
-                    children=[
-                        Image(
-                            name="clip-icon",
-                            h_align="start",
-                            image_file=unquote(urlparse(content).path),
-                            size=72,
-                        ),  # Placeholder
-                        Label(
-                            name="clip-label",
-                            label="[File]",
-                            ellipsization="end",
-                            v_align="center",
-                            h_align="start",
-                            h_expand=True,
-                        ),
-                    ],
-                ),
-                tooltip_text="File in clipboard",
-                on_clicked=lambda *_, id=item_id: self.paste_item(id),
-            )
-        else:
-            # For text, create regular item
-            button = self.create_text_item_button(item_id, display_text)
+        # Matches stream in; large histories are filtered off the main thread
+        self._search.search(filter_text, self._on_search_chunk, self._on_search_done)
 
-        # Add key press event handler for Enter key
-        button.connect(
-            "key-press-event",
-            lambda widget, event, id=item_id: self.on_item_key_press(widget, event, id),
+    def _on_search_chunk(self, item_ids):
+        """Append a chunk of matching entries to the list"""
+        get_entry = self.service.store.get
+        self.clipboard_items.extend(
+            entry for entry in map(get_entry, item_ids) if entry is not None
         )
+        self.scrolled_window.set_items(self.clipboard_items, reset_scroll=False)
 
-        # Make sure button can receive focus and key events
-        button.set_can_focus(True)
-        button.add_events(Gdk.EventMask.KEY_PRESS_MASK)
-
-        return button
-
-    def _load_image_preview_async(self, item_id, button):
-        """Load image preview asynchronously"""
-        if item_id in self.image_cache:
-            # Use cached pixbuf
-            GLib.idle_add(self._update_image_button, button, self.image_cache[item_id])
-            return
-
-        try:
-            launcher = Gio.SubprocessLauncher.new(
-                Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_PIPE
-            )
-            proc = launcher.spawnv(["cliphist", "decode", item_id])
-            proc.communicate_async(None, None, self._on_image_loaded, (item_id, button))
-        except Exception as e:
-            logger.exception(f"Error starting image decode: {e}")
-
-    def _on_image_loaded(self, proc, result, user_data):
-        """Callback when image decode completes"""
-        item_id, button = user_data
-        try:
-            _, stdout, _ = proc.communicate_finish(result)
-            if stdout:
-                loader = GdkPixbuf.PixbufLoader()
-                loader.write(stdout.get_data())
-                loader.close()
-                pixbuf = loader.get_pixbuf()
-                width, height = pixbuf.get_width(), pixbuf.get_height()
-                max_size = 72
-                if width > height:
-                    new_width = max_size
-                    new_height = int(height * (max_size / width))
-                else:
-                    new_height = max_size
-                    new_width = int(width * (max_size / height))
-                pixbuf = pixbuf.scale_simple(
-                    new_width, new_height, GdkPixbuf.InterpType.BILINEAR
-                )
-                # Limit cache size to prevent memory bloat
-                if len(self.image_cache) >= self.MAX_IMAGE_CACHE:
-                    # Remove oldest entry (first key)
-                    oldest_key = next(iter(self.image_cache))
-                    del self.image_cache[oldest_key]
-                self.image_cache[item_id] = pixbuf
-                self._update_image_button(button, pixbuf)
-        except Exception as e:
-            logger.exception(f"Error loading image preview: {e}")
-
-    def _update_image_button(self, button, pixbuf):
-        """Update the button with the loaded image preview"""
-        box = button.get_child()
-        if box and len(box.get_children()) > 0:
-            image_widget = box.get_children()[0]
-            if isinstance(image_widget, Image):
-                image_widget.set_from_pixbuf(pixbuf)
-
-    def create_text_item_button(self, item_id, display_text):
-        """Create a button for a text clipboard item"""
-        return Button(
-            name="slot-button",
-            child=Label(
-                name="clip-label",
-                label=display_text,
-                ellipsization="end",
-                v_align="center",
-                h_align="start",
-                h_expand=True,
-            ),
-            tooltip_text=display_text,
-            on_clicked=lambda *_: self.paste_item(item_id),
-        )
+        # Auto-select first item if we have filter text
+        if self.search_entry.get_text() and self.selected_index == -1:
+            self.update_selection(0)
 
-    def is_file_image(self, content):
-        # Check for common image data patterns
-        if content.startswith("file:///") and content.endswith(
-            (".png", ".jpg", ".jpeg", ".bmp", ".gif")
-        ):
-            return True
+    def _on_search_done(self):
+        # Show message if no items are found
+        empty = not self.clipboard_items
+        self.empty_box.set_visible(empty)
+        self.scrolled_window.set_visible(not empty)
+
+    def _make_row(self) -> ClipRow:
+        row = ClipRow(self.service)
+        row.connect("clicked", self._on_row_clicked)
+        return row
+
+    def _bind_row(self, row: ClipRow, entry: ClipboardEntry, index: int):
+        row.bind(entry, index)
+        self._mark_selected(row)
+
+    def _mark_selected(self, row: ClipRow):
+        style_context = row.get_style_context()
+        if row.index == self.selected_index:
+            style_context.add_class("selected")
+        else:
+            style_context.remove_class("selected")
 
-    def is_image_data(self, content):
-        """Determine if clipboard content is likely an image"""
-
-        return (
-            content.startswith("data:image/")
-            or content.startswith("\x89PNG")
-            or content.startswith("GIF8")
-            or content.startswith("\xff\xd8\xff")  # JPEG
-            or _HTML_IMG_RE.match(content) is not None  # HTML image tag
-            or (
-                "binary" in content.lower()
-                and any(
-                    ext in content.lower()
-                    for ext in ["jpg", "jpeg", "png", "bmp", "gif"]
-                )
-            )
-        )
+    def _on_row_clicked(self, row: ClipRow):
+        if row.entry is not None:
+            self.paste_item(row.entry.id)
 
     def paste_item(self, item_id):
-        """Copy the selected item to the clipboard asynchronously"""
-        try:
-            launcher = Gio.SubprocessLauncher.new(
-                Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_PIPE
-            )
-            proc = launcher.spawnv(["cliphist", "decode", item_id])
-            proc.communicate_async(None, None, self._on_paste_decoded, None)
-        except Exception as e:
-            logger.exception(f"Error starting paste decode: {e}")
-
-    def _on_paste_decoded(self, proc, result, user_data):
-        """Callback when paste decode completes"""
-        try:
-            _, stdout, _ = proc.communicate_finish(result)
-            if stdout:
-                # Now pipe to wl-copy
-                launcher = Gio.SubprocessLauncher.new(Gio.SubprocessFlags.STDIN_PIPE)
-                wl_proc = launcher.spawnv(["wl-copy"])
-                wl_proc.communicate_async(
-                    GLib.Bytes.new(stdout.get_data()),
-                    None,
-                    self._on_paste_complete,
-                    None,
-                )
-        except Exception as e:
-            logger.exception(f"Error decoding paste item: {e}")
-
-    def _on_paste_complete(self, proc, result, user_data):
-        """Callback when wl-copy completes"""
-        try:
-            proc.communicate_finish(result)
+        """Copy the selected item back to the clipboard"""
+        if self.service.copy(item_id):
             self.close()
-        except Exception as e:
-            logger.exception(f"Error pasting clipboard item: {e}")
 
     def delete_item(self, item_id):
-        """Delete the selected clipboard item asynchronously"""
-        try:
-            launcher = Gio.SubprocessLauncher.new(Gio.SubprocessFlags.NONE)
-            proc = launcher.spawnv(["cliphist", "delete", item_id])
-            proc.wait_async(None, self._on_delete_complete, None)
-        except Exception as e:
-            logger.exception(f"Error starting delete: {e}")
-
-    def _on_delete_complete(self, proc, result, user_data):
-        """Callback when delete completes"""
-        try:
-            proc.wait_finish(result)
-            self._pending_updates = True
-            if not self._loading:
-                self._load_clipboard_items_async()
-        except Exception as e:
-            logger.exception(f"Error deleting clipboard item: {e}")
+        """Delete the selected clipboard item"""
+        self.service.delete(item_id)
 
     def clear_history(self, *_):
-        """Clear all clipboard history asynchronously"""
-        try:
-            launcher = Gio.SubprocessLauncher.new(Gio.SubprocessFlags.NONE)
-            proc = launcher.spawnv(["cliphist", "wipe"])
-            proc.wait_async(None, self._on_clear_complete, None)
-        except Exception as e:
-            logger.exception(f"Error starting clear: {e}")
-
-    def _on_clear_complete(self, proc, result, user_data):
-        """Callback when clear completes"""
-        try:
-            proc.wait_finish(result)
-            self._pending_updates = True
-            if not self._loading:
-                self._load_clipboard_items_async()
-        except Exception as e:
-            logger.exception(f"Error clearing clipboard history: {e}")
+        """Clear all clipboard history"""
+        self.service.wipe()
 
     def filter_items(self, entry, *_):
         """Filter clipboard items based on search text"""
@@ -558,27 +342,19 @@ class ClipHistoryMenu(Box):
         return False
 
     def update_selection(self, new_index):
-        """Update the selected item in the viewport"""
-        children = self.viewport.get_children()
-
-        # Unselect current
-        if self.selected_index != -1 and self.selected_index < len(children):
-            current_button = children[self.selected_index]
-            current_button.get_style_context().remove_class("selected")
-
-        # Select new
-        if new_index != -1 and new_index < len(children):
-            new_button = children[new_index]
-            new_button.get_style_context().add_class("selected")
+        """Update the selected item index and the rows showing it"""
+        if 0 <= new_index < len(self.clipboard_items):
             self.selected_index = new_index
-            self.scroll_to_selected(new_button)
+            self.scroll_to_selected()
         else:
             self.selected_index = -1
 
+        for row in self.scrolled_window.rows:
+            self._mark_selected(row)
+
     def move_selection(self, delta):
         """Move the selection up or down"""
-        children = self.viewport.get_children()
-        if not children:
+        if not self.clipboard_items:
             return
 
         # Allow starting selection from nothing
@@ -587,82 +363,26 @@ class ClipHistoryMenu(Box):
         else:
             new_index = self.selected_index + delta
 
-        new_index = max(0, min(new_index, len(children) - 1))
+        new_index = max(0, min(new_index, len(self.clipboard_items) - 1))
         self.update_selection(new_index)
 
-    def _scroll(self, button):
-        adj = self.scrolled_window.get_vadjustment()
-        alloc = button.get_allocation()
-        if alloc.height == 0:
-            return False  # Retry if allocation isn't ready
-
-        y = alloc.y
-        height = alloc.height
-        page_size = adj.get_page_size()
-        current_value = adj.get_value()
-
-        # Calculate visible boundaries
-        visible_top = current_value
-        visible_bottom = current_value + page_size
-
-        if y < visible_top:
-            # Item above viewport - align to top
-            adj.set_value(y)
-        elif y + height > visible_bottom:
-            # Item below viewport - align to bottom
-            new_value = y + height - page_size
-            adj.set_value(new_value)
-        return False
-
-    def scroll_to_selected(self, button):
+    def scroll_to_selected(self):
         """Scroll to ensure the selected item is visible"""
-
-        GLib.idle_add(self._scroll, button)
+        self.scrolled_window.scroll_to_index(self.selected_index)
 
     def use_selected_item(self, *_):
         """Use (paste) the selected clipboard item"""
-        children = self.viewport.get_children()
-        if (
-            not children
-            or self.selected_index == -1
-            or self.selected_index >= len(self.clipboard_items)
-        ):
+        if not 0 <= self.selected_index < len(self.clipboard_items):
             return
 
-        # Get the item ID from the first part before the tab
-        item_line = self.clipboard_items[self.selected_index]
-        item_id = item_line.split("\t", 1)[0]
-        self.paste_item(item_id)
+        self.paste_item(self.clipboard_items[self.selected_index].id)
 
     def delete_selected_item(self):
         """Delete the selected clipboard item"""
-        children = self.viewport.get_children()
-        if not children or self.selected_index == -1:
+        if not 0 <= self.selected_index < len(self.clipboard_items):
             return
 
-        # Get the item ID from the first part before the tab
-        item_line = self.clipboard_items[self.selected_index]
-        item_id = item_line.split("\t", 1)[0]
-        self.delete_item(item_id)
-
-    def on_item_key_press(self, widget, event, item_id):
-        """Handle key press events on clipboard items"""
-        if event.keyval in (Gdk.KEY_Return, Gdk.KEY_KP_Enter):
-            # Copy item to clipboard and close
-            self.paste_item(item_id)
-            return True
-        return False
-
-    def __del__(self):
-        """Clean up temporary files on destruction"""
-        try:
-            if hasattr(self, "tmp_dir") and os.path.exists(self.tmp_dir):
-                import shutil
-
-                shutil.rmtree(self.tmp_dir)
-            self.image_cache.clear()
-        except Exception as e:
-            logger.exception(f"Error cleaning up temporary files: {e}")
+        self.delete_item(self.clipboard_items[self.selected_index].id)
 
 
 class ClipHistoryWidget(ButtonWidget, PopoverMixin):
@@ -671,6 +391,9 @@ class ClipHistoryWidget(ButtonWidget, PopoverMixin):
     def __init__(self, **kwargs):
         super().__init__(name="cliphist", **kwargs)
 
+        # Start recording at startup, not when the menu first opens
+        ClipboardService()
+
         self.container_box.add(
             nerd_font_icon(
                 icon=self.config.get("icon", "󰕸"),
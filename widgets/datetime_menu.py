@@ -1,14 +1,15 @@
 import math
+from functools import partial
 
 import gi
 from fabric.notifications import Notification
-from fabric.utils import bulk_connect, logger
+from fabric.utils import bulk_connect
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
 from fabric.widgets.datetime import DateTime
+from fabric.widgets.eventbox import EventBox
 from fabric.widgets.label import Label
 from fabric.widgets.revealer import Revealer
-from fabric.widgets.scrolledwindow import ScrolledWindow
 from fabric.widgets.separator import Separator
 from gi.repository import GdkPixbuf, GLib, Gtk
 
@@ -17,57 +18,51 @@ import utils.functions as helpers
 from services import notification_service
 from shared.buttons import HoverButton
 from shared.circle_image import CircularImage
-from shared.list import ListBox
+from shared.list import VirtualList
 from shared.mixins import PopoverMixin
 from shared.widget_container import ButtonWidget
-from utils.colors import Colors
 from utils.icons import text_icons
+from utils.image_loader import ImageLoader
+from utils.notification_store import NotificationRecord
 from utils.widget_utils import get_icon, nerd_font_icon
 
 gi.require_versions({"Gtk": "3.0", "GdkPixbuf": "2.0"})
 
+_IMAGE_SIZE = math.ceil(0.75 * constants.NOTIFICATION_IMAGE_SIZE)
+_BODY_LINES = 3
+# Fits the header, the image and three body lines
+_ROW_HEIGHT = 130
 
-class DateMenuNotification(Box):
-    """A widget to display a notification."""
 
-    def __init__(
-        self,
-        id: int,
-        notification: Notification,
-        **kwargs,
-    ):
-        super().__init__(
-            size=(constants.NOTIFICATION_WIDTH, -1),
-            name="datemenu-notification-box",
-            h_expand=True,
-            spacing=8,
-            orientation="v",
-            **kwargs,
-        )
+def _scaled_image(notification: Notification, size: int) -> GdkPixbuf.Pixbuf | None:
+    if pixbuf := notification.image_pixbuf:
+        return pixbuf.scale_simple(size, size, GdkPixbuf.InterpType.BILINEAR)
+    return None
 
-        self._notification = notification
-        self._id = id
 
-        header_container = Box(
-            spacing=8, orientation="h", style_classes=["notification-header"]
+class DateMenuNotification(EventBox):
+    """A history row that is rebound to different notifications as the list scrolls."""
+
+    def __init__(self, **kwargs):
+        super().__init__(name="notification-list-item", **kwargs)
+
+        self.record: NotificationRecord | None = None
+        self._id = -1
+
+        self.icon_slot = Box()
+        self.summary_label = Label(
+            h_align="start",
+            h_expand=True,
+            ellipsization="end",
+            style_classes=["summary"],
+            name="date-menu-notification-summary",
         )
 
-        header_container.children = (
-            get_icon(notification.app_icon),
-            Label(
-                markup=helpers.parse_markup(
-                    str(
-                        self._notification.summary
-                        if self._notification.summary
-                        else notification.app_name,
-                    )
-                ),
-                h_align="start",
-                h_expand=True,
-                line_wrap="word-char",
-                style_classes=["summary"],
-                name="date-menu-notification-summary",
-            ),
+        header_container = Box(
+            spacing=8,
+            orientation="h",
+            style_classes=["notification-header"],
+            children=(self.icon_slot, self.summary_label),
         )
         close_button = Button(
             v_align="start",
@@ -88,75 +83,99 @@ class DateMenuNotification(Box):
             0,
         )
 
+        self.image = CircularImage(
+            v_align="start",
+            size=_IMAGE_SIZE,
+            visible=False,
+        )
+        self.body_label = Label(
+            v_align="start",
+            h_align="start",
+            name="date-menu-notification-body",
+            line_wrap="word-char",
+            chars_width=20,
+            max_chars_width=45,
+        )
+        # Rows share one height, so long bodies are cut short
+        self.body_label.set_lines(_BODY_LINES)
+        self.body_label.set_ellipsize(3)  # PANGO_ELLIPSIZE_END
+
         body_container = Box(
             spacing=15,
             orientation="h",
             style_classes=["notification-body"],
             v_align="start",
             h_align="start",
+            children=(self.image, self.body_label),
+        )
+
+        self.add(
+            Box(
+                name="datemenu-notification-box",
+                h_expand=True,
+                spacing=8,
+                orientation="v",
+                children=(header_container, body_container),
+            )
         )
 
-        notification_image_size = math.ceil(0.75 * constants.NOTIFICATION_IMAGE_SIZE)
+    def bind(self, record: NotificationRecord, index: int):
+        """Show ``record`` in this row, deserializing it only now."""
+        if record is self.record:
+            return
+        self.record = record
+        self._id = record.id
+
+        for child in self.icon_slot.get_children():
+            child.destroy()
+
+        notification = notification_service.get_notification(record)
+        if notification is None:
+            # Removed from the history; the list refreshes without it
+            self.summary_label.set_label("")
+            self.body_label.set_label("")
+            self.image.hide()
+            return
+
+        self.icon_slot.add(get_icon(notification.app_icon))
+        self.icon_slot.show_all()
 
-        # Try to get cached pixbuf first, fall back to deserializing
-        try:
-            cached_pixbuf = notification_service.get_cached_pixbuf(
-                self._id, notification_image_size
+        self.summary_label.set_markup(
+            helpers.parse_markup(
+                str(notification.summary or notification.app_name)
             )
-            if cached_pixbuf:
-                body_container.add(
-                    CircularImage(
-                        pixbuf=cached_pixbuf,
-                        h_expand=True,
-                        v_expand=True,
-                        size=notification_image_size,
-                    ),
-                )
-            elif image_pixbuf := self._notification.image_pixbuf:
-                scaled = image_pixbuf.scale_simple(
-                    notification_image_size,
-                    notification_image_size,
-                    GdkPixbuf.InterpType.BILINEAR,
-                )
-                if scaled:
-                    # Cache for future use
-                    notification_service.cache_pixbuf(
-                        self._id, scaled, notification_image_size
-                    )
-                    body_container.add(
-                        CircularImage(
-                            pixbuf=scaled,
-                            h_expand=True,
-                            v_expand=True,
-                            size=notification_image_size,
-                        ),
-                    )
-                del image_pixbuf
-        except GLib.GError:
-            # If the image is not available, use the symbolic icon
-            logger.warning(f"{Colors.WARNING}[Notification] Image not available.")
-
-        body_container.add(
-            Label(
-                markup=helpers.parse_markup(self._notification.body),
-                v_align="start",
-                h_align="start",
-                name="date-menu-notification-body",
-                line_wrap="word-char",
-                chars_width=20,
-                max_chars_width=45,
-            ),
         )
+        self.body_label.set_markup(helpers.parse_markup(notification.body))
+        self._bind_image(record.id, notification)
+
+    def _bind_image(self, notification_id: int, notification: Notification):
+        self.image.clear()
+        if pixbuf := notification_service.get_cached_pixbuf(
+            notification_id, _IMAGE_SIZE
+        ):
+            self.image.set_image_from_pixbuf(pixbuf)
+            self.image.show()
+            return
 
-        # Add the header, body, and actions to the notification box
-        self.children = (
-            header_container,
-            body_container,
+        self.image.hide()
+        ImageLoader().submit(
+            ("notification-history", notification_id, _IMAGE_SIZE),
+            partial(_scaled_image, notification, _IMAGE_SIZE),
+            lambda pixbuf: self._on_image_loaded(notification_id, pixbuf),
+            owner=self,
         )
 
+    def _on_image_loaded(self, notification_id: int, pixbuf):
+        if pixbuf is None:
+            return
+        notification_service.cache_pixbuf(notification_id, pixbuf, _IMAGE_SIZE)
+        # The row may have been rebound while the image was scaling
+        if notification_id == self._id:
+            self.image.set_image_from_pixbuf(pixbuf)
+            self.image.show()
+
     def remove_notification(self, *_):
         notification_service.remove_notification(self._id)
-        self.destroy()
 
 
 class DateNotificationMenu(Box):
@@ -178,25 +197,27 @@ class DateNotificationMenu(Box):
         self.pixel_size = 13
 
         if config.get("notification", True):
-            self.all_notifications: list[Notification] = (
-                notification_service.get_deserialized()
+            # Records only; rows deserialize their notification when shown
+            self.all_notifications: list[NotificationRecord] = (
+                notification_service.get_records()
             )
+            self._refresh_id = 0
 
-            self.notifications_listbox = ListBox(
+            # Only the visible rows exist; they are rebound as the list scrolls
+            self.notifications_list = VirtualList(
                 name="notification-list",
-                orientation="v",
-                h_align="center",
+                row_factory=DateMenuNotification,
+                bind_row=DateMenuNotification.bind,
+                row_height=_ROW_HEIGHT,
                 spacing=8,
+                v_expand=True,
                 h_expand=True,
+                min_content_size=(constants.NOTIFICATION_WIDTH, -1),
+                v_scrollbar_policy="automatic",
+                h_scrollbar_policy="never",
                 visible=len(self.all_notifications) > 0,
             )
-
-            self.loaded_count = 0
-
-            self.loading = False
-            self.batch_size = 8  # how many to load per scroll
-
-            self._load_next_batch()
+            self.notifications_list.set_items(self.all_notifications)
 
             # Placeholder for when there are no notifications
             self.placeholder = Box(
@@ -264,26 +285,17 @@ class DateNotificationMenu(Box):
             False,
             0,
         )
-        self.scrolled_window = ScrolledWindow(
-            v_expand=True,
-            style_classes=["notification-scrollable"],
-            v_scrollbar_policy="automatic",
-            h_scrollbar_policy="never",
-            child=Box(children=(self.placeholder, self.notifications_listbox)),
-        )
-
-        # Attach scroll listener
-        if self.scrolled_window:
-            vadj = self.scrolled_window.get_vadjustment()
-            vadj.connect("value-changed", self.on_scroll)
-
         # Notification body column
         notification_column = Box(
             name="notification-column",
             orientation="v",
             children=(
                 notification_column_header,
-                self.scrolled_window,
+                Box(
+                    v_expand=True,
+                    style_classes=["notification-scrollable"],
+                    children=(self.placeholder, self.notifications_list),
+                ),
             ),
         )
         self.add(notification_column)
@@ -320,8 +332,7 @@ class DateNotificationMenu(Box):
         bulk_connect(
             notification_service,
             {
-                "notification-added": self.on_new_notification,
-                "notification-closed": self.on_notification_closed,
+                "notification_count": self.on_notification_count,
                 "clear_all": self.on_clear_all_notifications,
                 "dnd": self.on_dnd_switch,
             },
@@ -332,37 +343,26 @@ class DateNotificationMenu(Box):
 
     def _handle_clear_click(self, *_):
         """Handle clear button click."""
-
-        self.notifications_listbox.remove_all()
-
         notification_service.clear_all_notifications()
-        self.clear_icon.set_label(text_icons["trash"]["empty"])
 
-    def _load_next_batch(self):
-        """Load the next batch of notifications into the listbox."""
-        if self.loading or self.loaded_count >= len(self.all_notifications):
-            return
+    def on_notification_count(self, *_):
+        # Additions, removals and limits all change the count; refresh once
+        if not self._refresh_id:
+            self._refresh_id = GLib.idle_add(self._refresh_notifications)
 
-        self.loading = True
+    def _refresh_notifications(self):
+        """Rebind the list to the stored records, keeping the scroll position."""
+        self._refresh_id = 0
+        self.all_notifications = notification_service.get_records()
+        self.notifications_list.set_items(self.all_notifications, reset_scroll=False)
 
-        items_to_add = min(
-            self.batch_size, len(self.all_notifications) - self.loaded_count
+        has_notifications = len(self.all_notifications) > 0
+        self.placeholder.set_visible(not has_notifications)
+        self.notifications_list.set_visible(has_notifications)
+        self.clear_icon.set_label(
+            text_icons["trash"]["full" if has_notifications else "empty"]
         )
-        for i in range(self.loaded_count, self.loaded_count + items_to_add):
-            notification_item = self._bake_notification(self.all_notifications[i])
-            self.notifications_listbox.add(notification_item)
-
-        self.loaded_count += items_to_add
-        self.loading = False
-
-    def on_scroll(self, adjustment: Gtk.Adjustment):
-        """Load more notifications when user scrolls near the bottom."""
-        value = adjustment.get_value()
-        upper = adjustment.get_upper()
-        page_size = adjustment.get_page_size()
-
-        if value + page_size >= upper - 50:
-            self._load_next_batch()
+        return False
 
     def on_dnd_switch_toggled(self, switch: Gtk.Switch, state):
         notification_service.dont_disturb = switch.get_active()
@@ -374,60 +374,7 @@ class DateNotificationMenu(Box):
         """Handle clearing all notifications."""
         self.clear_icon.set_label(text_icons["trash"]["empty"])
         self.placeholder.set_visible(True)
-        self.notifications_listbox.set_visible(False)
-
-    def on_child_destroyed(self, widget, row: Gtk.ListBoxRow):
-        row.destroy()
-
-    def _bake_notification(self, notification):
-        """Create a notification widget from a Notification object."""
-
-        item = DateMenuNotification(
-            notification=notification,
-            id=notification["id"],
-        )
-
-        row = Gtk.ListBoxRow(visible=True, name="notification-list-item", child=item)
-        item.connect("destroy", self.on_child_destroyed, row)
-
-        return row
-
-    def on_notification_closed(self, _, id, reason):
-        """Handle notification being closed."""
-
-        for row in self.notifications_listbox.get_children():
-            item = row.get_child()  # unwrap the ListBoxRow to get the actual widget
-            if isinstance(item, DateMenuNotification) and item._id == id:
-                if reason in {"dismissed-by-user", "dismissed-by-limit"}:
-                    self._remove_notification(row)
-                break
-
-    def _remove_notification(self, widget):
-        self.notifications_listbox.remove(widget)
-        widget.destroy()  # Ensure the object is freed
-
-        return False
-
-    def on_new_notification(self, fabric_notification, id):
-        if notification_service.dont_disturb:
-            return
-
-        fabric_notification: Notification = (
-            fabric_notification.get_notification_from_id(id)
-        )
-
-        self.clear_icon.set_label(
-            text_icons["trash"]["full"],
-        )
-
-        notification_item = self._bake_notification(
-            fabric_notification,
-        )
-
-        self.notifications_listbox.insert(notification_item, 0)
-
-        self.placeholder.set_visible(False)
-        self.notifications_listbox.set_visible(True)
+        self.notifications_list.set_visible(False)
 
 
 class DateTimeWidget(ButtonWidget, PopoverMixin):
@@ -1,7 +1,6 @@
 import os
 
-import ijson
-from fabric.utils import logger, remove_handler
+from fabric.utils import logger
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
 from fabric.widgets.entry import Entry
@@ -11,10 +10,27 @@ from gi.repository import Gdk, Gio, GLib
 
 from shared.mixins import PopoverMixin
 from shared.widget_container import ButtonWidget
-from utils.constants import ASSETS_DIR
-from utils.thread import run_in_thread
+from utils.constants import ASSETS_DIR, EMOJI_INDEX_FILE, EMOJI_RECENT_FILE
+from utils.emoji_index import EmojiIndex, ensure_emoji_index
+from utils.functions import read_json_file, write_json_file
+from utils.thread import run_in_thread, thread_serial
 from utils.widget_utils import nerd_font_icon
 
+# Recently used emojis remembered for ranking
+_RECENT_LIMIT = 32
+
+
+def _open_emoji_index() -> EmojiIndex:
+    """Open the prebuilt index if current, else compile one into the cache."""
+    source = f"{ASSETS_DIR}/emoji.json"
+    prebuilt = f"{ASSETS_DIR}/emoji.bin"
+    try:
+        if os.path.getmtime(prebuilt) >= os.path.getmtime(source):
+            return EmojiIndex(prebuilt)
+    except (OSError, ValueError):
+        pass
+    return EmojiIndex(ensure_emoji_index(source, EMOJI_INDEX_FILE))
+
 
 class EmojiPickerMenu(Box):
     """A widget to display an emoji picker."""
@@ -30,24 +46,56 @@ class EmojiPickerMenu(Box):
         self._parent = parent
 
         self.selected_index = -1
-        self.emojis_per_page = config.get("per_row", 5) * config.get("per_column", 5)
+        self.columns = config.get("per_row", 9)
+        self.rows = config.get("per_column", 4)
+        self.emojis_per_page = self.columns * self.rows
         self.current_page_index = 0
         self.filtered_emojis = []
         self.total_pages = 0
 
-        self._arranger_handler: int = 0
-        self._all_emojis = None  # Lazy loaded
+        self._emoji_index: EmojiIndex | None = None  # Lazy loaded
         self._emoji_loading = False  # Loading state flag
         self._pending_query = None  # Query to execute after loading
-        self._emoji_file_path = f"{ASSETS_DIR}/emoji.json"
+        self._recent: list[str] = []
 
         self.stack = Stack(
             name="viewport",
             spacing=4,
             orientation="v",
-            transition_type="slide-up-down",
+            transition_type="crossfade",
             transition_duration=200,
         )
+
+        # One fixed grid of slots, rebound on every page or query change
+        self._slots: list[Button] = []
+        self._slot_labels: list[Label] = []
+        self._slot_chars: list[str] = []
+        self._page_size = 0
+
+        grid_box = Box(name="emoji-grid-box", orientation="v", spacing=2)
+        for _ in range(self.rows):
+            row_box = Box(name="emoji-row-box", orientation="h", spacing=2)
+            for _ in range(self.columns):
+                slot = self._bake_emoji_slot(len(self._slots))
+                row_box.add(slot)
+            grid_box.add(row_box)
+
+        self.stack.add_named(
+            Box(name="page-box", orientation="v", spacing=4, children=[grid_box]),
+            "page",
+        )
+        self.stack.add_named(
+            Box(
+                name="loading-box",
+                orientation="v",
+                h_align="center",
+                v_align="center",
+                children=[
+                    Label(label="Loading emojis...", style_classes=["dim-label"]),
+                ],
+            ),
+            "loading",
+        )
         self.search_entry = Entry(
             name="search-entry",
             placeholder="Search Emojis...",
@@ -71,16 +119,14 @@ class EmojiPickerMenu(Box):
             ],
         )
 
-        self.resize_viewport()
-
         self.add(self.picker_box)
 
     def _load_emoji_data_async(self, callback=None):
-        """Load emoji data in background thread."""
+        """Open the emoji index in background thread, compiling it if needed."""
         if self._emoji_loading:
             return
 
-        if self._all_emojis is not None:
+        if self._emoji_index is not None:
             if callback:
                 callback()
             return
@@ -90,30 +136,23 @@ class EmojiPickerMenu(Box):
         @run_in_thread
         def _load():
             try:
-                if not os.path.exists(self._emoji_file_path):
-                    logger.exception(
-                        f"Emoji JSON file not found: {self._emoji_file_path}"
-                    )
-                    GLib.idle_add(self._on_emoji_load_complete, {}, callback)
-                    return
-
-                # Use ijson for streaming JSON parsing
-                with open(self._emoji_file_path, "r") as f:
-                    emoji_dict = {
-                        emoji_char: emoji_info
-                        for emoji_char, emoji_info in ijson.kvitems(f, "")
-                    }
-
-                GLib.idle_add(self._on_emoji_load_complete, emoji_dict, callback)
+                emoji_index = _open_emoji_index()
+                recent = []
+                if os.path.exists(EMOJI_RECENT_FILE):
+                    recent = read_json_file(EMOJI_RECENT_FILE) or []
+                GLib.idle_add(
+                    self._on_emoji_load_complete, emoji_index, recent, callback
+                )
             except Exception as e:
                 logger.exception(f"Error loading emoji data: {e}")
-                GLib.idle_add(self._on_emoji_load_complete, {}, callback)
+                GLib.idle_add(self._on_emoji_load_complete, None, [], callback)
 
         _load()
 
-    def _on_emoji_load_complete(self, emoji_dict, callback):
+    def _on_emoji_load_complete(self, emoji_index, recent, callback):
         """Called on main thread when emoji loading completes."""
-        self._all_emojis = emoji_dict
+        self._emoji_index = emoji_index
+        self._recent = recent
         self._emoji_loading = False
 
         # Execute pending query if any
@@ -126,15 +165,22 @@ class EmojiPickerMenu(Box):
 
         return False
 
+    def _remember_emoji(self, emoji_char: str):
+        """Move ``emoji_char`` to the front of the recently used list."""
+        others = [char for char in self._recent if char != emoji_char]
+        self._recent = [emoji_char, *others[: _RECENT_LIMIT - 1]]
+        # Written in order off the main loop; the list is replaced, not mutated
+        thread_serial(write_json_file, EMOJI_RECENT_FILE, self._recent)
+
     def close_picker(self):
-        self.selected_index = -1
+        self.update_selection(-1)
         self.search_entry.set_text("")
         self.current_page_index = 0
         self._parent.popup.hide_popover()
 
     def arrange_viewport(self, query: str = ""):
         """Arrange viewport - loads emoji data async if needed."""
-        if self._all_emojis is None:
+        if self._emoji_index is None:
             # Show loading indicator and load in background
             self._pending_query = query
             self._show_loading()
@@ -145,32 +191,18 @@ class EmojiPickerMenu(Box):
 
     def _show_loading(self):
         """Show a loading indicator while emoji data loads."""
-        self.stack.children = []
-        loading_box = Box(
-            name="loading-box",
-            orientation="v",
-            h_align="center",
-            v_align="center",
-            children=[
-                Label(label="Loading emojis...", style_classes=["dim-label"]),
-            ],
-        )
-        self.stack.add(loading_box)
+        self.stack.set_visible_child_name("loading")
 
     def _do_arrange_viewport(self, query: str = ""):
-        remove_handler(self._arranger_handler) if self._arranger_handler else None
-        self.stack.children = []
-        self.selected_index = -1
+        self.stack.set_visible_child_name("page")
+        self.update_selection(-1)
         self.current_page_index = 0
 
-        self.filtered_emojis = [
-            (emoji_char, emoji_info)
-            for emoji_char, emoji_info in self._all_emojis.items()
-            if query.casefold()
-            in (
-                emoji_info.get("name", "") + " " + emoji_info.get("group", "")
-            ).casefold()
-        ]
+        self.filtered_emojis = (
+            self._emoji_index.search(query, self._recent)
+            if self._emoji_index is not None
+            else []
+        )
         self.total_pages = (
             (len(self.filtered_emojis) + self.emojis_per_page - 1)
             // self.emojis_per_page
@@ -180,105 +212,73 @@ class EmojiPickerMenu(Box):
 
         self._load_page(self.current_page_index)
 
-        should_resize = not query
-
-        if should_resize:
-            self.resize_viewport()
-        if query.strip() != "" and self._get_all_emoji_buttons():
+        if query.strip() != "" and self._page_size:
             self.update_selection(0)
 
     def _load_page(self, page_index: int):
+        """Rebind the slot grid to the emojis of ``page_index``."""
         self.update_selection(-1)
-        page_box = Box(name=f"page-box-{page_index}", orientation="v", spacing=4)
         start_index = page_index * self.emojis_per_page
-        end_index = min(
-            (page_index + 1) * self.emojis_per_page, len(self.filtered_emojis)
-        )
-        page_emojis = self.filtered_emojis[start_index:end_index]
-
-        grid_box = Box(name="emoji-grid-box", orientation="v", spacing=2)
-
-        row_box = None
-        for i, (emoji_char, emoji_info) in enumerate(page_emojis):
-            if i % 9 == 0:
-                row_box = Box(name="emoji-row-box", orientation="h", spacing=2)
-                grid_box.add(row_box)
-            if row_box is not None:
-                row_box.add(self._bake_emoji_slot(emoji_char, emoji_info))
-        page_box.add(grid_box)
-        self.stack.add_named(page_box, f"page-{page_index}")
-        self.stack.set_visible_child_name(f"page-{page_index}")
-
-        buttons = self._get_all_emoji_buttons()
-        if buttons and self.selected_index != -1:
-            page_relative_index = self.selected_index % self.emojis_per_page
-            if page_relative_index < len(buttons):
-                self.update_selection(page_relative_index)
+        page_emojis = self.filtered_emojis[
+            start_index : start_index + self.emojis_per_page
+        ]
+        self._page_size = len(page_emojis)
+
+        for slot_index, slot in enumerate(self._slots):
+            if slot_index < self._page_size:
+                emoji_id = page_emojis[slot_index]
+                emoji_char = self._emoji_index.char(emoji_id)
+                self._slot_chars[slot_index] = emoji_char
+                self._slot_labels[slot_index].set_label(emoji_char)
+                slot.set_tooltip_text(self._emoji_index.name(emoji_id) or "Unknown")
+                slot.set_child_visible(True)
             else:
-                self.update_selection(len(buttons) - 1)
-
-    def resize_viewport(self):
-        return False
-
-    def _bake_emoji_slot(self, emoji_char: str, emoji_info: dict, **kwargs) -> Button:
+                # Keep the grid size stable on a short last page
+                self._slot_chars[slot_index] = ""
+                slot.set_child_visible(False)
+
+    def _bake_emoji_slot(self, slot_index: int) -> Button:
+        label = Label(
+            name="emoji-char-label",
+            use_markup=True,
+            v_align="center",
+            h_align="center",
+            css_name="emoji-char-label",
+        )
         # Label can be child directly - no need for wrapper Box
         button = Button(
             name="emoji-slot-button",
-            child=Label(
-                name="emoji-char-label",
-                label=emoji_char,
-                use_markup=True,
-                v_align="center",
-                h_align="center",
-                css_name="emoji-char-label",
-            ),
-            tooltip_text=emoji_info.get("name", "Unknown"),
-            on_clicked=lambda *_: (
-                self._copy_emoji_to_clipboard(emoji_char),
-                self.close_picker(),
-            ),
-            **kwargs,
+            child=label,
+            on_clicked=lambda *_: self._activate_slot(slot_index),
         )
+        self._slots.append(button)
+        self._slot_labels.append(label)
+        self._slot_chars.append("")
         return button
 
-    def update_selection(self, new_index: int):
-        buttons = self._get_all_emoji_buttons()
-        if not buttons:
-            self.selected_index = -1
+    def _activate_slot(self, slot_index: int):
+        if slot_index >= self._page_size:
             return
+        self._copy_emoji_to_clipboard(self._slot_chars[slot_index])
+        self.close_picker()
 
-        if self.selected_index != -1 and self.selected_index < len(buttons):
-            current_button = buttons[self.selected_index]
-            current_button.get_style_context().remove_class("selected")
-            if not buttons or current_button not in buttons:
-                self.selected_index = -1
+    def update_selection(self, new_index: int):
+        if 0 <= self.selected_index < len(self._slots):
+            self._slots[self.selected_index].get_style_context().remove_class(
+                "selected"
+            )
 
-        if 0 <= new_index < len(buttons):
-            new_button = buttons[new_index]
-            new_button.get_style_context().add_class("selected")
+        if 0 <= new_index < self._page_size:
+            self._slots[new_index].get_style_context().add_class("selected")
             self.selected_index = new_index
         else:
             self.selected_index = -1
 
-    def _get_all_emoji_buttons(self):
-        buttons = []
-        current_page = self.stack.get_visible_child()
-        if (
-            current_page
-            and current_page.get_children()
-            and current_page.get_children()[0].get_children()
-        ):
-            for row_box in current_page.get_children()[0].get_children():
-                buttons.extend(row_box.get_children())
-        return buttons
-
     def on_search_entry_activate(self, text):
-        buttons = self._get_all_emoji_buttons()
-        if buttons:
-            if self.selected_index != -1:
-                buttons[self.selected_index].clicked()
-            elif buttons and text.strip() != "":
-                buttons[0].clicked()
+        if self.selected_index != -1:
+            self._activate_slot(self.selected_index)
+        elif text.strip() != "":
+            self._activate_slot(0)
 
     def on_search_entry_key_press(self, widget, event):
         if event.keyval in (Gdk.KEY_Up, Gdk.KEY_Down, Gdk.KEY_Left, Gdk.KEY_Right):
@@ -290,13 +290,12 @@ class EmojiPickerMenu(Box):
         return False
 
     def _move_selection_2d(self, keyval):
-        buttons = self._get_all_emoji_buttons()
-        total_items_current_page = len(buttons)
+        total_items_current_page = self._page_size
         if total_items_current_page == 0:
             return
 
-        rows = 3
-        columns = 9
+        rows = self.rows
+        columns = self.columns
 
         if self.selected_index == -1:
             if keyval in (Gdk.KEY_Down, Gdk.KEY_Right):
@@ -331,33 +330,21 @@ class EmojiPickerMenu(Box):
 
             if new_row >= rows:
                 if self.current_page_index < self.total_pages - 1:
-                    current_col = col  # Keep track of current column
                     self.current_page_index += 1
                     self._load_page(self.current_page_index)
-                    new_index = current_col  # Try to keep the same column
-                    if (
-                        new_index >= total_items_current_page
-                    ):  # if column is out of bound, select last
-                        new_index = total_items_current_page - 1
-                    self.selected_index = -1
-                    self.update_selection(new_index)
+                    # Try to keep the same column, else select the last
+                    self.update_selection(min(col, self._page_size - 1))
                     return
                 else:
                     new_index = total_items_current_page - 1
             elif new_row < 0:
                 if self.current_page_index > 0:
-                    current_col = col  # Keep track of current column
                     self.current_page_index -= 1
                     self._load_page(self.current_page_index)
-                    new_index = (
-                        rows - 1
-                    ) * columns + current_col  # Select last row, same column
-                    if (
-                        new_index >= total_items_current_page
-                    ):  # if column is out of bound, select last
-                        new_index = total_items_current_page - 1
-                    self.selected_index = -1
-                    self.update_selection(new_index)
+                    # Select last row, same column
+                    self.update_selection(
+                        min((rows - 1) * columns + col, self._page_size - 1)
+                    )
                     return
                 else:
                     new_index = 0
@@ -375,6 +362,7 @@ class EmojiPickerMenu(Box):
 
     def _copy_emoji_to_clipboard(self, emoji_char: str):
         """Copy emoji to clipboard asynchronously."""
+        self._remember_emoji(emoji_char)
         try:
             launcher = Gio.SubprocessLauncher.new(Gio.SubprocessFlags.STDIN_PIPE)
             proc = launcher.spawnv(["wl-copy"])
@@ -13,6 +13,9 @@ from utils.colors import Colors
 # Pre-compiled regex for newline replacement
 _NEWLINE_RE = re.compile(r"\r?\n")
 
+# Properties the bar label and cover are rendered from
+_LABEL_PROPERTIES = frozenset(("metadata", "title", "arturl"))
+
 
 class MprisWidget(ButtonWidget, PopoverMixin):
     """A widget to control the MPRIS."""
@@ -27,6 +30,16 @@ class MprisWidget(ButtonWidget, PopoverMixin):
         self.cover = Box(style_classes=["cover"])
         self.container_box.children = [self.cover, self.label]
 
+        self.config = {
+            "enabled": True,
+            "ignore": ["vlc"],
+            "truncation_size": 30,
+            "show_album": True,
+            "show_artist": True,
+            "show_time": True,
+            "show_time_tooltip": True,
+        }
+
         # Services
         self.mpris_manager = MprisPlayerManager()
 
@@ -36,19 +49,11 @@ class MprisWidget(ButtonWidget, PopoverMixin):
                 f"{player.get_property('player-name')}",
             )
             self.player = MprisPlayer(player)
+            # One re-render per batch of property updates
+            self.player.connect("changed", self._on_player_changed)
             self.get_current()
             break
 
-        self.config = {
-            "enabled": True,
-            "ignore": ["vlc"],
-            "truncation_size": 30,
-            "show_album": True,
-            "show_artist": True,
-            "show_time": True,
-            "show_time_tooltip": True,
-        }
-
         self.setup_popover(
             lambda: Box(
                 style_classes=["mpris-box"],
@@ -56,6 +61,10 @@ class MprisWidget(ButtonWidget, PopoverMixin):
             )
         )
 
+    def _on_player_changed(self, _player, names):
+        if names & _LABEL_PROPERTIES:
+            self.get_current()
+
     def get_current(self):
         bar_label = _NEWLINE_RE.sub(" ", self.player.title)
 
@@ -67,7 +76,7 @@ class MprisWidget(ButtonWidget, PopoverMixin):
 
         self.label.set_label(truncated_info)
 
-        art_url = self.player.metadata["mpris:artUrl"]
+        art_url = self.player.arturl
 
         if art_url == "" or art_url is None:
             art_url = "https://ladydanville.wordpress.com/wp-content/uploads/2012/03/blankart.png?w=297&h=278"
@@ -5,6 +5,7 @@ from fabric.widgets.label import Label
 
 import utils.functions as helpers
 from services.networkspeed import NetworkSpeed
+from services.widget_model import WidgetModel
 from shared.mixins import StatDisplayMixin
 from shared.widget_container import ButtonWidget
 from utils.icons import text_icons
@@ -261,6 +262,61 @@ class StorageWidget(ButtonWidget, StatDisplayMixin):
         return f"{self.get_used()}/{self.get_total()}"
 
 
+class NetworkUsageModel(WidgetModel):
+    """Samples and formats network speed once for every bar."""
+
+    def __init__(self, config: dict, **kwargs):
+        super().__init__(**kwargs)
+        self.config = config
+        self.client = NetworkSpeed()
+        self._handler_id = None
+
+        # Thresholds (in bytes/ms)
+        self.download_threshold = config.get("download_threshold", 0)
+        self.upload_threshold = config.get("upload_threshold", 0)
+
+        # Number of digits for formatting
+        self.kb_digits = config.get("kb_digits", 0)
+        self.mb_digits = config.get("mb_digits", 2)
+
+    def start(self):
+        # Sample at the stats fabricator's interval
+        self._handler_id = util_fabricator.connect("changed", self._sample)
+
+    def stop(self):
+        if self._handler_id is not None:
+            util_fabricator.disconnect(self._handler_id)
+            self._handler_id = None
+
+    def format_speed(self, speed: int):
+        # speed is in bytes/ms, so *1000 = bytes/s
+        speed_bps = speed * 1000
+        if speed_bps < 1024:
+            return f"{speed_bps:.0f} B/s"
+        elif speed_bps < 1024 * 1024:
+            return f"{speed_bps / 1024:.{self.kb_digits}f} KB/s"
+        else:
+            return f"{speed_bps / (1024 * 1024):.{self.mb_digits}f} MB/s"
+
+    def _sample(self, *_):
+        network_speed = self.client.get_network_speed()
+
+        download_speed = network_speed.get("download", 0)
+        upload_speed = network_speed.get("upload", 0)
+        download_text = self.format_speed(download_speed)
+        upload_text = self.format_speed(upload_speed)
+
+        self.update(
+            {
+                "upload": upload_text if upload_speed >= self.upload_threshold else "",
+                "download": download_text
+                if download_speed >= self.download_threshold
+                else "",
+                "tooltip": f"Download: {download_text}\nUpload: {upload_text}",
+            }
+        )
+
+
 class NetworkUsageWidget(ButtonWidget):
     """A widget to display the current network usage."""
 
@@ -275,13 +331,6 @@ class NetworkUsageWidget(ButtonWidget):
 
         show_download = self.config.get("download", True)
         show_upload = self.config.get("upload", False)
-        # Thresholds (in bytes/ms)
-        self.download_threshold = self.config.get("download_threshold", 0)
-        self.upload_threshold = self.config.get("upload_threshold", 0)
-
-        # Number of digits for formatting
-        self.kb_digits = self.config.get("kb_digits", 0)
-        self.mb_digits = self.config.get("mb_digits", 2)
 
         self.upload_icon = nerd_font_icon(
             icon=self.config.get("upload_icon", "󰕸"),
@@ -315,44 +364,13 @@ class NetworkUsageWidget(ButtonWidget):
             self.download_label,
         )
 
-        self.client = NetworkSpeed()
-
-        # Set up a fabricator to call the update_label method at specified intervals
-        util_fabricator.connect("changed", self._update_ui)
+        # One sampler per config, shared by the same widget on every monitor
+        NetworkUsageModel.get(config=self.config).bind(self, self._update_ui)
 
-    def format_speed(self, speed: int):
-        # speed is in bytes/ms, so *1000 = bytes/s
-        speed_bps = speed * 1000
-        if speed_bps < 1024:
-            return f"{speed_bps:.0f} B/s"
-        elif speed_bps < 1024 * 1024:
-            return f"{speed_bps / 1024:.{self.kb_digits}f} KB/s"
-        else:
-            return f"{speed_bps / (1024 * 1024):.{self.mb_digits}f} MB/s"
-
-    def _update_ui(self, *_):
+    def _update_ui(self, value: dict):
         """Update the network usage label with the current network usage."""
-
-        network_speed = self.client.get_network_speed()
-
-        download_speed = network_speed.get("download", 0)
-        upload_speed = network_speed.get("upload", 0)
-
-        if upload_speed >= self.upload_threshold:
-            self.upload_label.set_label(self.format_speed(upload_speed))
-        else:
-            self.upload_label.set_label("")
-
-        if download_speed >= self.download_threshold:
-            self.download_label.set_label(self.format_speed(download_speed))
-        else:
-            self.download_label.set_label("")
+        self.upload_label.set_label(value["upload"])
+        self.download_label.set_label(value["download"])
 
         if self.config.get("tooltip", False):
-            tooltip_text = (
-                f"Download: {self.format_speed(download_speed)}\n"
-                f"Upload: {self.format_speed(upload_speed)}"
-            )
-            self.set_tooltip_text(tooltip_text)
-
-        return True
+            self.set_tooltip_text(value["tooltip"])
@@ -1,5 +1,3 @@
-import os
-
 import gi
 from fabric.system_tray.service import SystemTray as SystemTrayService
 from fabric.system_tray.service import SystemTrayItem as SystemTrayItemService
@@ -10,10 +8,11 @@ from fabric.utils import (
 from fabric.widgets.box import Box
 from fabric.widgets.grid import Grid
 from fabric.widgets.image import Image
-from gi.repository import Gdk, GdkPixbuf, GLib, Gtk
+from gi.repository import Gdk, GLib, Gtk
 
 from shared.buttons import HoverButton
 from shared.widget_container import ButtonWidget
+from utils.icon_cache import IconCache
 from utils.icons import text_icons
 from utils.widget_utils import nerd_font_icon
 
@@ -39,53 +38,33 @@ class BaseSystemTray:
     def resolve_icon(self, item: SystemTrayItemService, icon_size: int = 16):
         pixmap = item.icon_pixmap
 
-        try:
-            if pixmap is not None:
+        if pixmap is not None:
+            try:
                 return pixmap.as_pixbuf(icon_size, "bilinear")
-            else:
-                icon_name = item.icon_name
-                icon_theme = item.icon_theme
+            except GLib.Error:
+                return IconCache().get_icon("image-missing", icon_size)
+
+        icon_name = item.icon_name
+        icon_theme = item.icon_theme
 
-                logger.info(
-                    f"""[SystemTray] Resolving icon: {icon_name}, size: {icon_size},
-                    theme path: {icon_theme}"""
+        logger.info(
+            f"""[SystemTray] Resolving icon: {icon_name}, size: {icon_size},
+            theme path: {icon_theme}"""
+        )
+
+        # Items shipping their own theme path are not shared, skip the cache
+        if icon_theme:
+            try:
+                return icon_theme.load_icon(
+                    icon_name,
+                    icon_size,
+                    Gtk.IconLookupFlags.FORCE_SIZE,
                 )
+            except GLib.Error:
+                pass
 
-                # Use custom theme path if available
-                if icon_theme:
-                    try:
-                        return icon_theme.load_icon(
-                            icon_name,
-                            icon_size,
-                            Gtk.IconLookupFlags.FORCE_SIZE,
-                        )
-                    except GLib.Error:
-                        # Fallback to default theme if custom path fails
-                        return Gtk.IconTheme.get_default().load_icon(
-                            icon_name,
-                            icon_size,
-                            Gtk.IconLookupFlags.FORCE_SIZE,
-                        )
-                else:
-                    if os.path.exists(
-                        icon_name
-                    ):  # for some apps, the icon_name is a path
-                        return GdkPixbuf.Pixbuf.new_from_file_at_size(
-                            icon_name, width=icon_size, height=icon_size
-                        )
-                    else:
-                        return Gtk.IconTheme.get_default().load_icon(
-                            icon_name,
-                            icon_size,
-                            Gtk.IconLookupFlags.FORCE_SIZE,
-                        )
-        except GLib.Error:
-            # Fallback to 'image-missing' icon
-            return Gtk.IconTheme.get_default().load_icon(
-                "image-missing",
-                icon_size,
-                Gtk.IconLookupFlags.FORCE_SIZE,
-            )
+        # For some apps, the icon_name is a path; the cache handles both
+        return IconCache().lookup((icon_name, "image-missing"), icon_size)
 
     def _bake_item_button(self, item: SystemTrayItemService) -> HoverButton:
         button = HoverButton(
@@ -1,4 +1,7 @@
+# ruff: noqa: E402
 import gi
+
+# Glace must be pinned before it is first imported
 gi.require_versions({"Gtk": "3.0", "GdkPixbuf": "2.0", "Glace": "0.1"})
 
 from fabric.utils import bulk_connect
@@ -6,11 +9,58 @@ from fabric.widgets.button import Button
 from fabric.widgets.image import Image
 from gi.repository import GdkPixbuf, Glace
 
+from services.widget_model import WidgetModel
 from services.window_manager import WindowManagerService
 from shared.widget_container import BoxWidget
 from utils.icon_resolver import IconResolver
 
 
+class TaskBarModel(WidgetModel):
+    """Lists X11 windows with their scaled icons, once for every bar."""
+
+    def __init__(self, icon_size: int, **kwargs):
+        super().__init__(**kwargs)
+        self.icon_size = icon_size
+        self.icon_resolver = IconResolver()
+        self.window_manager = WindowManagerService()
+        self._handler_id = None
+
+    def start(self):
+        self._handler_id = self.window_manager.connect(
+            "windows-changed", self.refresh
+        )
+        self.refresh()
+
+    def stop(self):
+        if self._handler_id is not None:
+            self.window_manager.disconnect(self._handler_id)
+            self._handler_id = None
+
+    def refresh(self, *_):
+        windows = []
+
+        for window in self.window_manager.get_windows():
+            icon_pixbuf = window.get("icon")
+            if icon_pixbuf:
+                try:
+                    icon_pixbuf = icon_pixbuf.scale_simple(
+                        self.icon_size,
+                        self.icon_size,
+                        GdkPixbuf.InterpType.BILINEAR,
+                    )
+                except Exception:
+                    # Scale failure should not break rendering.
+                    pass
+            else:
+                icon_pixbuf = self.icon_resolver.get_icon_pixbuf(
+                    window.get("app_id", "x11"), self.icon_size
+                )
+            # The service's window dicts are shared with other consumers
+            windows.append({**window, "icon": icon_pixbuf})
+
+        self.update(windows)
+
+
 class TaskBarWidget(BoxWidget):
     """A widget to display the taskbar items."""
 
@@ -27,8 +77,9 @@ class TaskBarWidget(BoxWidget):
         if self._is_wayland:
             self._setup_wayland_taskbar()
         else:
-            self.window_manager.connect("windows-changed", self._refresh_x11_windows)
-            self._refresh_x11_windows()
+            TaskBarModel.get(icon_size=self.config.get("icon_size", 22)).bind(
+                self, self._refresh_x11_windows
+            )
 
     def on_app_id(
         self, client: Glace.Client, client_image: Image, client_button: Button, *_
@@ -70,31 +121,12 @@ class TaskBarWidget(BoxWidget):
         self._manager = Glace.Manager()
         self._manager.connect("client-added", self.on_client_added)
 
-    def _refresh_x11_windows(self, *_):
+    def _refresh_x11_windows(self, windows: list[dict]):
         for child in list(self.get_children()):
             self.remove(child)
 
-        windows = self.window_manager.get_windows()
-        icon_size = self.config.get("icon_size", 22)
-
         for window in windows:
-            icon_pixbuf = window.get("icon")
-            if icon_pixbuf:
-                try:
-                    icon_pixbuf = icon_pixbuf.scale_simple(
-                        icon_size,
-                        icon_size,
-                        GdkPixbuf.InterpType.BILINEAR,
-                    )
-                except Exception:
-                    # Scale failure should not break rendering.
-                    pass
-            else:
-                icon_pixbuf = self.icon_resolver.get_icon_pixbuf(
-                    window.get("app_id", "x11"), icon_size
-                )
-
-            window_image = Image(pixbuf=icon_pixbuf)
+            window_image = Image(pixbuf=window.get("icon"))
             window_button = Button(
                 style_classes=["buttons-basic", "buttons-transition"],
                 image=window_image,
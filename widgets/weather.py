@@ -8,9 +8,10 @@ from fabric.widgets.grid import Grid
 from fabric.widgets.label import Label
 from fabric.widgets.revealer import Revealer
 from fabric.widgets.svg import Svg
-from gi.repository import Gtk
+from gi.repository import GLib, Gtk
 
 from services.weather import WeatherService
+from services.widget_model import WidgetModel
 from shared.widget_container import ButtonWidget
 from utils.constants import ASSETS_DIR
 from utils.functions import check_if_day
@@ -328,6 +329,52 @@ class WeatherMenu(Box, BaseWeatherWidget):
         return f"{self.weather_icons_dir}/{weather_icons[str(code)][image_name]}.svg"
 
 
+class WeatherModel(WidgetModel):
+    """Fetches weather once for every bar showing the same config."""
+
+    # Views re-derive the day/night icon from the cached data at this pace
+    ICON_REFRESH_SECONDS = 300
+
+    def __init__(self, config: dict, **kwargs):
+        super().__init__(**kwargs)
+        self.config = config
+        self.update_time = datetime.now()
+        self._source_id = None
+
+    def start(self):
+        self.fetch()
+        self._source_id = GLib.timeout_add_seconds(
+            self.ICON_REFRESH_SECONDS, self._tick
+        )
+
+    def stop(self):
+        if self._source_id is not None:
+            GLib.source_remove(self._source_id)
+            self._source_id = None
+
+    def _tick(self):
+        elapsed = (datetime.now() - self.update_time).total_seconds()
+        if elapsed >= self.config.get("interval", 3600):
+            self.fetch()
+        elif self.has_value:
+            self.update(self.value)
+        return True
+
+    def fetch(self):
+        weather_service = WeatherService()
+        weather_service.set_provider(self.config.get("provider", "open-meteo"))
+        weather_service.get_weather_async(
+            location=self.config.get("location", ""),
+            ttl=self.config.get("interval", 3600),
+            callback=self._on_weather,
+        )
+
+    def _on_weather(self, data):
+        self.update_time = datetime.now()
+        self.update(data)
+        return False
+
+
 class WeatherWidget(ButtonWidget, BaseWeatherWidget):
     """A widget to display the current weather."""
 
@@ -353,8 +400,6 @@ class WeatherWidget(ButtonWidget, BaseWeatherWidget):
 
         self.connect("button-press-event", self.on_button_press)
 
-        self.update_time = datetime.now()
-
         if self.config.get("label", True):
             self.weather_label = Label(
                 label="Fetching..",
@@ -371,13 +416,11 @@ class WeatherWidget(ButtonWidget, BaseWeatherWidget):
             else:
                 self.container_box.add(self.weather_label)
 
-        self._update_ui(forced=True)
-
-        invoke_repeater(1000, self._update_ui)
+        # One fetch loop shared by the same widget on every monitor
+        self.model = WeatherModel.get(config=self.config)
+        self.model.bind(self, self.update_data)
 
     def update_data(self, data):
-        self.update_time = datetime.now()
-
         if data is None:
             self.weather_label.set_label("")
             self.weather_icon.set_label("")
@@ -442,37 +485,4 @@ class WeatherWidget(ButtonWidget, BaseWeatherWidget):
             self.add_style_class("active")
 
         else:
-            self._update_ui(forced=True)
-
-    def _update_ui(self, *args, **kwargs):
-        forced = kwargs.get("forced", False)
-
-        # Check if the update time is more than 5 minutes ago, update the icon
-        if (
-            hasattr(self, "current_weather")
-            and (datetime.now() - self.update_time).total_seconds() > 300
-        ):
-            text_icon = (
-                weather_icons[self.current_weather["weatherCode"]]["icon"]
-                if check_if_day(
-                    sunrise_time=self.sunrise_time,
-                    sunset_time=self.sunset_time,
-                )
-                else weather_icons[self.current_weather["weatherCode"]]["icon-night"]
-            )
-
-            self.weather_icon.set_label(text_icon)
-
-        if (datetime.now() - self.update_time).total_seconds() < self.config.get(
-            "interval", 3600
-        ) and not forced:
-            # Check if the update time is more than interval seconds ago
-            return True  # Keep the repeater alive
-
-        weather_service = WeatherService()
-        weather_service.set_provider(self.config.get("provider", "open-meteo"))
-        weather_service.get_weather_async(
-            location=self.config.get("location", ""),
-            ttl=self.config.get("interval", 3600),
-            callback=self.update_data,
-        )
+            self.model.fetch()